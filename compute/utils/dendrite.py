@@ -0,0 +1,103 @@
+import asyncio
+import random
+import threading
+
+import bittensor as bt
+
+from compute.protocol import Allocate
+
+
+class DendritePool:
+    """
+    Long-lived dendrite shared by every caller of a process.
+
+    bt.dendrite.query opens and closes an aiohttp session on each call. Here a single dendrite
+    lives on a background event loop, so its session and connection pool are reused by the
+    coroutines of any event loop (forward) and by plain threads (query) alike.
+    """
+
+    def __init__(self, wallet):
+        self.wallet = wallet
+        self.dendrite = bt.dendrite(wallet=wallet)
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="th_dendrite_pool", daemon=True)
+        self._thread.start()
+
+    def run(self, coro):
+        """Run a coroutine on the pool loop and block the calling thread until it completes."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    async def forward(self, axons, synapse, timeout=12, deserialize=True):
+        """Awaitable query, usable from any event loop."""
+        future = asyncio.run_coroutine_threadsafe(
+            self.dendrite.forward(axons, synapse, timeout=timeout, deserialize=deserialize), self.loop
+        )
+        return await asyncio.wrap_future(future)
+
+    def query(self, axons, synapse, timeout=12, deserialize=True):
+        """Blocking query with the same signature as bt.dendrite.query."""
+        return self.run(self.dendrite.forward(axons, synapse, timeout=timeout, deserialize=deserialize))
+
+    async def check_allocation(self, axon, device_requirement, timeline=1, timeout=30):
+        """Return True when the miner accepts an allocation with the given requirements."""
+        response = await self.forward(
+            axon, Allocate(timeline=timeline, device_requirement=device_requirement, checking=True), timeout=timeout
+        )
+        return bool(response) and response.get("status") is True
+
+    async def allocate(self, axon, device_requirement, public_key, docker_requirement=None, timeline=1, timeout=30):
+        """
+        Allocate a miner.
+
+        :return: The miner response if the allocation succeeded, None otherwise.
+        """
+        synapse = Allocate(timeline=timeline, device_requirement=device_requirement, checking=False, public_key=public_key)
+        if docker_requirement is not None:
+            synapse.docker_requirement = docker_requirement
+        response = await self.forward(axon, synapse, timeout=timeout)
+        if response and response.get("status") is True:
+            return response
+        return None
+
+    async def deallocate(self, axon, public_key, max_retries=3, retry_delay=5, timeout=60):
+        """
+        Deallocate a miner, retrying with exponential backoff and jitter without blocking a thread.
+
+        :return: True if the miner confirmed the deallocation.
+        """
+        for attempt in range(1, max_retries + 1):
+            try:
+                response = await self.forward(
+                    axon, Allocate(timeline=0, checking=False, public_key=public_key), timeout=timeout
+                )
+                if response and response.get("status") is True:
+                    bt.logging.trace(f"Deallocated miner {axon.hotkey}")
+                    return True
+                bt.logging.trace(f"{axon.hotkey}: Failed to deallocate miner. (attempt {attempt}/{max_retries})")
+            except Exception as e:
+                bt.logging.trace(f"{axon.hotkey}: Error while trying to deallocate miner. (attempt {attempt}/{max_retries}): {e}")
+            if attempt < max_retries:
+                await asyncio.sleep(retry_delay * (2 ** (attempt - 1)) * random.uniform(0.5, 1.0))
+        bt.logging.trace(f"{axon.hotkey}: Max retries reached for deallocating miner.")
+        return False
+
+    def close(self):
+        """Close the shared session and stop the pool loop."""
+        try:
+            self.run(self.dendrite.aclose_session())
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout=5)
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_dendrite_pool(wallet) -> DendritePool:
+    """Return the process-wide DendritePool of a wallet, creating it on first use."""
+    key = wallet.hotkey.ss58_address
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = DendritePool(wallet)
+        return _pools[key]
@@ -55,6 +55,13 @@ class ComputeArgPaser(argparse.ArgumentParser):
             help="List of coldkeys to whitelist. Default: [].",
             default=[],
         )
+        self.add_argument(
+            "--rsa.key.pool.size",
+            type=int,
+            dest="rsa_key_pool_size",
+            help="Number of RSA key pairs pre-generated for the allocation handshakes of the register API. Default: 32.",
+            default=32,
+        )
         self.add_validator_argument()
         self.add_miner_argument()
 
@@ -112,6 +119,13 @@ class ComputeArgPaser(argparse.ArgumentParser):
             type=int,
             default=60,
         )
+        self.add_argument(
+            "--validator.metagraph.sync.interval",
+            dest="validator_metagraph_sync_interval",
+            help="Number of new blocks between two metagraph syncs of the validator loop. Default: 1.",
+            type=int,
+            default=1,
+        )
 
     def add_miner_argument(self):
         self.add_argument(
@@ -0,0 +1,45 @@
+import sys
+import threading
+import types
+from multiprocessing import context, popen_spawn_posix
+
+# Spawned processes re-run the __main__ module of the parent before unpickling their target, so a worker
+# of the validator would import torch, bittensor and the whole validator just to generate a key pair or
+# verify a proof. The processes of LightSpawnContext are launched with this empty module standing in for
+# __main__: it has neither a file nor a spec, so the child has nothing to re-run and only imports the
+# module of its target.
+_LIGHT_MAIN = types.ModuleType("__main__")
+_launch_lock = threading.Lock()
+
+
+class _LightMainPopen(popen_spawn_posix.Popen):
+    def _launch(self, process_obj):
+        # The preparation data sent to the child is read from sys.modules["__main__"] while launching
+        with _launch_lock:
+            main_module = sys.modules["__main__"]
+            sys.modules["__main__"] = _LIGHT_MAIN
+            try:
+                super()._launch(process_obj)
+            finally:
+                sys.modules["__main__"] = main_module
+
+
+class LightSpawnProcess(context.SpawnProcess):
+    @staticmethod
+    def _Popen(process_obj):
+        return _LightMainPopen(process_obj)
+
+
+class LightSpawnContext(context.SpawnContext):
+    """
+    Spawn start method whose processes do not re-run the parent's __main__ module.
+
+    Targets must live in importable modules; a function defined in the __main__ script cannot be run.
+    """
+
+    Process = LightSpawnProcess
+
+
+def get_spawn_context():
+    """Return the multiprocessing context to start the validator and API worker processes with."""
+    return LightSpawnContext()
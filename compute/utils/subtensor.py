@@ -15,8 +15,11 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 import datetime
+import threading
+import typing
 
 import bittensor as bt
+import numpy as np
 
 from compute.utils.cache import ttl_cache
 
@@ -40,5 +43,34 @@ def is_registered(wallet: bt.wallet, metagraph: bt.metagraph, subtensor: bt.subt
         return my_subnet_uid
 
 
+_validators_cache = {}
+_validators_cache_lock = threading.Lock()
+
+
+def get_valid_validators(metagraph: bt.metagraph, min_stake: float) -> typing.List[typing.Tuple[int, str, int]]:
+    """
+    Return (uid, hotkey, version) of every neuron staking more than min_stake.
+
+    Read from the arrays of the already synced metagraph instead of one neuron_for_uid RPC per uid,
+    and cached per metagraph block: the list is rebuilt only once the metagraph has synced a newer block.
+    """
+    block = int(metagraph.block)
+    key = (metagraph.netuid, min_stake)
+    with _validators_cache_lock:
+        cached = _validators_cache.get(key)
+        if cached is not None and cached[0] == block:
+            return list(cached[1])
+
+    uids = np.asarray(metagraph.uids)
+    positions = np.flatnonzero(np.asarray(metagraph.total_stake) > min_stake)
+    validators = [
+        (int(uids[position]), metagraph.hotkeys[position], metagraph.neurons[position].prometheus_info.version)
+        for position in positions
+    ]
+    with _validators_cache_lock:
+        _validators_cache[key] = (block, validators)
+    return list(validators)
+
+
 def calculate_next_block_time(block_origin, block_destiny) -> datetime.timedelta:
     return datetime.timedelta(seconds=(block_destiny - block_origin) * bt_blocktime)
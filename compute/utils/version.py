@@ -17,9 +17,12 @@ OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE S
 DEALINGS IN THE SOFTWARE.
 """
 import codecs
+import json
 import os
 import re
 import subprocess
+import threading
+import time
 from os import path
 
 import bittensor as bt
@@ -28,6 +31,8 @@ import requests
 import sys
 from packaging import version as packaging_version
 
+REMOTE_VERSION_URL = "https://raw.githubusercontent.com/neuralinternet/compute-subnet/main/compute/__init__.py"
+
 
 def get_remote_version_to_number(pattern: str = "__version__"):
     latest_version = version2number(get_remote_version(pattern=pattern))
@@ -46,16 +51,19 @@ def version2number(version: str):
     return None
 
 
+def parse_version_pattern(text: str, pattern: str = "__version__"):
+    for line in text.split("\n"):
+        if line.startswith(pattern):
+            return line.split("=")[1].strip(" \"'").replace('"', "")
+    return None
+
+
 def get_remote_version(pattern: str = "__version__"):
-    url = "https://raw.githubusercontent.com/neuralinternet/compute-subnet/main/compute/__init__.py"
+    url = REMOTE_VERSION_URL
     try:
         response = requests.get(url, timeout=30)
         if response.status_code == 200:
-            lines = response.text.split("\n")
-            for line in lines:
-                if line.startswith(pattern):
-                    version_info = line.split("=")[1].strip(" \"'").replace('"', "")
-                    return version_info
+            return parse_version_pattern(response.text, pattern)
         else:
             bt.logging.error(f"Failed to get file content with status code: {response.status_code}")
             return None
@@ -67,6 +75,146 @@ def get_remote_version(pattern: str = "__version__"):
         return None
 
 
+class RemoteVersionCache:
+    """
+    Cached copy of the remote compute/__init__.py serving the version policy without blocking on the network.
+
+    Versions are read from memory. Once the TTL has expired, a background thread refreshes the copy with
+    a conditional request (ETag / If-Modified-Since). The last known good copy is kept on disk, so a
+    restart or a GitHub outage keeps the previous policy. Only the very first use, without any copy on
+    disk, waits for a fetch.
+    """
+
+    def __init__(
+        self,
+        url: str = REMOTE_VERSION_URL,
+        ttl: float = 600,
+        cache_path: str = "remote_version_cache.json",
+        timeout: float = 30,
+        retry_interval: float = 60,
+    ):
+        self.url = url
+        self.ttl = ttl
+        self.cache_path = cache_path
+        self.timeout = timeout
+        self.retry_interval = retry_interval
+        self._lock = threading.Lock()
+        self._refreshing = False
+        # No new refresh is attempted before this time after a failed one
+        self._retry_at = 0.0
+        self._state = self._load()
+
+    def _load(self):
+        try:
+            with open(self.cache_path, "r") as f:
+                state = json.load(f)
+            if isinstance(state.get("text"), str):
+                return state
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            bt.logging.warning(f"Ignoring unreadable version cache {self.cache_path}: {e}")
+        return None
+
+    def _save(self, state):
+        try:
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            bt.logging.warning(f"Failed to store the version cache {self.cache_path}: {e}")
+
+    def refresh(self) -> bool:
+        """Fetch the remote file if it changed since the cached copy; return True when the copy is current."""
+        with self._lock:
+            state = self._state
+        headers = {}
+        if state:
+            if state.get("etag"):
+                headers["If-None-Match"] = state["etag"]
+            if state.get("last_modified"):
+                headers["If-Modified-Since"] = state["last_modified"]
+        try:
+            response = requests.get(self.url, headers=headers, timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            bt.logging.warning(f"Version policy refresh failed, keeping the last known versions: {e}")
+            self._retry_at = time.time() + self.retry_interval
+            return False
+
+        if response.status_code == 304 and state:
+            state = dict(state, fetched_at=time.time())
+        elif response.status_code == 200:
+            state = {
+                "text": response.text,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "fetched_at": time.time(),
+            }
+        else:
+            bt.logging.warning(f"Version policy refresh failed with status code {response.status_code}, keeping the last known versions.")
+            self._retry_at = time.time() + self.retry_interval
+            return False
+
+        with self._lock:
+            self._state = state
+        self._save(state)
+        return True
+
+    def _refresh_in_background(self):
+        try:
+            self.refresh()
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def get(self, pattern: str = "__version__"):
+        """Return the remote value of a version pattern, or None when it is unknown."""
+        now = time.time()
+        with self._lock:
+            state = self._state
+            stale = state is None or now - state.get("fetched_at", 0) >= self.ttl
+            start_refresh = stale and not self._refreshing and now >= self._retry_at
+            if start_refresh:
+                self._refreshing = True
+
+        if state is None:
+            # Nothing cached yet, in memory or on disk: fetch once in the foreground, unless a fetch is
+            # already in flight or the last one failed less than retry_interval ago
+            if not start_refresh:
+                return None
+            try:
+                self.refresh()
+            finally:
+                with self._lock:
+                    self._refreshing = False
+                    state = self._state
+            if state is None:
+                return None
+        elif start_refresh:
+            threading.Thread(target=self._refresh_in_background, name="th_version_refresh", daemon=True).start()
+
+        return parse_version_pattern(state["text"], pattern)
+
+
+_version_cache = None
+_version_cache_lock = threading.Lock()
+
+
+def get_version_cache() -> RemoteVersionCache:
+    """Return the process-wide RemoteVersionCache, created on first use."""
+    global _version_cache
+    with _version_cache_lock:
+        if _version_cache is None:
+            _version_cache = RemoteVersionCache()
+        return _version_cache
+
+
+def get_cached_remote_version(pattern: str = "__version__"):
+    """Non-blocking get_remote_version served from the version policy cache."""
+    return get_version_cache().get(pattern)
+
+
 def get_local_version():
     try:
         here = path.abspath(path.dirname(__file__))
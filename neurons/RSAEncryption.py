@@ -1,7 +1,11 @@
+import queue
+
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization, hashes
 from cryptography.hazmat.primitives.asymmetric import rsa, padding
 
+from compute.utils.spawn import get_spawn_context
+
 
 def generate_key_pair():
     private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048, backend=default_backend())
@@ -16,6 +20,79 @@ def generate_key_pair():
     return private_pem.decode("utf-8"), public_pem.decode("utf-8")
 
 
+def _fill_key_pair_queue(key_queue, stop_event):
+    while not stop_event.is_set():
+        key_pair = generate_key_pair()
+        while not stop_event.is_set():
+            try:
+                key_queue.put(key_pair, timeout=1)
+                break
+            except queue.Full:
+                continue
+
+
+class KeyPairPool:
+    """
+    Pool of fresh single-use key pairs generated ahead of time in a background process.
+
+    get() hands out a pre-generated key pair without running the key generation on the caller,
+    and only falls back to generating one inline when the pool is drained.
+    """
+
+    def __init__(self, size=32):
+        context = get_spawn_context()
+        self._queue = context.Queue(maxsize=size)
+        self._stop_event = context.Event()
+        self._process = context.Process(target=_fill_key_pair_queue, args=(self._queue, self._stop_event), daemon=True)
+        self._process.start()
+
+    def get(self):
+        """Return a (private_pem, public_pem) pair that has never been handed out."""
+        try:
+            return self._queue.get_nowait()
+        except queue.Empty:
+            return generate_key_pair()
+
+    def close(self):
+        self._stop_event.set()
+        self._process.join(timeout=5)
+        if self._process.is_alive():
+            self._process.terminate()
+
+
+_key_pair_pool = None
+
+
+def start_key_pair_pool(size=32):
+    """
+    Start the process-wide key pair pool get_key_pair() is served from.
+
+    Called once at process startup; stop_key_pair_pool() shuts it down on exit.
+
+    :param size: Number of key pairs kept ready.
+    """
+    global _key_pair_pool
+    if _key_pair_pool is None:
+        _key_pair_pool = KeyPairPool(size)
+    return _key_pair_pool
+
+
+def stop_key_pair_pool():
+    """Stop the key pair pool, get_key_pair() generates its key pairs inline afterwards."""
+    global _key_pair_pool
+    if _key_pair_pool is not None:
+        _key_pair_pool.close()
+        _key_pair_pool = None
+
+
+def get_key_pair():
+    """Drop-in replacement of generate_key_pair() served from the key pair pool once it is started."""
+    key_pair_pool = _key_pair_pool
+    if key_pair_pool is None:
+        return generate_key_pair()
+    return key_pair_pool.get()
+
+
 def encrypt_data(public_key_pem, plaintext):
     public_key = serialization.load_pem_public_key(public_key_pem, backend=default_backend())
     ciphertext = public_key.encrypt(plaintext.encode(), padding.OAEP(mgf=padding.MGF1(algorithm=hashes.SHA256()), algorithm=hashes.SHA256(), label=None))
@@ -17,6 +17,7 @@
 # DEALINGS IN THE SOFTWARE.
 # Step 1: Import necessary libraries and modules
 import bittensor as bt
+import numpy as np
 import wandb
 
 import compute
@@ -61,3 +62,41 @@ def calc_score_pog(gpu_specs, hotkey, allocated_hotkeys, config_data, mock=False
     except Exception as e:
         bt.logging.error(f"An error occurred while calculating score for the following hotkey - {hotkey}: {e}")
         return 0
+
+
+class PogScoreEngine:
+    """
+    Vectorized calc_score_pog: the per-GPU score table is built once per config load and the scores
+    of every miner are then computed with a few array operations.
+    """
+
+    # Allocation score multiplier = 1 (no allocation bonus)
+    ALLOCATION_MULTIPLIER = 1.0
+    MAX_GPUS = 8
+
+    def __init__(self, config_data):
+        gpu_scores = config_data["gpu_performance"].get("gpu_scores", {})
+        self.gpu_names = list(gpu_scores)
+        self.gpu_index = {gpu_name: index for index, gpu_name in enumerate(self.gpu_names)}
+        # Normalized score of a single GPU of each model, a full 8 x best GPU miner scores 1
+        max_score = max(gpu_scores.values()) * self.MAX_GPUS if gpu_scores else 1.0
+        self.score_table = np.array([gpu_scores[gpu_name] for gpu_name in self.gpu_names], dtype=np.float64) / max_score
+
+    def index_of(self, gpu_name):
+        """Index of a GPU model in the score table, -1 when it is not scored."""
+        return self.gpu_index.get(gpu_name, -1)
+
+    def score(self, gpu_index, num_gpus, allocated):
+        """
+        Normalized PoG scores, same values as calc_score_pog.
+
+        :param gpu_index: Array of GPU model indices from index_of, -1 for unknown models.
+        :param num_gpus: Array of GPU counts.
+        :param allocated: Boolean array of allocated miners.
+        :return: Array of scores in [0, 1].
+        """
+        gpu_index = np.asarray(gpu_index, dtype=np.int64)
+        known = gpu_index >= 0
+        scores = np.zeros(gpu_index.shape, dtype=np.float64)
+        scores[known] = self.score_table[gpu_index[known]] * np.minimum(np.asarray(num_gpus)[known], self.MAX_GPUS)
+        return np.where(allocated, scores * self.ALLOCATION_MULTIPLIER, scores)
@@ -97,9 +97,59 @@ def get_pog_specs(db: ComputeDb, hotkey):
     finally:
         cursor.close()
 
+def get_all_pog_specs(db: ComputeDb):
+    """
+    Retrieves the most recent valid GPU spec entry of every hotkey in a single query.
+
+    :return: A dictionary mapping each hotkey to a dictionary with 'gpu_name' and 'num_gpus'.
+    """
+    cursor = db.get_cursor()
+    try:
+        cursor.execute(
+            """
+            SELECT hotkey, gpu_name, num_gpus
+            FROM pog_stats
+            WHERE gpu_name IS NOT NULL AND num_gpus IS NOT NULL
+            ORDER BY created_at ASC, id ASC
+            """
+        )
+        # Newer rows overwrite older ones
+        return {hotkey: {"gpu_name": gpu_name, "num_gpus": num_gpus} for hotkey, gpu_name, num_gpus in cursor.fetchall()}
+    except Exception as e:
+        bt.logging.error(f"Error retrieving pog_stats: {e}")
+        return {}
+    finally:
+        cursor.close()
+
+def get_pog_history(db: ComputeDb):
+    """
+    Retrieves the retained PoG results of every hotkey, failed attempts included.
+
+    :return: A dictionary mapping each hotkey to a list of (gpu_name, num_gpus, created_at) tuples, newest first.
+    """
+    cursor = db.get_cursor()
+    try:
+        cursor.execute(
+            """
+            SELECT hotkey, gpu_name, num_gpus, created_at
+            FROM pog_stats
+            ORDER BY hotkey, created_at DESC, id DESC
+            """
+        )
+        history = {}
+        for hotkey, gpu_name, num_gpus, created_at in cursor.fetchall():
+            history.setdefault(hotkey, []).append((gpu_name, num_gpus, created_at))
+        return history
+    except Exception as e:
+        bt.logging.error(f"Error retrieving pog_stats history: {e}")
+        return {}
+    finally:
+        cursor.close()
+
 def write_stats(self, stats):
     cursor = self.get_cursor()
     try:
+        rows = []
         for uid, data in stats.items():
             raw_specs = data.get("gpu_specs")
 
@@ -113,19 +163,7 @@ def write_stats(self, stats):
             # Ensure 'score' is numeric if storing as REAL
             numeric_score = float(data.get("score", 0))
 
-            cursor.execute(
-                """
-                INSERT INTO stats (uid, hotkey, gpu_specs, score, allocated, own_score, reliability_score)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(uid) DO UPDATE SET
-                    hotkey=excluded.hotkey,
-                    gpu_specs=excluded.gpu_specs,
-                    score=excluded.score,
-                    allocated=excluded.allocated,
-                    own_score=excluded.own_score,
-                    reliability_score=excluded.reliability_score,
-                    created_at=CURRENT_TIMESTAMP
-                """,
+            rows.append(
                 (
                     uid,
                     data.get("hotkey"),
@@ -134,8 +172,24 @@ def write_stats(self, stats):
                     data.get("allocated"),
                     data.get("own_score"),
                     data.get("reliability_score"),
-                ),
+                )
             )
+
+        cursor.executemany(
+            """
+            INSERT INTO stats (uid, hotkey, gpu_specs, score, allocated, own_score, reliability_score)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(uid) DO UPDATE SET
+                hotkey=excluded.hotkey,
+                gpu_specs=excluded.gpu_specs,
+                score=excluded.score,
+                allocated=excluded.allocated,
+                own_score=excluded.own_score,
+                reliability_score=excluded.reliability_score,
+                created_at=CURRENT_TIMESTAMP
+            """,
+            rows,
+        )
         self.conn.commit()
     except Exception as e:
         self.conn.rollback()
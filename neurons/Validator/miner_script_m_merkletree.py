@@ -12,13 +12,25 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import argparse
 import json
 import gc
+import struct
 
 os.environ["PYTORCH_CUDA_ALLOC_CONF"] = "max_split_size_mb:512"
 
+# Binary proof response layout (little-endian), must match neurons/Validator/pog.py:
+# header (magic, version, hash size, k, n, depth) | k x 2 int64 indices | k x n float32 rows | k x depth x hash size siblings
+PROOF_RESPONSE_MAGIC = b"PoGR"
+PROOF_RESPONSE_VERSION = 1
+PROOF_RESPONSE_HEADER = struct.Struct("<4sHHIII12x")
+
+# Memory-mapped proof store for C and the Merkle tree: header (magic, version, dtype char, rows, cols) | raw row-major data
+PROOF_STORE_MAGIC = b"PoGS"
+PROOF_STORE_VERSION = 1
+PROOF_STORE_HEADER = struct.Struct("<4sHcxQQ8x")
+
 import subprocess
 import sys
 
-def get_gpu_info():
+def collect_gpu_info():
     """
     Detect the number and types of GPUs available on the system.
 
@@ -31,9 +43,13 @@ def get_gpu_info():
     num_gpus = torch.cuda.device_count()
     gpu_names = [torch.cuda.get_device_name(i) for i in range(num_gpus)]
 
-    gpu_info = {"num_gpus": num_gpus, "gpu_names": gpu_names}
+    return {"num_gpus": num_gpus, "gpu_names": gpu_names}
 
+def get_gpu_info():
+    """Print the GPU information as JSON."""
+    gpu_info = collect_gpu_info()
     print(json.dumps(gpu_info, indent=2))
+    return gpu_info
 
 def estimate_vram_size(buffer_factor=0.9, precision="fp16"):
     dtype = torch.float16 if precision == "fp16" else torch.float32
@@ -91,44 +107,220 @@ def get_challenge_indices():
     return indices
 
 
-def build_merkle_tree_rows(C, hash_func=hashlib.sha256, num_threads=None):
+def merkle_tree_size(num_leaves):
+    """Total number of nodes of the row Merkle tree built over num_leaves leaves."""
+    total = 0
+    while num_leaves > 1:
+        total += num_leaves
+        num_leaves = (num_leaves + 1) // 2
+    return total + 1
+
+def create_proof_store(path, shape, dtype):
+    """
+    Create a proof store file and return a writable memory map over its data.
+
+    Args:
+        path (str): Destination file, usually in /dev/shm.
+        shape (tuple): (rows, cols) of the stored array.
+        dtype (np.dtype): Element type of the stored array.
+
+    Returns:
+        np.memmap: Writable (rows x cols) view of the file data.
+    """
+    dtype = np.dtype(dtype)
+    rows, cols = shape
+    with open(path, 'wb') as f:
+        f.write(PROOF_STORE_HEADER.pack(PROOF_STORE_MAGIC, PROOF_STORE_VERSION, dtype.char.encode(), rows, cols))
+        f.truncate(PROOF_STORE_HEADER.size + rows * cols * dtype.itemsize)
+    return np.memmap(path, dtype=dtype, mode='r+', offset=PROOF_STORE_HEADER.size, shape=(rows, cols))
+
+def open_proof_store(path):
+    """
+    Open a proof store read-only; only the pages actually indexed are read from the file.
+
+    Args:
+        path (str): Proof store file written by create_proof_store.
+
+    Returns:
+        np.memmap: Read-only (rows x cols) view of the file data.
+    """
+    with open(path, 'rb') as f:
+        header = f.read(PROOF_STORE_HEADER.size)
+    magic, version, dtype_char, rows, cols = PROOF_STORE_HEADER.unpack(header)
+    if magic != PROOF_STORE_MAGIC or version != PROOF_STORE_VERSION:
+        raise ValueError(f"Unsupported proof store format in {path}")
+    return np.memmap(path, dtype=np.dtype(dtype_char.decode()), mode='r', offset=PROOF_STORE_HEADER.size, shape=(rows, cols))
+
+def save_proof_store(path, array):
+    """Write an in-memory array into a new proof store."""
+    store = create_proof_store(path, array.shape, array.dtype)
+    store[:] = array
+    store.flush()
+    return store
+
+def get_proof_store_paths(gpu_id):
+    """Paths of the C matrix and Merkle tree proof stores of a GPU."""
+    return f'/dev/shm/C_gpu_{gpu_id}.bin', f'/dev/shm/merkle_tree_gpu_{gpu_id}.bin'
+
+def merkle_chunks(start, end, num_threads, min_chunk):
+    """Split [start, end) into (start, end) ranges of at least min_chunk items for the pool."""
+    count = end - start
+    chunk = max(min_chunk, -(-count // (num_threads * 4)))
+    return [(i, min(i + chunk, end)) for i in range(start, end, chunk)]
+
+def hash_merkle_leaves(nodes, C, bounds, hash_func=hashlib.sha256):
+    """Hash rows [start, end) of C straight into the leaves level of the flat tree buffer."""
+    start, end = bounds
+    digest_size = hash_func().digest_size
+    for i in range(start, end):
+        nodes[i * digest_size:(i + 1) * digest_size] = hash_func(C[i]).digest()
+
+def reduce_merkle_tree(tree, num_leaves, pool, hash_func=hashlib.sha256, num_threads=8, min_chunk=4096):
+    """Reduce the hashed leaves of the flat tree buffer level by level, in place, up to the root."""
+    nodes = memoryview(tree).cast('B')
+    digest_size = hash_func().digest_size
+
+    # Hash pairs of nodes of a level into the parents level
+    def hash_pairs(args):
+        offset, num_nodes, parent_offset, start, end = args
+        for p in range(start, end):
+            left = offset + 2 * p
+            if 2 * p + 1 < num_nodes:
+                # Siblings are contiguous in the buffer, hash them without concatenating
+                combined = nodes[left * digest_size:(left + 2) * digest_size]
+            else:
+                combined = bytes(nodes[left * digest_size:(left + 1) * digest_size]) * 2  # Duplicate if odd number of leaves
+            nodes[(parent_offset + p) * digest_size:(parent_offset + p + 1) * digest_size] = hash_func(combined).digest()
+
+    offset = 0
+    while num_leaves > 1:
+        num_parents = (num_leaves + 1) // 2
+        parent_offset = offset + num_leaves
+        tasks = [(offset, num_leaves, parent_offset, start, end) for start, end in merkle_chunks(0, num_parents, num_threads, min_chunk)]
+        if len(tasks) > 1:
+            pool.map(hash_pairs, tasks)
+        else:
+            hash_pairs(tasks[0])
+        offset = parent_offset
+        num_leaves = num_parents
+
+    return tree[-1].tobytes()
+
+def build_merkle_tree_rows(C, hash_func=hashlib.sha256, num_threads=None, min_chunk=4096):
+    """
+    Build the Merkle tree over the rows of C into a flat (num_nodes x digest_size) uint8 array.
+
+    Levels are stored one after the other (leaves first, root last), the layout expected by
+    get_merkle_proof_row. Leaves are hashed in large chunks on a single thread pool (hashlib
+    releases the GIL on row sized buffers) and every level is reduced in place in the same buffer.
+
+    Args:
+        C (np.ndarray): Matrix whose rows are the leaves.
+        hash_func (callable): Hash function (default: hashlib.sha256).
+        num_threads (int): Number of worker threads.
+        min_chunk (int): Minimum number of nodes per task; smaller levels are hashed inline.
+
+    Returns:
+        tuple: (root_hash as bytes, tree as np.ndarray)
+    """
     if num_threads is None:
         num_threads = 8
 
+    C = np.ascontiguousarray(C)
     n = C.shape[0]
-    
-    # Hash each row of C using the specified hash function
-    def hash_row(i):
-        return hash_func(C[i, :].tobytes()).digest()
-    
-    # Parallelize row hashing
+    tree = np.empty((merkle_tree_size(n), hash_func().digest_size), dtype=np.uint8)
+    nodes = memoryview(tree).cast('B')
+
     with ThreadPool(num_threads) as pool:
-        leaves = pool.map(hash_row, range(n))
-    
-    tree = leaves.copy()
-    num_leaves = len(leaves)
-    offset = 0
+        pool.map(lambda bounds: hash_merkle_leaves(nodes, C, bounds, hash_func), merkle_chunks(0, n, num_threads, min_chunk))
+        root_hash = reduce_merkle_tree(tree, n, pool, hash_func, num_threads, min_chunk)
 
-    # Function to hash pairs of nodes using the specified hash function
-    def hash_pair(i):
-        left = tree[offset + i]
-        if i + 1 < num_leaves:
-            right = tree[offset + i + 1]
-        else:
-            right = left  # Duplicate if odd number of leaves
-        return hash_func(left + right).digest()
+    return root_hash, tree
 
-    # Build the Merkle tree
-    while num_leaves > 1:
-        with ThreadPool(num_threads) as pool:
-            # Process pairs of leaves
-            new_level = pool.map(hash_pair, range(0, num_leaves, 2))
-        tree.extend(new_level)
-        offset += num_leaves
-        num_leaves = len(new_level)
+def transfer_and_build_merkle_tree_rows(C_torch, hash_func=hashlib.sha256, num_threads=None, chunk_bytes=64 * 1024 * 1024, min_chunk=256, C_host=None, tree=None):
+    """
+    Copy C back to the host in row chunks while hashing the rows already received.
 
-    root_hash = tree[-1]
-    return root_hash, tree
+    On CUDA, chunks are copied on a side stream into two pinned buffers: while one chunk is being
+    transferred the previous one is moved into the host matrix and its rows are hashed on the pool,
+    so the transfer and Merkle phases overlap. CPU tensors are used in place and only hashed.
+
+    Args:
+        C_torch (torch.Tensor): (n x n) result matrix, on CUDA or CPU.
+        hash_func (callable): Hash function (default: hashlib.sha256).
+        num_threads (int): Number of hashing threads.
+        chunk_bytes (int): Size of each pinned transfer buffer.
+        min_chunk (int): Minimum number of rows per hashing task.
+        C_host (np.ndarray): Optional preallocated host matrix (e.g. a proof store) receiving C.
+        tree (np.ndarray): Optional preallocated flat tree buffer (e.g. a proof store).
+
+    Returns:
+        tuple: (C as np.ndarray, root_hash as bytes, tree as np.ndarray, timings dict) where timings holds
+            transfer_back_time (until the last chunk reached the host), merkle_tree_time (hashing left after
+            the transfer) and transfer_merkle_time (wall time of the overlapped phase).
+    """
+    if num_threads is None:
+        num_threads = 8
+
+    n = C_torch.shape[0]
+    if tree is None:
+        tree = np.empty((merkle_tree_size(n), hash_func().digest_size), dtype=np.uint8)
+    nodes = memoryview(tree).cast('B')
+    start_time = time.time()
+
+    with ThreadPool(num_threads) as pool:
+        pending = []
+
+        def hash_rows_async(C, start, end):
+            bounds = merkle_chunks(start, end, num_threads, min_chunk)
+            pending.append(pool.map_async(lambda b: hash_merkle_leaves(nodes, C, b, hash_func), bounds))
+
+        if C_torch.is_cuda:
+            device = C_torch.device
+            chunk_rows = max(1, min(n, chunk_bytes // (C_torch.element_size() * max(n, 1))))
+            num_chunks = -(-n // chunk_rows)
+            C = C_host if C_host is not None else np.empty((n, C_torch.shape[1]), dtype=np.float32)
+            stream = torch.cuda.Stream(device=device)
+            stream.wait_stream(torch.cuda.current_stream(device))
+            buffers = [torch.empty((chunk_rows, C_torch.shape[1]), dtype=C_torch.dtype, pin_memory=True) for _ in range(2)]
+            events = [torch.cuda.Event() for _ in range(2)]
+
+            def issue_copy(k):
+                start = k * chunk_rows
+                end = min(start + chunk_rows, n)
+                with torch.cuda.stream(stream):
+                    buffers[k % 2][:end - start].copy_(C_torch[start:end], non_blocking=True)
+                    events[k % 2].record(stream)
+
+            issue_copy(0)
+            for k in range(num_chunks):
+                # The other buffer was drained in the previous iteration, start filling it right away
+                if k + 1 < num_chunks:
+                    issue_copy(k + 1)
+                start = k * chunk_rows
+                end = min(start + chunk_rows, n)
+                events[k % 2].synchronize()
+                C[start:end] = buffers[k % 2][:end - start].numpy()
+                hash_rows_async(C, start, end)
+        else:
+            C = np.ascontiguousarray(C_torch.numpy())
+            if C_host is not None:
+                C_host[:] = C
+                C = C_host
+            hash_rows_async(C, 0, n)
+
+        transfer_back_time = time.time() - start_time
+        for result in pending:
+            result.get()
+        root_hash = reduce_merkle_tree(tree, n, pool, hash_func, num_threads)
+
+    transfer_merkle_time = time.time() - start_time
+    timings = {
+        'transfer_back_time': transfer_back_time,
+        'merkle_tree_time': transfer_merkle_time - transfer_back_time,
+        'transfer_merkle_time': transfer_merkle_time,
+    }
+    return C, root_hash, tree, timings
 
 def get_merkle_proof_row(tree, row_index, total_leaves):
     proof = []
@@ -141,12 +333,32 @@ def get_merkle_proof_row(tree, row_index, total_leaves):
             sibling_hash = tree[offset + sibling_idx]
         else:
             sibling_hash = tree[offset + idx]  # Duplicate if sibling is missing
-        proof.append(sibling_hash)
+        proof.append(bytes(sibling_hash))
         idx = idx // 2
         offset += num_leaves
         num_leaves = (num_leaves + 1) // 2
     return proof
 
+def save_proof_responses(path, indices, rows, proofs, hash_size=32):
+    """
+    Write the proof responses of a GPU using the compact binary layout read by the validator.
+
+    Args:
+        path (str): Destination file.
+        indices (list): List of (i, j) challenge indices.
+        rows (np.ndarray): (k x n) float32 rows of C.
+        proofs (list): Merkle proof (list of sibling hashes) of each row.
+        hash_size (int): Size in bytes of every sibling hash.
+    """
+    k = len(indices)
+    n = rows.shape[1]
+    depth = len(proofs[0]) if k else 0
+    with open(path, 'wb') as f:
+        f.write(PROOF_RESPONSE_HEADER.pack(PROOF_RESPONSE_MAGIC, PROOF_RESPONSE_VERSION, hash_size, k, n, depth))
+        f.write(np.asarray(indices, dtype='<i8').reshape(k, 2).tobytes())
+        f.write(np.ascontiguousarray(rows, dtype='<f4').tobytes())
+        f.write(b"".join(b"".join(proof) for proof in proofs))
+
 def xorshift32_torch(state):
     state = state.type(torch.int64)
     x = state & 0xFFFFFFFF
@@ -179,7 +391,70 @@ def generate_matrix_torch(s, n):
     matrix = (states.float() / float(0xFFFFFFFF)).reshape(n, n)
     return matrix
 
-def run_benchmark():
+def generate_matrix_torch_tiled(s, n, scratch_bytes=256 * 1024 * 1024):
+    """
+    Memory-lean equivalent of generate_matrix_torch.
+
+    The matrix is filled in blocks of rows built by broadcasting row and column indices, with the
+    xorshift rounds applied in place. Temporaries are bounded by scratch_bytes instead of the
+    ~24 * n^2 bytes of full size index and state tensors. The output is bit-identical.
+
+    Args:
+        s (int): Seed of the matrix.
+        n (int): Size of the matrix.
+        scratch_bytes (int): Upper bound of the int64 scratch buffers used per block.
+
+    Returns:
+        torch.Tensor: (n x n) float32 matrix.
+    """
+    device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+    dtype = torch.int64
+    mask = 0xFFFFFFFF
+
+    # Two int64 buffers (states and shift scratch) per block of rows
+    block_rows = max(1, min(n, scratch_bytes // (2 * 8 * max(n, 1))))
+
+    matrix = torch.empty((n, n), dtype=torch.float32, device=device)
+    states = torch.empty((block_rows, n), dtype=dtype, device=device)
+    scratch = torch.empty((block_rows, n), dtype=dtype, device=device)
+    j_indices = torch.arange(n, dtype=dtype, device=device).unsqueeze(0)
+    # Only the low 32 bits of s + i + j survive the mask, so the seed can be reduced first
+    s_low = s & mask
+
+    for start in range(0, n, block_rows):
+        end = min(start + block_rows, n)
+        rows = end - start
+        block_states = states[:rows]
+        block_scratch = scratch[:rows]
+
+        i_indices = torch.arange(start, end, dtype=dtype, device=device).unsqueeze(1)
+        torch.add(i_indices, j_indices, out=block_states)
+        block_states.add_(s_low)
+        block_states.bitwise_and_(mask)
+
+        for _ in range(10):
+            torch.bitwise_left_shift(block_states, 13, out=block_scratch)
+            block_scratch.bitwise_and_(mask)
+            block_states.bitwise_xor_(block_scratch)
+            torch.bitwise_right_shift(block_states, 17, out=block_scratch)
+            block_states.bitwise_xor_(block_scratch)
+            torch.bitwise_left_shift(block_states, 5, out=block_scratch)
+            block_scratch.bitwise_and_(mask)
+            block_states.bitwise_xor_(block_scratch)
+
+        matrix[start:end].copy_(block_states)
+        matrix[start:end].div_(float(mask))
+
+    del states, scratch
+    return matrix
+
+def benchmark_gpus():
+    """
+    Estimate the available VRAM and time one FP16 and one FP32 matrix multiplication.
+
+    Returns:
+        dict: num_gpus, vram, size_fp16, time_fp16, size_fp32 and time_fp32.
+    """
     # Detect number of GPUs
     num_gpus = torch.cuda.device_count()
 
@@ -194,8 +469,20 @@ def run_benchmark():
     elapsed_time_fp16 = benchmark_matrix_multiplication(matrix_size_fp16, precision="fp16")
     elapsed_time_fp32 = benchmark_matrix_multiplication(matrix_size_fp32, precision="fp32")
 
+    return {
+        "num_gpus": num_gpus,
+        "vram": round(estimated_vram, 2),
+        "size_fp16": matrix_size_fp16,
+        "time_fp16": elapsed_time_fp16,
+        "size_fp32": matrix_size_fp32,
+        "time_fp32": elapsed_time_fp32,
+    }
+
+def run_benchmark():
+    result = benchmark_gpus()
+
     # Output results
-    print(f"{num_gpus} {estimated_vram:.2f} {matrix_size_fp16} {elapsed_time_fp16:.6f} {matrix_size_fp32} {elapsed_time_fp32:.6f}")
+    print(f"{result['num_gpus']} {result['vram']:.2f} {result['size_fp16']} {result['time_fp16']:.6f} {result['size_fp32']} {result['time_fp32']:.6f}")
 
 def benchmark_matrix_multiplication(size, precision="fp16"):
     dtype = torch.float16 if precision == "fp16" else torch.float32
@@ -209,7 +496,7 @@ def benchmark_matrix_multiplication(size, precision="fp16"):
     elapsed_time = time.time() - start_time
     return elapsed_time
 
-def process_gpu(gpu_id, s_A, s_B, n):
+def process_gpu(gpu_id, s_A, s_B, n, pipelined=True):
     """
     Process computations for a single GPU.
 
@@ -218,6 +505,7 @@ def process_gpu(gpu_id, s_A, s_B, n):
         s_A (int): Seed for matrix A.
         s_B (int): Seed for matrix B.
         n (int): Size of the matrices.
+        pipelined (bool): Overlap the transfer of C back to the host with the Merkle leaf hashing.
 
     Returns:
         tuple: (root_hash_result, gpu_timing_result)
@@ -237,8 +525,8 @@ def process_gpu(gpu_id, s_A, s_B, n):
         torch.cuda.empty_cache()
 
         # Generate A and B matrices
-        A_torch = generate_matrix_torch(s_A, n)
-        B_torch = generate_matrix_torch(s_B, n)
+        A_torch = generate_matrix_torch_tiled(s_A, n)
+        B_torch = generate_matrix_torch_tiled(s_B, n)
 
         end_time_generation = time.time()
         generation_time = end_time_generation - start_time_generation
@@ -254,32 +542,43 @@ def process_gpu(gpu_id, s_A, s_B, n):
         gpu_timing['multiplication_time'] = multiplication_time
         print(f"GPU {gpu_id}: Matrix multiplication time on GPU: {multiplication_time:.2f} seconds")
 
-        # Step 4: Move C back to CPU for Merkle tree construction
-        start_time_transfer_back = time.time()
-        C = C_torch.cpu().numpy()
-        end_time_transfer_back = time.time()
-        transfer_back_time = end_time_transfer_back - start_time_transfer_back
-        gpu_timing['transfer_back_time'] = transfer_back_time
-        # Optional: Uncomment to log transfer time
-        # print(f"GPU {gpu_id}: Data transfer from GPU time: {transfer_back_time:.2f} seconds")
-
-        # Step 5: Construct Merkle tree over rows of C
-        start_time_merkle = time.time()
-        root_hash, merkle_tree = build_merkle_tree_rows(C)
-        end_time_merkle = time.time()
-        merkle_tree_time = end_time_merkle - start_time_merkle
-        gpu_timing['merkle_tree_time'] = merkle_tree_time
-        # Optional: Uncomment to log Merkle tree construction time and root hash
-        # print(f"GPU {gpu_id}: Merkle tree over rows construction time: {merkle_tree_time:.2f} seconds")
-        # print(f"GPU {gpu_id}: Root hash: {root_hash.hex()}")
+        C_path, tree_path = get_proof_store_paths(gpu_id)
+        if pipelined:
+            # Step 4 + 5: Move C back in chunks straight into the memory-mapped proof stores while constructing the Merkle tree
+            C_store = create_proof_store(C_path, tuple(C_torch.shape), np.float32)
+            tree_store = create_proof_store(tree_path, (merkle_tree_size(n), hashlib.sha256().digest_size), np.uint8)
+            C, root_hash, merkle_tree, pipeline_timing = transfer_and_build_merkle_tree_rows(C_torch, C_host=C_store, tree=tree_store)
+            gpu_timing.update(pipeline_timing)
+            C.flush()
+            merkle_tree.flush()
+        else:
+            # Step 4: Move C back to CPU for Merkle tree construction
+            start_time_transfer_back = time.time()
+            C = C_torch.cpu().numpy()
+            end_time_transfer_back = time.time()
+            transfer_back_time = end_time_transfer_back - start_time_transfer_back
+            gpu_timing['transfer_back_time'] = transfer_back_time
+            # Optional: Uncomment to log transfer time
+            # print(f"GPU {gpu_id}: Data transfer from GPU time: {transfer_back_time:.2f} seconds")
+
+            # Step 5: Construct Merkle tree over rows of C
+            start_time_merkle = time.time()
+            root_hash, merkle_tree = build_merkle_tree_rows(C)
+            end_time_merkle = time.time()
+            merkle_tree_time = end_time_merkle - start_time_merkle
+            gpu_timing['merkle_tree_time'] = merkle_tree_time
+            # Optional: Uncomment to log Merkle tree construction time and root hash
+            # print(f"GPU {gpu_id}: Merkle tree over rows construction time: {merkle_tree_time:.2f} seconds")
+            # print(f"GPU {gpu_id}: Root hash: {root_hash.hex()}")
 
         # Save root hash and timings
         root_hash_result = (gpu_id, root_hash.hex())
         gpu_timing_result = (gpu_id, gpu_timing)
 
         # Save Merkle tree and C for later proof generation
-        np.save(f'/dev/shm/merkle_tree_gpu_{gpu_id}.npy', merkle_tree)
-        np.save(f'/dev/shm/C_gpu_{gpu_id}.npy', C)
+        if not pipelined:
+            save_proof_store(tree_path, merkle_tree)
+            save_proof_store(C_path, C)
 
         # Free GPU memory
         del A_torch, B_torch, C_torch, C, merkle_tree
@@ -292,20 +591,20 @@ def process_gpu(gpu_id, s_A, s_B, n):
         print(f"Error processing GPU {gpu_id}: {e}")
         return None, None
 
-def run_compute():
+def compute_gpus(n, seeds):
     """
     Run compute operations on all available GPUs in parallel.
-    """
-    if not torch.cuda.is_available():
-        print("Error: No GPU detected.")
-        sys.exit(1)
 
+    Args:
+        n (int): Size of the matrices.
+        seeds (dict): gpu_id -> (s_A, s_B).
+
+    Returns:
+        tuple: (root_hashes, gpu_timings) as lists of (gpu_id, value).
+    """
     # Detect number of GPUs
     num_gpus = torch.cuda.device_count()
 
-    # Read n and seeds
-    n, seeds = get_seeds()
-
     # Initialize lists to store root hashes and timings per GPU
     root_hashes = []
     gpu_timings = []
@@ -325,57 +624,147 @@ def run_compute():
             if gpu_timing_result:
                 gpu_timings.append(gpu_timing_result)
 
+    return root_hashes, gpu_timings
+
+def run_compute():
+    """
+    Run compute operations on all available GPUs in parallel.
+    """
+    if not torch.cuda.is_available():
+        print("Error: No GPU detected.")
+        sys.exit(1)
+
+    # Read n and seeds
+    n, seeds = get_seeds()
+
+    root_hashes, gpu_timings = compute_gpus(n, seeds)
+
     # Output root hashes and timings
     print(f"Root hashes: {json.dumps(root_hashes)}")
     print(f"Timings: {json.dumps(gpu_timings)}")
 
-def run_proof_gpu(gpu_id, indices, num_gpus):
+def run_proof_gpu(gpu_id, indices, num_gpus, stores=None):
     # Set the GPU device
     torch.cuda.set_device(gpu_id)
     
     # Load data for the specific GPU
     gpu_indices = indices[gpu_id]
-    merkle_tree = np.load(f'/dev/shm/merkle_tree_gpu_{gpu_id}.npy', allow_pickle=True)
-    C = np.load(f'/dev/shm/C_gpu_{gpu_id}.npy')
+    if stores and gpu_id in stores:
+        C, merkle_tree = stores[gpu_id]
+    else:
+        C_path, tree_path = get_proof_store_paths(gpu_id)
+        # Memory-mapped: only the challenged rows and their sibling nodes are paged in
+        merkle_tree = open_proof_store(tree_path)
+        C = open_proof_store(C_path)
     
     # Start proof generation
     start_time_proof = time.time()
-    responses = {'rows': [], 'proofs': [], 'indices': gpu_indices}
     total_leaves = C.shape[0]
-    
-    for idx, (i, j) in enumerate(gpu_indices):
-        row = C[i, :]
-        proof = get_merkle_proof_row(merkle_tree, i, total_leaves)
-        responses['rows'].append(row)
-        responses['proofs'].append(proof)
+    rows = C[[i for i, j in gpu_indices], :]
+    proofs = [get_merkle_proof_row(merkle_tree, i, total_leaves) for i, j in gpu_indices]
     
     end_time_proof = time.time()
     proof_time = end_time_proof - start_time_proof
     print(f"GPU {gpu_id}: Proof generation time: {proof_time:.2f} seconds")
     
     # Save responses to shared memory
-    np.save(f'/dev/shm/responses_gpu_{gpu_id}.npy', responses)
+    save_proof_responses(f'/dev/shm/responses_gpu_{gpu_id}.bin', gpu_indices, rows, proofs)
 
-def run_proof():
-    # Get the challenge indices
-    indices = get_challenge_indices()
+def prove_gpus(indices, stores=None):
+    """Generate and save the proof responses of every GPU in parallel."""
     num_gpus = torch.cuda.device_count()
     
     # Use ThreadPoolExecutor for parallel GPU processing
     with ThreadPoolExecutor(max_workers=num_gpus) as executor:
         futures = [
-            executor.submit(run_proof_gpu, gpu_id, indices, num_gpus)
+            executor.submit(run_proof_gpu, gpu_id, indices, num_gpus, stores)
             for gpu_id in range(num_gpus)
         ]
         # Wait for all threads to complete
         for future in futures:
             future.result()  # To raise any exceptions that occurred in the threads
 
+def run_proof():
+    # Get the challenge indices
+    indices = get_challenge_indices()
+    prove_gpus(indices)
+
+def run_agent():
+    """
+    Serve line-delimited JSON commands on stdin until 'exit' or end of input.
+
+    Each request is a JSON object with a 'cmd' key (bootstrap, gpu_info, benchmark, compute, proof
+    or exit); each reply is a single JSON line with 'status' set to 'ok' or 'error'. The process stays
+    alive between commands, so torch, the CUDA contexts and the computed proof stores remain resident.
+    """
+    protocol_out = sys.stdout
+    # Progress messages go to stderr so they never corrupt the protocol stream
+    sys.stdout = sys.stderr
+    stores = {}
+
+    def handle_bootstrap(request):
+        # Hash of this script as written to disk, the GPU info and the benchmark in a single reply
+        with open(os.path.abspath(__file__), "rb") as f:
+            script_hash = hashlib.sha256(f.read()).hexdigest()
+        response = {"script_hash": script_hash, "gpu_info": collect_gpu_info()}
+        if request.get("benchmark", True) and response["gpu_info"]["num_gpus"] > 0:
+            response["benchmark"] = benchmark_gpus()
+        return response
+
+    def handle_compute(request):
+        if not torch.cuda.is_available():
+            raise RuntimeError("No GPU detected.")
+        seeds = {int(gpu_id): (int(s_A), int(s_B)) for gpu_id, (s_A, s_B) in request["seeds"].items()}
+        start_time = time.time()
+        root_hashes, gpu_timings = compute_gpus(int(request["n"]), seeds)
+        stores.clear()
+        for gpu_id, _ in root_hashes:
+            C_path, tree_path = get_proof_store_paths(gpu_id)
+            stores[gpu_id] = (open_proof_store(C_path), open_proof_store(tree_path))
+        return {"root_hashes": root_hashes, "timings": gpu_timings, "elapsed": time.time() - start_time}
+
+    def handle_proof(request):
+        indices = {int(gpu_id): [tuple(map(int, idx)) for idx in idx_list] for gpu_id, idx_list in request["indices"].items()}
+        prove_gpus(indices, stores)
+        return {}
+
+    handlers = {
+        "bootstrap": handle_bootstrap,
+        "gpu_info": lambda request: collect_gpu_info(),
+        "benchmark": lambda request: benchmark_gpus(),
+        "compute": handle_compute,
+        "proof": handle_proof,
+    }
+
+    while True:
+        line = sys.stdin.readline()
+        if not line:
+            break
+        line = line.strip()
+        if not line:
+            continue
+        cmd = None
+        try:
+            request = json.loads(line)
+            cmd = request.get("cmd")
+            if cmd == "exit":
+                response = {"status": "ok"}
+            elif cmd in handlers:
+                response = {"status": "ok", **handlers[cmd](request)}
+            else:
+                response = {"status": "error", "error": f"Unknown command: {cmd}"}
+        except Exception as e:
+            response = {"status": "error", "error": str(e)}
+        protocol_out.write(json.dumps(response) + "\n")
+        protocol_out.flush()
+        if response["status"] == "ok" and cmd == "exit":
+            break
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Miner script for GPU proof.')
     parser.add_argument('--mode', type=str, default='benchmark', 
-                        choices=['benchmark', 'compute', 'proof', 'gpu_info'],
-                        help='Mode to run: benchmark, compute, proof, or gpu_info')
+                        choices=['benchmark', 'compute', 'proof', 'gpu_info', 'agent'],
+                        help='Mode to run: benchmark, compute, proof, gpu_info, or agent')
     args = parser.parse_args()
 
     if args.mode == 'benchmark':
@@ -386,3 +775,5 @@ if __name__ == "__main__":
         run_proof()
     elif args.mode == 'gpu_info':
         get_gpu_info()
+    elif args.mode == 'agent':
+        run_agent()
@@ -1,4 +1,4 @@
-import paramiko
+import base64
 import hashlib
 import numpy as np
 import os
@@ -6,11 +6,21 @@ import time
 import blake3
 import secrets  # For secure random seed generation
 import json
-import tempfile
+import struct
 import yaml
 import torch
 import bittensor as bt
 
+from neurons.Validator.pog_verify import check_gpu_response
+
+# Binary proof response layout (little-endian), must match the miner script:
+# header (magic, version, hash size, k, n, depth) | k x 2 int64 indices | k x n float32 rows | k x depth x hash size siblings
+PROOF_RESPONSE_MAGIC = b"PoGR"
+PROOF_RESPONSE_VERSION = 1
+PROOF_RESPONSE_HEADER = struct.Struct("<4sHHIII12x")
+# Size of the sibling hashes (sha256) of the miner row Merkle tree
+PROOF_HASH_SIZE = 32
+
 def load_yaml_config(file_path):
     """
     Load GPU performance data from a YAML file.
@@ -72,41 +82,92 @@ def identify_gpu(fp16_tflops, fp32_tflops, estimated_avram, gpu_data, reported_n
 
     return identified_gpu
 
+# Miner script content and hash per path, keyed by file mtime and size
+_script_cache = {}
+
+def load_miner_script(script_path):
+    """Return (content, sha256 hex digest) of the miner script, read again only when the file changes."""
+    stat = os.stat(script_path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _script_cache.get(script_path)
+    if cached is None or cached[0] != key:
+        with open(script_path, "rb") as f:
+            content = f.read()
+        cached = _script_cache[script_path] = (key, content, hashlib.sha256(content).hexdigest())
+    return cached[1], cached[2]
+
 def compute_script_hash(script_path):
-    with open(script_path, "rb") as f:
-        return hashlib.sha256(f.read()).hexdigest()
+    return load_miner_script(script_path)[1]
 
-def send_script_and_request_hash(ssh_client, script_path):
-    sftp = ssh_client.open_sftp()
-    sftp.put(script_path, "/tmp/miner_script.py")
-    sftp.close()
+# Command starting the miner script in agent mode
+REMOTE_AGENT_COMMAND = "/opt/conda/bin/python /tmp/miner_script.py --mode agent"
 
-    # Command to compute the hash on the remote server
-    hash_command = """
+# Command writing the miner script received base64 encoded on the first stdin line, then running it in
+# agent mode in the same process, so the upload and the agent start share a single remote execution
+REMOTE_BOOTSTRAP_COMMAND = """
     /opt/conda/bin/python -c "
-import hashlib
-with open('/tmp/miner_script.py', 'rb') as f:
-    computed_hash = hashlib.sha256(f.read()).hexdigest()
-print(computed_hash)
+import base64, runpy, sys
+with open('/tmp/miner_script.py', 'wb') as f:
+    f.write(base64.b64decode(sys.stdin.readline()))
+sys.argv = ['/tmp/miner_script.py', '--mode', 'agent']
+runpy.run_path('/tmp/miner_script.py', run_name='__main__')
 "
     """
-    stdin, stdout, stderr = ssh_client.exec_command(hash_command)
-    computed_hash = stdout.read().decode().strip()
-    hash_error = stderr.read().decode().strip()
 
-    if hash_error:
-        raise RuntimeError(f"Hash computation failed: {hash_error}")
-    return computed_hash
+def encode_agent_request(cmd, **params):
+    """Encode a command for the miner script agent as one JSON line."""
+    return json.dumps({"cmd": cmd, **params}) + "\n"
+
+def encode_bootstrap_payload(script):
+    """Encode the miner script as the first stdin line expected by REMOTE_BOOTSTRAP_COMMAND."""
+    return base64.b64encode(script).decode("ascii") + "\n"
 
-def execute_script_on_miner(ssh_client, mode):
-    execution_command = f"/opt/conda/bin/python /tmp/miner_script.py --mode {mode}"
-    stdin, stdout, stderr = ssh_client.exec_command(execution_command)
-    execution_output = stdout.read().decode().strip()
-    execution_error = stderr.read().decode().strip()
+class AgentExitedError(RuntimeError):
+    """The miner script agent stopped answering, usually because its SSH session dropped."""
 
-    if execution_error:
-        raise RuntimeError(f"Script execution failed: {execution_error}")
-    return execution_output
+def decode_agent_response(cmd, line, error=""):
+    """
+    Decode one reply line of the miner script agent.
+
+    :raises AgentExitedError: If the agent exited (empty line).
+    :raises RuntimeError: If the agent reported an error.
+    """
+    if not line:
+        raise AgentExitedError(f"PoG agent exited during '{cmd}': {error.strip()}")
+    response = json.loads(line)
+    if response.get("status") != "ok":
+        raise RuntimeError(f"PoG agent '{cmd}' failed: {response.get('error')}")
+    return response
+
+def agent_compute_params(seeds, n):
+    return {"n": int(n), "seeds": {str(gpu_id): [int(s_A), int(s_B)] for gpu_id, (s_A, s_B) in seeds.items()}}
+
+def agent_proof_params(indices):
+    return {"indices": {str(gpu_id): [[int(i), int(j)] for i, j in idx_list] for gpu_id, idx_list in indices.items()}}
+
+def parse_agent_benchmark(response):
+    """Return the agent benchmark reply in the same order as parse_benchmark_output."""
+    return (
+        int(response["num_gpus"]),
+        float(response["vram"]),
+        int(response["size_fp16"]),
+        float(response["time_fp16"]),
+        int(response["size_fp32"]),
+        float(response["time_fp32"]),
+    )
+
+def parse_agent_bootstrap(response):
+    """
+    Split the agent bootstrap reply.
+
+    :return: Tuple of (script hash, gpu info dict, benchmark tuple or None when it was not run).
+    """
+    benchmark = response.get("benchmark")
+    return (
+        response["script_hash"],
+        response["gpu_info"],
+        parse_agent_benchmark(benchmark) if benchmark is not None else None,
+    )
 
 def parse_benchmark_output(output):
     try:
@@ -153,70 +214,127 @@ def get_random_seeds(num_gpus):
         seeds[gpu_id] = (s_A, s_B)
     return seeds
 
-def send_seeds(ssh_client, seeds, n):
-    lines = [str(n)]  # First line is n
-    for gpu_id in seeds.keys():
-        s_A, s_B = seeds[gpu_id]
-        line = f"{gpu_id} {s_A} {s_B}"
-        lines.append(line)
-    content = '\n'.join(lines)
-    command = f"echo '{content}' > /tmp/seeds.txt"
-    stdin, stdout, stderr = ssh_client.exec_command(command)
-    stdout.channel.recv_exit_status()
-
-def send_challenge_indices(ssh_client, indices):
-    lines = []
-    for gpu_id in indices.keys():
-        idx_list = indices[gpu_id]
-        indices_str = ';'.join([f"{i},{j}" for i, j in idx_list])
-        line = f"{gpu_id} {indices_str}"
-        lines.append(line)
-    content = '\n'.join(lines)
-    command = f"echo '{content}' > /tmp/challenge_indices.txt"
-    stdin, stdout, stderr = ssh_client.exec_command(command)
-    stdout.channel.recv_exit_status()
-
-def receive_responses(ssh_client, num_gpus):
-    responses = {}
-    try:
-        with ssh_client.open_sftp() as sftp, tempfile.TemporaryDirectory() as temp_dir:
-            for gpu_id in range(num_gpus):
-                remote_path = f'/dev/shm/responses_gpu_{gpu_id}.npy'
-                local_path = f'{temp_dir}/responses_gpu_{gpu_id}.npy'
-                
-                try:
-                    sftp.get(remote_path, local_path)
-                    response = np.load(local_path, allow_pickle=True)
-                    responses[gpu_id] = response.item()
-                except Exception as e:
-                    print(f"Error processing GPU {gpu_id}: {e}")
-                    responses[gpu_id] = None
-    except Exception as e:
-        print(f"SFTP connection error: {e}")
-    
-    return responses
+def proof_response_size(k, n, hash_size=PROOF_HASH_SIZE):
+    """Size in bytes of the proof response of k challenged rows of an n x n matrix."""
+    # Depth of the row Merkle tree, whose levels halve (rounding up) down to the root
+    depth = (int(n) - 1).bit_length() if n > 1 else 0
+    return PROOF_RESPONSE_HEADER.size + k * 2 * 8 + k * n * 4 + k * depth * hash_size
+
+def parse_proof_responses(buffer):
+    """
+    Parse a binary proof response into NumPy views over the received buffer, without copying.
+
+    Parameters:
+        buffer (bytes): Raw content of a responses_gpu_{id}.bin file.
+
+    Returns:
+        dict: {'indices': (k x 2) int64, 'rows': (k x n) float32, 'proofs': (k x depth x hash size) uint8}
+    """
+    if len(buffer) < PROOF_RESPONSE_HEADER.size:
+        raise ValueError(f"Proof response too short: {len(buffer)} bytes")
+    magic, version, hash_size, k, n, depth = PROOF_RESPONSE_HEADER.unpack_from(buffer, 0)
+    if magic != PROOF_RESPONSE_MAGIC or version != PROOF_RESPONSE_VERSION:
+        raise ValueError(f"Unsupported proof response format: {magic!r} v{version}")
+
+    indices_offset = PROOF_RESPONSE_HEADER.size
+    rows_offset = indices_offset + k * 2 * 8
+    proofs_offset = rows_offset + k * n * 4
+    expected_size = proofs_offset + k * depth * hash_size
+    if len(buffer) != expected_size:
+        raise ValueError(f"Proof response size mismatch: expected {expected_size} bytes, got {len(buffer)}")
+
+    indices = np.frombuffer(buffer, dtype='<i8', count=k * 2, offset=indices_offset).reshape(k, 2)
+    rows = np.frombuffer(buffer, dtype='<f4', count=k * n, offset=rows_offset).reshape(k, n)
+    proofs = np.frombuffer(buffer, dtype=np.uint8, count=k * depth * hash_size, offset=proofs_offset).reshape(k, depth, hash_size)
+    return {'indices': indices, 'rows': rows, 'proofs': proofs}
+
+def fetch_remote_files(sftp, remote_paths, max_size=None):
+    """
+    Fetch several remote files concurrently over a single SFTP session into memory.
+
+    Read requests for every file are issued up front with SFTP prefetch, so the transfers are
+    pipelined instead of being fetched one round-trip chain at a time.
+
+    Parameters:
+        sftp (paramiko.SFTPClient): Open SFTP session.
+        remote_paths (dict): Mapping of key -> remote file path.
+        max_size (int): Largest accepted file size in bytes, None for no limit.
 
-def xorshift32_numpy(state):
-    state = np.uint64(state)
-    x = state & np.uint64(0xFFFFFFFF)
-    x ^= (np.uint64((x << np.uint64(13)) & np.uint64(0xFFFFFFFF)))
-    x ^= (np.uint64((x >> np.uint64(17)) & np.uint64(0xFFFFFFFF)))
-    x ^= (np.uint64((x << np.uint64(5)) & np.uint64(0xFFFFFFFF)))
-    x = x & np.uint64(0xFFFFFFFF)
-    return x
+    Returns:
+        tuple: (buffers, transfer_stats) where buffers maps key -> bytes (or None on failure)
+            and transfer_stats maps key -> {'bytes', 'seconds', 'mb_per_s'} of each file.
 
-def generate_prng_value(s, i, j):
-    s = np.uint64(s)
-    i = np.uint64(i % np.uint64(2**32))
-    j = np.uint64(j)
-    state = (s + i + j) & np.uint64(0xFFFFFFFF)
+    Raises:
+        ValueError: If a file is larger than max_size; nothing of it is read.
+    """
+    buffers = {}
+    transfer_stats = {}
+    opened_files = []
+    remote_files = {}
 
-    for _ in range(10):
-        state = xorshift32_numpy(state)
+    try:
+        # Open every file and queue all its read requests before consuming any of them
+        for key, remote_path in remote_paths.items():
+            try:
+                remote_file = sftp.open(remote_path, 'rb')
+            except Exception as e:
+                bt.logging.trace(f"[Fetch] Failed to open {remote_path}: {e}")
+                buffers[key] = None
+                continue
+            opened_files.append(remote_file)
+            file_size = remote_file.stat().st_size
+            check_fetch_size(remote_path, file_size, max_size)
+            remote_file.prefetch(file_size)
+            remote_files[key] = (remote_file, file_size, time.time())
+
+        # Each file is timed from its own prefetch to the end of its read
+        for key, (remote_file, file_size, start_time) in remote_files.items():
+            try:
+                buffers[key] = remote_file.read(file_size)
+                transfer_stats[key] = get_transfer_stats(len(buffers[key]), time.time() - start_time)
+            except Exception as e:
+                bt.logging.trace(f"[Fetch] Failed to read {remote_paths[key]}: {e}")
+                buffers[key] = None
+    finally:
+        for remote_file in opened_files:
+            remote_file.close()
+
+    return buffers, transfer_stats
+
+def check_fetch_size(remote_path, file_size, max_size):
+    """Reject a remote file larger than max_size before reading it."""
+    if max_size is not None and file_size > max_size:
+        raise ValueError(f"{remote_path} is {file_size} bytes, more than the expected {max_size} bytes")
+
+def get_transfer_stats(num_bytes, seconds):
+    return {
+        'bytes': num_bytes,
+        'seconds': seconds,
+        'mb_per_s': num_bytes / seconds / 1e6 if seconds > 0 else 0.0,
+    }
+
+def parse_fetched_responses(buffers, transfer_stats, num_gpus):
+    """Parse the fetched response buffers of every GPU; unreadable responses are reported as None."""
+    responses = {}
+    for gpu_id in range(num_gpus):
+        stats = transfer_stats.get(gpu_id)
+        if stats:
+            bt.logging.trace(
+                f"[Fetch] GPU {gpu_id}: {stats['bytes']} bytes in {stats['seconds']:.3f} s ({stats['mb_per_s']:.2f} MB/s)"
+            )
+        try:
+            if buffers.get(gpu_id) is None:
+                raise RuntimeError("response could not be fetched")
+            responses[gpu_id] = parse_proof_responses(buffers[gpu_id])
+        except Exception as e:
+            bt.logging.warning(f"[Fetch] Error processing the response of GPU {gpu_id}: {e}")
+            responses[gpu_id] = None
+    return responses
 
-    return state / float(0xFFFFFFFF)
+def get_response_paths(num_gpus):
+    return {gpu_id: f'/dev/shm/responses_gpu_{gpu_id}.bin' for gpu_id in range(num_gpus)}
 
-def verify_responses(seeds, root_hashes, responses, indices, n):
+def verify_responses(seeds, root_hashes, responses, indices, n, executor=None):
     """
     Verifies the responses from GPUs by checking computed values and Merkle proofs.
 
@@ -226,6 +344,8 @@ def verify_responses(seeds, root_hashes, responses, indices, n):
         responses (dict): Responses from each GPU containing computed rows and proofs.
         indices (dict): Challenge indices for each GPU.
         n (int): Total number of leaves in the Merkle tree.
+        executor (concurrent.futures.Executor): Optional process pool; when given, the GPUs
+            are verified in parallel in worker processes instead of in the calling thread.
 
     Returns:
         bool: True if verification passes within the allowed failure threshold, False otherwise.
@@ -245,41 +365,20 @@ def verify_responses(seeds, root_hashes, responses, indices, n):
         # For systems with 2 or fewer GPUs, require all to pass
         required_passes = num_gpus
 
-    for gpu_id in root_hashes.keys():
-        s_A, s_B = seeds[gpu_id]
-        gpu_indices = indices[gpu_id]
-        response = responses[gpu_id]
-        root_hash = root_hashes[gpu_id]
-        total_leaves = n
-
-        gpu_failed = False  # Flag to track if the current GPU has failed
-
-        for idx, (i, j) in enumerate(gpu_indices):
-            # Generate only the necessary row and column entries using PRNG
-            A_row = np.array([generate_prng_value(s_A, i, col) for col in range(n)], dtype=np.float32)
-            B_col = np.array([generate_prng_value(s_B, row, j) for row in range(n)], dtype=np.float32)
-
-            # Compute C_{i,j} as the dot product of A_row and B_col
-            value_validator = np.dot(A_row, B_col)
-
-            # Retrieve miner's computed value and corresponding Merkle proof
-            row_miner = response['rows'][idx]
-            proof = response['proofs'][idx]
-            value_miner = row_miner[j]
-
-            # Check if the miner's value matches the expected value
-            if not np.isclose(value_miner, value_validator, atol=1e-5):
-                bt.logging.trace(f"[Verification] GPU {gpu_id}: Value mismatch at index ({i}, {j}).")
-                gpu_failed = True
-                break  # Exit the loop for this GPU as it has already failed
-
-            # Verify the Merkle proof for the row
-            if not verify_merkle_proof_row(row_miner, proof, bytes.fromhex(root_hash), i, total_leaves):
-                bt.logging.trace(f"[Verification] GPU {gpu_id}: Invalid Merkle proof at index ({i}).")
-                gpu_failed = True
-                break  # Exit the loop for this GPU as it has already failed
-
-        if gpu_failed:
+    verification_args = {
+        gpu_id: (*seeds[gpu_id], root_hashes[gpu_id], responses.get(gpu_id), indices[gpu_id], n)
+        for gpu_id in root_hashes.keys()
+    }
+    # The workers run the light check_gpu_response and the failures are logged here
+    if executor is not None:
+        futures = {gpu_id: executor.submit(check_gpu_response, *args) for gpu_id, args in verification_args.items()}
+        gpu_failures = {gpu_id: future.result() for gpu_id, future in futures.items()}
+    else:
+        gpu_failures = {gpu_id: check_gpu_response(*args) for gpu_id, args in verification_args.items()}
+
+    for gpu_id, failure in gpu_failures.items():
+        if failure is not None:
+            bt.logging.trace(f"[Verification] GPU {gpu_id}: {failure}")
             failed_gpus.append(gpu_id)
             bt.logging.trace(f"[Verification] GPU {gpu_id} failed verification.")
         else:
@@ -302,65 +401,55 @@ def verify_responses(seeds, root_hashes, responses, indices, n):
 
     return verification_passed
 
-def verify_merkle_proof_row(row, proof, root_hash, index, total_leaves, hash_func=hashlib.sha256):
-    """
-    Verifies a Merkle proof for a given row.
-
-    Parameters:
-    - row (np.ndarray): The data row to verify.
-    - proof (list of bytes): The list of sibling hashes required for verification.
-    - root_hash (bytes): The root hash of the Merkle tree.
-    - index (int): The index of the row in the tree.
-    - total_leaves (int): The total number of leaves in the Merkle tree.
-    - hash_func (callable): The hash function to use (default: hashlib.sha256).
-
-    Returns:
-    - bool: True if the proof is valid, False otherwise.
-    """
-    # Initialize the computed hash with the hash of the row using the specified hash function
-    computed_hash = hash_func(row.tobytes()).digest()
-    idx = index
-    num_leaves = total_leaves
-    
-    # Iterate through each sibling hash in the proof
-    for sibling_hash in proof:
-        if idx % 2 == 0:
-            # If the current index is even, concatenate computed_hash + sibling_hash
-            combined = computed_hash + sibling_hash
-        else:
-            # If the current index is odd, concatenate sibling_hash + computed_hash
-            combined = sibling_hash + computed_hash
-        # Compute the new hash using the specified hash function
-        computed_hash = hash_func(combined).digest()
-        # Move up to the next level
-        idx = idx // 2
-    
-    # Compare the computed hash with the provided root hash
-    return computed_hash == root_hash
-
 def adjust_matrix_size(vram, element_size=2, buffer_factor=0.8):
     usable_vram = vram * buffer_factor * 1e9  # Usable VRAM in bytes
     max_size = int((usable_vram / (2 * element_size)) ** 0.5)  # Max size fitting in VRAM
     aligned_size = (max_size // 32) * 32  # Ensure alignment to multiple of 32
     return aligned_size
 
-def get_remote_gpu_info(ssh_client):
+def effective_fp32_flops(size_fp32, time_fp32, gpu_name=None, gpu_data=None):
     """
-    Execute the miner script in gpu_info mode to get GPU information from the remote miner.
-
-    Args:
-        ssh_client (paramiko.SSHClient): SSH client connected to the miner.
+    FP32 throughput (FLOPS) used to size the compute step: the benchmark measurement, capped at the
+    theoretical throughput of the identified GPU class so an inflated benchmark cannot inflate n.
+    """
+    flops = 2 * size_fp32 ** 3 / time_fp32
+    theoretical = (gpu_data or {}).get("GPU_TFLOPS_FP32", {}).get(gpu_name)
+    if theoretical:
+        flops = min(flops, theoretical * 1e12)
+    return flops
 
-    Returns:
-        dict: Dictionary containing GPU information (number and names).
+def predict_compute_time(n, fp32_flops, num_gpus=1, merkle_rate=1e9):
     """
-    command = "/opt/conda/bin/python /tmp/miner_script.py --mode gpu_info"
-    stdin, stdout, stderr = ssh_client.exec_command(command)
+    Predicted wall time (seconds) of the compute step for matrices of size n.
 
-    output = stdout.read().decode().strip()
-    error = stderr.read().decode().strip()
+    The GPUs multiply in parallel, while the Merkle trees over the n x n float32 results are built
+    on the miner CPU, so their cost grows with the number of GPUs.
+    """
+    return 2 * n ** 3 / fp32_flops + num_gpus * 4 * n ** 2 / merkle_rate
 
-    if error:
-        raise RuntimeError(f"Failed to get GPU info: {error}")
+def select_matrix_size(vram, fp32_flops, time_budget, num_gpus=1, merkle_rate=1e9, max_size=0):
+    """
+    Pick the largest matrix size (multiple of 32) fitting in VRAM whose predicted compute time stays within the budget.
 
-    return json.loads(output)
\ No newline at end of file
+    :param vram: Reported VRAM in GB.
+    :param fp32_flops: FP32 throughput, see effective_fp32_flops.
+    :param time_budget: Target wall time of the compute step in seconds, 0 to size from the VRAM only.
+    :param max_size: Upper bound of the matrix size, 0 for no limit.
+    :return: Tuple of (n, predicted compute time in seconds).
+    """
+    vram_size = adjust_matrix_size(vram, element_size=4, buffer_factor=0.10)
+    if max_size:
+        vram_size = min(vram_size, (max_size // 32) * 32)
+    if time_budget <= 0:
+        n = vram_size
+    else:
+        # Largest multiple of 32 within the budget, the prediction grows with n
+        low, high = 1, max(vram_size // 32, 1)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if predict_compute_time(mid * 32, fp32_flops, num_gpus, merkle_rate) <= time_budget:
+                low = mid
+            else:
+                high = mid - 1
+        n = low * 32
+    return n, predict_compute_time(n, fp32_flops, num_gpus, merkle_rate)
@@ -0,0 +1,165 @@
+import bisect
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import bittensor as bt
+
+# Upper bounds (seconds) of the phase duration histogram buckets, +Inf is implicit
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+class PhaseTimer:
+    """Times one PoG phase; the outcome is "error" on exception unless set explicitly."""
+
+    __slots__ = ("metrics", "phase", "hotkey", "outcome", "start")
+
+    def __init__(self, metrics, phase, hotkey):
+        self.metrics = metrics
+        self.phase = phase
+        self.hotkey = hotkey
+        self.outcome = None
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        outcome = self.outcome or ("error" if exc_type is not None else "ok")
+        self.metrics.observe(self.phase, outcome, time.perf_counter() - self.start, self.hotkey)
+        return False
+
+
+class NullPhaseTimer:
+    """Stand-in returned while metrics are disabled, so instrumentation costs a method call."""
+
+    outcome = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_TIMER = NullPhaseTimer()
+
+
+class PogMetrics:
+    """
+    Per-phase latency histograms and counters of the Proof-of-GPU tests, with last-duration gauges per miner.
+
+    Rendered in the Prometheus text exposition format, optionally served over HTTP.
+    """
+
+    def __init__(self, enabled=False, buckets=DEFAULT_BUCKETS):
+        self.enabled = enabled
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # (phase, outcome) -> [bucket counts (+Inf last), sum, count]
+        self._histograms = {}
+        # (hotkey, phase) -> last duration in seconds
+        self._last_durations = {}
+        # hotkey -> (matrix size, predicted compute seconds, actual compute seconds) of the last test
+        self._sizing = {}
+        self._server = None
+
+    def phase(self, phase, hotkey=None):
+        """Context manager timing a phase of a miner test."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return PhaseTimer(self, phase, hotkey)
+
+    def observe(self, phase, outcome, seconds, hotkey=None):
+        if not self.enabled:
+            return
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            histogram = self._histograms.get((phase, outcome))
+            if histogram is None:
+                histogram = self._histograms[(phase, outcome)] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            histogram[0][index] += 1
+            histogram[1] += seconds
+            histogram[2] += 1
+            if hotkey is not None:
+                self._last_durations[(hotkey, phase)] = seconds
+
+    def record_sizing(self, hotkey, n, predicted, actual):
+        """Record the matrix size chosen for a miner with the predicted and actual compute times."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._sizing[hotkey] = (n, predicted, actual)
+
+    def render(self):
+        """Return the metrics in the Prometheus text exposition format."""
+        with self._lock:
+            histograms = {key: (list(value[0]), value[1], value[2]) for key, value in self._histograms.items()}
+            last_durations = dict(self._last_durations)
+            sizing = dict(self._sizing)
+
+        lines = [
+            "# HELP pog_phase_duration_seconds Duration of the Proof-of-GPU test phases.",
+            "# TYPE pog_phase_duration_seconds histogram",
+        ]
+        for (phase, outcome), (counts, total, count) in sorted(histograms.items()):
+            labels = f'phase="{phase}",outcome="{outcome}"'
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'pog_phase_duration_seconds_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f"pog_phase_duration_seconds_sum{{{labels}}} {total}")
+            lines.append(f"pog_phase_duration_seconds_count{{{labels}}} {count}")
+
+        lines.append("# HELP pog_phase_total Proof-of-GPU test phases run, by outcome.")
+        lines.append("# TYPE pog_phase_total counter")
+        for (phase, outcome), (_, _, count) in sorted(histograms.items()):
+            lines.append(f'pog_phase_total{{phase="{phase}",outcome="{outcome}"}} {count}')
+
+        lines.append("# HELP pog_miner_last_phase_duration_seconds Last duration of each phase per miner.")
+        lines.append("# TYPE pog_miner_last_phase_duration_seconds gauge")
+        for (hotkey, phase), seconds in sorted(last_durations.items()):
+            lines.append(f'pog_miner_last_phase_duration_seconds{{hotkey="{hotkey}",phase="{phase}"}} {seconds}')
+
+        for name, index, help_text in (
+            ("pog_miner_matrix_size", 0, "Matrix size of the last compute step per miner."),
+            ("pog_miner_compute_predicted_seconds", 1, "Predicted duration of the last compute step per miner."),
+            ("pog_miner_compute_seconds", 2, "Actual duration of the last compute step per miner."),
+        ):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            for hotkey, values in sorted(sizing.items()):
+                lines.append(f'{name}{{hotkey="{hotkey}"}} {values[index]}')
+        return "\n".join(lines) + "\n"
+
+    def start_server(self, port, host="127.0.0.1"):
+        """Serve the metrics on http://host:port/metrics from a daemon thread."""
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="th_pog_metrics", daemon=True).start()
+        bt.logging.info(f"PoG metrics served on http://{host}:{port}/metrics")
+
+    def close(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -0,0 +1,240 @@
+import asyncio
+import datetime
+import heapq
+import itertools
+import random
+import time
+
+
+class RetryScheduler:
+    """
+    Delay queue feeding the Proof-of-GPU workers.
+
+    Items are kept in a heap ordered by due time. Workers always pull the next ready item,
+    so a miner waiting for its retry no longer holds a worker slot while it sleeps.
+    """
+
+    def __init__(self, base_delay=5.0, max_delay=60.0, jitter=0.5):
+        """
+        :param base_delay: Delay before the first retry, doubled on every further attempt.
+        :param max_delay: Upper bound of the retry delay.
+        :param jitter: Fraction of the delay randomized so retries of failed miners do not line up.
+        """
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self._heap = []
+        self._counter = itertools.count()
+        self._condition = asyncio.Condition()
+        self._unfinished = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def backoff(self, attempt):
+        """Exponential backoff with jitter for the given attempt number (starting at 1)."""
+        delay = min(self.max_delay, self.base_delay * (2 ** max(attempt - 1, 0)))
+        return delay * (1 - self.jitter * random.random())
+
+    async def put(self, item, delay=0.0):
+        """Schedule an item to become ready after `delay` seconds."""
+        due = asyncio.get_running_loop().time() + delay
+        async with self._condition:
+            heapq.heappush(self._heap, (due, next(self._counter), item))
+            self._unfinished += 1
+            self._finished.clear()
+            self._condition.notify()
+
+    async def retry(self, item, attempt):
+        """Re-schedule a failed item with backoff and return the delay applied."""
+        delay = self.backoff(attempt)
+        await self.put(item, delay)
+        return delay
+
+    async def get(self):
+        """Wait for the next item whose due time has passed and return it."""
+        loop = asyncio.get_running_loop()
+        async with self._condition:
+            while True:
+                timeout = None
+                if self._heap:
+                    due = self._heap[0][0]
+                    now = loop.time()
+                    if due <= now:
+                        return heapq.heappop(self._heap)[2]
+                    timeout = due - now
+                try:
+                    # Wake up at the earliest due time, or earlier when a new item is scheduled
+                    await asyncio.wait_for(self._condition.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+
+    def task_done(self):
+        """Mark an item returned by get() as processed; retries must be scheduled before this call."""
+        if self._unfinished <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished -= 1
+        if self._unfinished == 0:
+            self._finished.set()
+
+    async def join(self):
+        """Wait until every scheduled item, retries included, has been processed."""
+        await self._finished.wait()
+
+
+def parse_pog_timestamp(created_at):
+    """Convert a pog_stats created_at value (sqlite CURRENT_TIMESTAMP, UTC) to a unix timestamp."""
+    try:
+        return datetime.datetime.strptime(created_at, "%Y-%m-%d %H:%M:%S").replace(tzinfo=datetime.timezone.utc).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def axon_fingerprint(axon):
+    return (axon.ip, axon.port, axon.version)
+
+
+class PogTestPlanner:
+    """
+    Decides which miners are due for a Proof-of-GPU test in the current round.
+
+    A miner is tested right away when it is new, its axon changed or its last test failed.
+    Otherwise its next test time grows with the number of identical successful results in a row,
+    and the round budget caps how many miners are tested, most urgent first.
+    """
+
+    def __init__(self, refresh_interval=4320, max_refresh_interval=34560, round_budget=0):
+        """
+        :param refresh_interval: Seconds before retesting a miner with a single successful result.
+        :param max_refresh_interval: Upper bound of the retest interval of stable miners.
+        :param round_budget: Maximum number of miners tested per round, 0 for no limit.
+        """
+        self.refresh_interval = refresh_interval
+        self.max_refresh_interval = max_refresh_interval
+        self.round_budget = round_budget
+        # Axon (ip, port, version) of each hotkey when it was last tested
+        self._tested_axons = {}
+
+    def next_test_time(self, history):
+        """
+        Return the unix time of the next test from a miner's results, newest first, or None to test now.
+        """
+        if not history:
+            return None
+        gpu_name, num_gpus, created_at = history[0]
+        last_test = parse_pog_timestamp(created_at)
+        if gpu_name is None or num_gpus is None or last_test is None:
+            return None
+        stable_count = 0
+        for entry in history:
+            if (entry[0], entry[1]) != (gpu_name, num_gpus):
+                break
+            stable_count += 1
+        interval = min(self.max_refresh_interval, self.refresh_interval * (2 ** (stable_count - 1)))
+        return last_test + interval
+
+    def plan(self, axons, history, now=None):
+        """
+        Select the miners to test in this round.
+
+        :param axons: Candidate axons, already filtered from allocated miners.
+        :param history: Results per hotkey as returned by get_pog_history.
+        :return: Tuple of (axons to test ordered by urgency, number of miners deferred).
+        """
+        now = time.time() if now is None else now
+        due = []
+        deferred = 0
+        for position, axon in enumerate(axons):
+            hotkey = axon.hotkey
+            miner_history = history.get(hotkey)
+            fingerprint = axon_fingerprint(axon)
+            if hotkey not in self._tested_axons and miner_history:
+                # Results from before a restart: trust them until the axon changes
+                self._tested_axons[hotkey] = fingerprint
+
+            if self._tested_axons.get(hotkey) != fingerprint:
+                # New miner or changed axon
+                due.append((0, 0.0, position, axon))
+                continue
+            next_test = self.next_test_time(miner_history)
+            if next_test is None:
+                # Last test failed or unusable history
+                due.append((1, 0.0, position, axon))
+            elif next_test <= now:
+                # Most overdue first
+                due.append((2, next_test - now, position, axon))
+            else:
+                deferred += 1
+
+        due.sort(key=lambda entry: entry[:3])
+        if self.round_budget and len(due) > self.round_budget:
+            deferred += len(due) - self.round_budget
+            due = due[: self.round_budget]
+        return [entry[3] for entry in due], deferred
+
+    def mark_tested(self, axon):
+        """Record the axon a miner was tested with, once its test succeeded or ran out of retries."""
+        self._tested_axons[axon.hotkey] = axon_fingerprint(axon)
+
+
+class PogCheckpoint:
+    """
+    Progress of a Proof-of-GPU session, kept when its SSH connection drops so a retry can resume it.
+
+    The allocation stays in place until the deadline, so the miner container and the proof stores it
+    left in /dev/shm can be reused instead of allocating, benchmarking and computing again.
+    """
+
+    # Phases in the order they are reached
+    ALLOCATED = "allocated"
+    BENCHMARKED = "benchmarked"
+    COMPUTED = "computed"
+    CHALLENGED = "challenged"
+    PHASES = (ALLOCATED, BENCHMARKED, COMPUTED, CHALLENGED)
+
+    def __init__(self, axon, miner_info, public_key, deadline):
+        """
+        :param axon: Axon the miner was allocated through.
+        :param miner_info: SSH credentials returned by the allocation.
+        :param public_key: Public key of the allocation, needed to deallocate the miner.
+        :param deadline: Unix time after which the session is no longer resumed.
+        """
+        self.axon = axon
+        self.miner_info = miner_info
+        self.public_key = public_key
+        self.deadline = deadline
+        self.phase = self.ALLOCATED
+        # Set once the benchmark phase is reached
+        self.benchmark = None
+        # Set once the compute phase is reached
+        self.seeds = None
+        self.n = None
+        self.root_hashes = None
+        self.gpu_timings = None
+        self.timing_passed = False
+        # Set once the challenge indices are sent, a resumed session must ask for the same ones
+        self.indices = None
+
+    def reached(self, phase):
+        return self.PHASES.index(self.phase) >= self.PHASES.index(phase)
+
+    def expired(self, now=None):
+        return (time.time() if now is None else now) >= self.deadline
+
+    def record_benchmark(self, **benchmark):
+        self.benchmark = benchmark
+        self.phase = self.BENCHMARKED
+
+    def record_compute(self, seeds, n, root_hashes, gpu_timings, timing_passed):
+        self.seeds = seeds
+        self.n = n
+        self.root_hashes = root_hashes
+        self.gpu_timings = gpu_timings
+        self.timing_passed = timing_passed
+        self.phase = self.COMPUTED
+
+    def record_indices(self, indices):
+        self.indices = indices
+        self.phase = self.CHALLENGED
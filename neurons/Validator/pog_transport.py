@@ -0,0 +1,352 @@
+import abc
+import asyncio
+import functools
+import time
+
+import bittensor as bt
+import paramiko
+
+from neurons.Validator.pog import (
+    REMOTE_AGENT_COMMAND,
+    AgentExitedError,
+    agent_compute_params,
+    agent_proof_params,
+    decode_agent_response,
+    encode_agent_request,
+    encode_bootstrap_payload,
+    check_fetch_size,
+    fetch_remote_files,
+    get_transfer_stats,
+    parse_agent_benchmark,
+    parse_agent_bootstrap,
+)
+
+try:
+    import asyncssh
+except ImportError:  # asyncssh is optional, the paramiko transport is used without it
+    asyncssh = None
+
+# Errors of a dropped or unreachable SSH session, after which a PoG session may be resumed
+TRANSIENT_ERRORS = (OSError, EOFError, asyncio.TimeoutError, paramiko.SSHException, AgentExitedError)
+if asyncssh is not None:
+    TRANSIENT_ERRORS += (asyncssh.Error,)
+
+# Seconds an agent command may take, write and response included, before the session is aborted
+AGENT_TIMEOUTS = {"bootstrap": 120, "gpu_info": 30, "benchmark": 120, "compute": 240, "proof": 60, "exit": 5}
+DEFAULT_AGENT_TIMEOUT = 60
+
+
+async def run_blocking(executor, func, *args, **kwargs):
+    """Run a blocking call in the given executor (None for the loop default one) and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+
+class PogAgentClient:
+    """
+    Awaitable client of the miner script agent mode, independent of the SSH backend.
+
+    The transport provides an agent channel exposing write_line, read_line and read_error coroutines and a
+    close method. Every command is bounded by its deadline in timeouts; when it expires or the command is
+    cancelled, the channel is closed at once so a read still blocked on it returns.
+    """
+
+    def __init__(self, channel, timeouts=None):
+        """
+        :param channel: Agent channel of the transport.
+        :param timeouts: Seconds per command overriding AGENT_TIMEOUTS.
+        """
+        self.channel = channel
+        self.timeouts = dict(AGENT_TIMEOUTS, **(timeouts or {}))
+        self.closed = False
+
+    async def request(self, cmd, **params):
+        return await self._exchange(cmd, encode_agent_request(cmd, **params))
+
+    async def _exchange(self, cmd, data):
+        timeout = self.timeouts.get(cmd, DEFAULT_AGENT_TIMEOUT)
+        try:
+            line, error = await asyncio.wait_for(self._round_trip(data), timeout)
+        except asyncio.TimeoutError as e:
+            self.abort()
+            raise asyncio.TimeoutError(f"Agent command '{cmd}' timed out after {timeout} s.") from e
+        except BaseException:
+            self.abort()
+            raise
+        if not line:
+            # The agent exited, nothing more can be asked of it
+            self.abort()
+        return decode_agent_response(cmd, line, error)
+
+    async def _round_trip(self, data):
+        await self.channel.write_line(data)
+        line = await self.channel.read_line()
+        error = await self.channel.read_error() if not line else ""
+        return line, error
+
+    async def bootstrap(self, script, benchmark=True):
+        """
+        Upload the miner script to an agent started with REMOTE_BOOTSTRAP_COMMAND and run the bootstrap command.
+
+        The script and the request are written at once, so the upload, the hash, the GPU info and the
+        benchmark cost a single round trip.
+
+        :return: Tuple of (script hash, gpu info, benchmark) as returned by parse_agent_bootstrap.
+        """
+        data = encode_bootstrap_payload(script) + encode_agent_request("bootstrap", benchmark=benchmark)
+        return parse_agent_bootstrap(await self._exchange("bootstrap", data))
+
+    async def get_gpu_info(self):
+        return await self.request("gpu_info")
+
+    async def run_benchmark(self):
+        return parse_agent_benchmark(await self.request("benchmark"))
+
+    async def run_compute(self, seeds, n):
+        response = await self.request("compute", **agent_compute_params(seeds, n))
+        return response["root_hashes"], response["timings"]
+
+    async def run_proof(self, indices):
+        await self.request("proof", **agent_proof_params(indices))
+
+    def abort(self):
+        """Close the channel without asking the agent to exit, which also unblocks a pending read."""
+        if not self.closed:
+            self.closed = True
+            self.channel.close()
+
+    async def close(self):
+        try:
+            if not self.closed:
+                await self.request("exit")
+        except Exception:
+            pass
+        finally:
+            self.abort()
+
+
+class PogTransport(abc.ABC):
+    """
+    Interface of the SSH transports used by the Proof-of-GPU pipeline.
+
+    Every step is a coroutine so a single event loop can drive many miner sessions concurrently. A transport
+    missing one of the abstract methods fails when it is instantiated.
+    """
+
+    name = "base"
+
+    @abc.abstractmethod
+    async def connect(self, host, port, username, password, timeout=10):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def put(self, local_path, remote_path):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def exec(self, command):
+        """Run a command and return its (stdout, stderr) as stripped strings."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def start_agent(self, command=REMOTE_AGENT_COMMAND, timeouts=None):
+        """Start the miner script agent and return a PogAgentClient with the given command timeouts."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def fetch(self, remote_paths, max_size=None):
+        """
+        Fetch several remote files into memory, see fetch_remote_files for the return value.
+
+        :raises ValueError: If a file is larger than max_size bytes.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def close(self):
+        raise NotImplementedError
+
+
+class ParamikoAgentChannel:
+    def __init__(self, stdin, stdout, stderr, executor=None):
+        self.stdin, self.stdout, self.stderr = stdin, stdout, stderr
+        self.executor = executor
+
+    def _write(self, line):
+        self.stdin.write(line)
+        self.stdin.flush()
+
+    def _read_line(self):
+        return self.stdout.readline()
+
+    def _read_error(self):
+        return self.stderr.read().decode(errors="replace")
+
+    async def write_line(self, line):
+        await run_blocking(self.executor, self._write, line)
+
+    async def read_line(self):
+        return await run_blocking(self.executor, self._read_line)
+
+    async def read_error(self):
+        return await run_blocking(self.executor, self._read_error)
+
+    def close(self):
+        # Closing the paramiko channel wakes the executor threads blocked reading it. The files are dropped so they
+        # are freed once those reads return: left to the garbage collector in the reference cycle of an aborted
+        # read, paramiko's BufferedFile.__del__ can run after its own buffer was finalized and fail
+        self.stdin.channel.close()
+        self.stdin = self.stdout = self.stderr = None
+
+
+class ParamikoTransport(PogTransport):
+    """
+    The blocking paramiko client, with each call run in a thread of the given executor.
+
+    A session parks a thread for as long as the agent computes, so the executor should have one thread
+    per concurrent session; it is kept apart from the loop default executor used by unrelated work.
+    """
+
+    name = "paramiko"
+
+    def __init__(self, executor=None):
+        self.ssh_client = None
+        self.executor = executor
+
+    async def connect(self, host, port, username, password, timeout=10):
+        self.ssh_client = paramiko.SSHClient()
+        self.ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        await run_blocking(self.executor, self.ssh_client.connect, host, port=port, username=username, password=password, timeout=timeout)
+
+    async def put(self, local_path, remote_path):
+        def put():
+            with self.ssh_client.open_sftp() as sftp:
+                sftp.put(local_path, remote_path)
+
+        await run_blocking(self.executor, put)
+
+    async def exec(self, command):
+        def run():
+            stdin, stdout, stderr = self.ssh_client.exec_command(command)
+            # The command reads no input, send EOF right away instead of when stdin is garbage collected
+            stdin.channel.shutdown_write()
+            return stdout.read().decode().strip(), stderr.read().decode().strip()
+
+        return await run_blocking(self.executor, run)
+
+    async def start_agent(self, command=REMOTE_AGENT_COMMAND, timeouts=None):
+        stdin, stdout, stderr = await run_blocking(self.executor, self.ssh_client.exec_command, command)
+        return PogAgentClient(ParamikoAgentChannel(stdin, stdout, stderr, self.executor), timeouts)
+
+    async def fetch(self, remote_paths, max_size=None):
+        def fetch():
+            with self.ssh_client.open_sftp() as sftp:
+                return fetch_remote_files(sftp, remote_paths, max_size)
+
+        return await run_blocking(self.executor, fetch)
+
+    async def close(self):
+        if self.ssh_client:
+            self.ssh_client.close()
+
+
+class AsyncSSHAgentChannel:
+    def __init__(self, process):
+        self.process = process
+
+    async def write_line(self, line):
+        self.process.stdin.write(line)
+        await self.process.stdin.drain()
+
+    async def read_line(self):
+        return await self.process.stdout.readline()
+
+    async def read_error(self):
+        return await self.process.stderr.read()
+
+    def close(self):
+        self.process.close()
+
+
+class AsyncSSHTransport(PogTransport):
+    """Asyncio-native transport built on asyncssh; no thread is parked while waiting on the network."""
+
+    name = "asyncssh"
+
+    def __init__(self):
+        self.conn = None
+
+    async def connect(self, host, port, username, password, timeout=10):
+        self.conn = await asyncssh.connect(
+            host,
+            port=port,
+            username=username,
+            password=password,
+            known_hosts=None,
+            connect_timeout=timeout,
+        )
+
+    async def put(self, local_path, remote_path):
+        async with self.conn.start_sftp_client() as sftp:
+            await sftp.put(local_path, remote_path)
+
+    async def exec(self, command):
+        result = await self.conn.run(command, check=False)
+        return (result.stdout or "").strip(), (result.stderr or "").strip()
+
+    async def start_agent(self, command=REMOTE_AGENT_COMMAND, timeouts=None):
+        process = await self.conn.create_process(command)
+        return PogAgentClient(AsyncSSHAgentChannel(process), timeouts)
+
+    async def fetch(self, remote_paths, max_size=None):
+        buffers = {}
+        transfer_stats = {}
+
+        async with self.conn.start_sftp_client() as sftp:
+
+            async def fetch_one(key, remote_path):
+                try:
+                    async with sftp.open(remote_path, "rb") as remote_file:
+                        file_size = (await remote_file.stat()).size
+                        check_fetch_size(remote_path, file_size, max_size)
+                        start_time = time.time()
+                        # Bounded by the checked size, even if the file grows in the meantime
+                        buffers[key] = await remote_file.read(file_size)
+                    transfer_stats[key] = get_transfer_stats(len(buffers[key]), time.time() - start_time)
+                except ValueError:
+                    raise
+                except Exception as e:
+                    bt.logging.trace(f"[Fetch] Failed to read {remote_path}: {e}")
+                    buffers[key] = None
+
+            # All files are read concurrently over the same SFTP session
+            await asyncio.gather(*(fetch_one(key, remote_path) for key, remote_path in remote_paths.items()))
+
+        return buffers, transfer_stats
+
+    async def close(self):
+        if self.conn:
+            self.conn.close()
+            try:
+                await asyncio.wait_for(self.conn.wait_closed(), AGENT_TIMEOUTS["exit"])
+            except asyncio.TimeoutError:
+                self.conn.abort()
+
+
+def is_transient_error(error):
+    """Return True if an exception of a PoG session comes from the SSH connection rather than the miner's answers."""
+    return isinstance(error, TRANSIENT_ERRORS)
+
+
+def create_transport(backend="paramiko", executor=None):
+    """
+    Create the SSH transport for a PoG session.
+
+    :param backend: "paramiko" or "asyncssh"; asyncssh falls back to paramiko when it is not installed.
+    :param executor: Thread pool running the blocking calls of the paramiko transport.
+    """
+    if backend == "asyncssh":
+        if asyncssh is not None:
+            return AsyncSSHTransport()
+        bt.logging.warning("asyncssh is not installed, falling back to the paramiko transport.")
+    return ParamikoTransport(executor)
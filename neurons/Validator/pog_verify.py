@@ -0,0 +1,153 @@
+import hashlib
+
+import numpy as np
+
+# Verification kernels of the Proof-of-GPU, run in the verification process pool: only NumPy and hashlib
+# are imported so the spawned workers unpickle check_gpu_response without loading torch or bittensor.
+
+
+def xorshift32_numpy_array(x, scratch=None):
+    """
+    Apply one xorshift32 round in place to a uint64 array of 32-bit states.
+
+    Bit-identical to xorshift32_torch in the miner script, but runs as a handful of
+    NumPy array operations instead of one Python call per element.
+    """
+    mask = np.uint64(0xFFFFFFFF)
+    if scratch is None:
+        scratch = np.empty_like(x)
+    x &= mask
+    np.left_shift(x, np.uint64(13), out=scratch)
+    scratch &= mask
+    x ^= scratch
+    np.right_shift(x, np.uint64(17), out=scratch)
+    x ^= scratch
+    np.left_shift(x, np.uint64(5), out=scratch)
+    scratch &= mask
+    x ^= scratch
+    return x
+
+
+def generate_prng_array(s, i, j):
+    """
+    Regenerate elements of the PRNG matrix of the miner script for broadcastable index arrays.
+
+    Parameters:
+        s (int): Seed of the matrix.
+        i (int or np.ndarray): Row indices.
+        j (int or np.ndarray): Column indices.
+
+    Returns:
+        np.ndarray: float32 values, bit-identical to generate_matrix_torch(s, n)[i, j].
+    """
+    mask = np.uint64(0xFFFFFFFF)
+    # Only the low 32 bits of s + i + j survive the mask, so reduce the seed first to stay overflow free
+    s_low = np.uint64(int(s) & 0xFFFFFFFF)
+    i = np.asarray(i, dtype=np.uint64) & mask
+    j = np.asarray(j, dtype=np.uint64) & mask
+    states = np.array((s_low + i) + j, dtype=np.uint64)
+    states &= mask
+
+    scratch = np.empty_like(states)
+    for _ in range(10):
+        xorshift32_numpy_array(states, scratch)
+
+    # Matches torch: int64 -> float32 cast, then division by float32(0xFFFFFFFF)
+    return states.astype(np.float32) / np.float32(0xFFFFFFFF)
+
+
+def generate_prng_row(s, i, n):
+    """Regenerate row i of the n x n PRNG matrix seeded with s."""
+    return generate_prng_array(s, i, np.arange(n, dtype=np.uint64))
+
+
+def generate_prng_col(s, j, n):
+    """Regenerate column j of the n x n PRNG matrix seeded with s."""
+    return generate_prng_array(s, np.arange(n, dtype=np.uint64), j)
+
+
+def verify_merkle_proofs_rows(rows, proofs, root_hash, indices, total_leaves, hash_func=hashlib.sha256):
+    """
+    Verifies the Merkle proofs of several rows level by level in a single pass.
+
+    Parameters:
+    - rows (np.ndarray): The (k x n) data rows to verify.
+    - proofs (list of list of bytes or np.ndarray): The sibling hashes of each row.
+    - root_hash (bytes): The root hash of the Merkle tree.
+    - indices (np.ndarray): The index of each row in the tree.
+    - total_leaves (int): The total number of leaves in the Merkle tree.
+    - hash_func (callable): The hash function to use (default: hashlib.sha256).
+
+    Returns:
+    - np.ndarray: Boolean array, True where the proof of the row is valid.
+    """
+    computed_hashes = [hash_func(row.tobytes()).digest() for row in rows]
+    idx = [int(i) for i in indices]
+    depth = max((len(proof) for proof in proofs), default=0)
+
+    for level in range(depth):
+        for k, proof in enumerate(proofs):
+            if level >= len(proof):
+                continue
+            sibling_hash = bytes(proof[level])
+            if idx[k] % 2 == 0:
+                combined = computed_hashes[k] + sibling_hash
+            else:
+                combined = sibling_hash + computed_hashes[k]
+            computed_hashes[k] = hash_func(combined).digest()
+            idx[k] //= 2
+
+    return np.array([computed_hash == root_hash for computed_hash in computed_hashes], dtype=bool)
+
+
+def check_gpu_response(s_A, s_B, root_hash, response, gpu_indices, n):
+    """
+    Verifies all challenge indices of a single GPU in one batch.
+
+    The k requested rows of A and columns of B are regenerated as two (k x n) PRNG matrices,
+    every expected C_ij is computed with a single einsum and the k Merkle proofs are walked
+    up the tree together.
+
+    Parameters:
+        s_A (int): Seed of matrix A.
+        s_B (int): Seed of matrix B.
+        root_hash (str): Hex encoded Merkle root reported by the GPU.
+        response (dict): Response of the GPU containing the computed rows and proofs.
+        gpu_indices (list): List of (i, j) challenge indices.
+        n (int): Total number of leaves in the Merkle tree.
+
+    Returns:
+        str: None if every value and every Merkle proof is valid, otherwise the reason of the failure.
+    """
+    if response is None:
+        return "Missing response."
+
+    challenge = np.asarray(gpu_indices, dtype=np.int64).reshape(-1, 2)
+    i_indices, j_indices = challenge[:, 0], challenge[:, 1]
+    k = len(challenge)
+
+    rows = np.asarray(response['rows'])
+    proofs = response['proofs']
+    if rows.shape != (k, n) or len(proofs) != k:
+        return f"Malformed response of shape {rows.shape}."
+
+    # Regenerate the needed rows of A and columns of B as (k x n) matrices
+    positions = np.arange(n, dtype=np.uint64)
+    A_rows = generate_prng_array(s_A, i_indices[:, None], positions[None, :])
+    B_cols = generate_prng_array(s_B, positions[None, :], j_indices[:, None])
+
+    # C_{i,j} is the dot product of A_row and B_col, computed for all indices at once
+    values_validator = np.einsum('kn,kn->k', A_rows, B_cols)
+    values_miner = rows[np.arange(k), j_indices]
+
+    value_mismatch = ~np.isclose(values_miner, values_validator, atol=1e-5)
+    if value_mismatch.any():
+        i, j = challenge[np.argmax(value_mismatch)]
+        return f"Value mismatch at index ({i}, {j})."
+
+    proofs_valid = verify_merkle_proofs_rows(rows, proofs, bytes.fromhex(root_hash), i_indices, n)
+    if not proofs_valid.all():
+        i = i_indices[np.argmin(proofs_valid)]
+        return f"Invalid Merkle proof at index ({i})."
+
+    return None
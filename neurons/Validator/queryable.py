@@ -0,0 +1,110 @@
+import threading
+
+import bittensor as bt
+import numpy as np
+
+from compute.utils.math import percent
+
+
+class QueryableMask:
+    """
+    Boolean arrays over the metagraph positions telling which miners the validator queries.
+
+    valid: serving an IP and neither blacklisted nor a suspected exploiter.
+    deduplicated: valid and the first of its IP address.
+    queryable: deduplicated and running an allowed miner version.
+    """
+
+    def __init__(self, uids, axons, ip_valid, blacklisted, exploiter, unique_ip, version_ok):
+        self.uids = uids
+        self.axons = axons
+        self.ip_valid = ip_valid
+        self.blacklisted = blacklisted
+        self.exploiter = exploiter
+        self.unique_ip = unique_ip
+        self.version_ok = version_ok
+        self.valid = ip_valid & ~blacklisted & ~exploiter
+        self.deduplicated = self.valid & unique_ip
+        self.queryable = self.deduplicated & version_ok
+        self.total_current_miners = int(self.valid.sum())
+        self._queryable_axons = None
+
+    def valid_axons(self):
+        """(uid, axon) of the valid miners."""
+        return [(int(self.uids[position]), self.axons[position]) for position in np.flatnonzero(self.valid)]
+
+    def queryable_axons(self):
+        """uid -> axon of the queryable miners, built once per mask."""
+        if self._queryable_axons is None:
+            self._queryable_axons = {int(self.uids[position]): self.axons[position] for position in np.flatnonzero(self.queryable)}
+        return dict(self._queryable_axons)
+
+
+class QueryableMaskEngine:
+    """
+    Builds the QueryableMask of a metagraph in one pass over its arrays, cached per metagraph block.
+
+    The mask is rebuilt only when the metagraph has synced a newer block or the minimal miner version changed,
+    so the PoG queue, the scoring and the weights all share the same mask within a block.
+    """
+
+    def __init__(self, blacklist_hotkeys, blacklist_coldkeys, exploiters_hotkeys, exploiters_coldkeys, whitelist_updated_threshold):
+        self.blacklist_hotkeys = list(blacklist_hotkeys)
+        self.blacklist_coldkeys = list(blacklist_coldkeys)
+        self.exploiters_hotkeys = list(exploiters_hotkeys)
+        self.exploiters_coldkeys = list(exploiters_coldkeys)
+        self.whitelist_updated_threshold = whitelist_updated_threshold
+        self._lock = threading.Lock()
+        self._key = None
+        self._mask = None
+
+    def get(self, metagraph, latest_version):
+        """
+        Return the mask of the metagraph and whether it was rebuilt by this call.
+
+        :param latest_version: Minimal miner version as a number, 0 or None when unknown.
+        """
+        key = (int(metagraph.block), len(metagraph.uids), latest_version)
+        with self._lock:
+            if self._key == key:
+                return self._mask, False
+            mask = self.build(metagraph, latest_version)
+            self._key, self._mask = key, mask
+            return mask, True
+
+    def build(self, metagraph, latest_version):
+        uids = np.asarray(metagraph.uids)
+        axons = list(metagraph.axons)
+        hotkeys = np.asarray(metagraph.hotkeys, dtype=str)
+        coldkeys = np.asarray(metagraph.coldkeys, dtype=str)
+        ips = np.asarray([axon.ip for axon in axons], dtype=str)
+        versions = np.asarray([axon.version for axon in axons], dtype=np.int64)
+
+        ip_valid = ips != "0.0.0.0"
+        blacklisted = np.isin(coldkeys, self.blacklist_coldkeys) | np.isin(hotkeys, self.blacklist_hotkeys)
+        exploiter = np.isin(coldkeys, self.exploiters_coldkeys) | np.isin(hotkeys, self.exploiters_hotkeys)
+        valid = ip_valid & ~blacklisted & ~exploiter
+
+        # Keep the first valid miner of each IP address
+        unique_ip = np.zeros(len(uids), dtype=bool)
+        valid_positions = np.flatnonzero(valid)
+        _, first = np.unique(ips[valid_positions], return_index=True)
+        unique_ip[valid_positions[first]] = True
+
+        num_valid = int(valid.sum())
+        num_deduplicated = int((valid & unique_ip).sum())
+        if percent(num_deduplicated, num_valid) <= self.whitelist_updated_threshold:
+            bt.logging.info(f"Less than {self.whitelist_updated_threshold}% miners are currently using the last version. Allowing all.")
+            version_ok = np.ones(len(uids), dtype=bool)
+        elif latest_version:
+            version_ok = versions >= latest_version
+        else:
+            version_ok = np.zeros(len(uids), dtype=bool)
+
+        mask = QueryableMask(uids, axons, ip_valid, blacklisted, exploiter, unique_ip, version_ok)
+        bt.logging.trace(
+            f"Queryable mask at block {int(metagraph.block)}: {int(ip_valid.sum())} serving, "
+            f"{int((blacklisted & ip_valid).sum())} blacklisted, {int((exploiter & ip_valid).sum())} exploiters, "
+            f"{num_valid - num_deduplicated} duplicate IPs, {int(mask.queryable.sum())} queryable."
+        )
+        return mask
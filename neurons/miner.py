@@ -42,13 +42,14 @@ from compute.utils.socket import check_port
 from compute.utils.subtensor import (
     is_registered,
     get_current_block,
+    get_valid_validators,
     calculate_next_block_time,
 )
 from compute.utils.version import (
     check_hashcat_version,
     try_update,
     version2number,
-    get_remote_version,
+    get_cached_remote_version,
 )
 from neurons.Miner.allocate import (
     check_allocation,
@@ -519,7 +520,7 @@ class Miner:
             self.whitelist_hotkeys_version.clear()
             try:
                 latest_version = version2number(
-                    get_remote_version(pattern="__minimal_validator_version__")
+                    get_cached_remote_version(pattern="__minimal_validator_version__")
                 )
 
                 if latest_version is None:
@@ -571,31 +572,13 @@ class Miner:
             bt.logging.error(traceback.format_exc())
 
     def get_valid_validator_uids(self):
-        valid_uids = []
-        uids = self.metagraph.uids.tolist()
-        for index, uid in enumerate(uids):
-            if self.metagraph.total_stake[index] > validator_permit_stake:
-                valid_uids.append(uid)
-        return valid_uids
+        return [uid for uid, _, _ in get_valid_validators(self.metagraph, validator_permit_stake)]
 
     def get_valid_validator(self) -> typing.List[typing.Tuple[int, str, int]]:
-        valid_validator_uids = self.get_valid_validator_uids()
-        valid_validator = []
-        for uid in valid_validator_uids:
-            neuron = self.subtensor.neuron_for_uid(uid, self.config.netuid)
-            hotkey = neuron.hotkey
-            version = neuron.prometheus_info.version
-            valid_validator.append((uid, hotkey, version))
-        return valid_validator
+        return get_valid_validators(self.metagraph, validator_permit_stake)
 
     def get_valid_validator_hotkeys(self):
-        valid_hotkeys = []
-        valid_validator_uids = self.get_valid_validator_uids()
-        for uid in valid_validator_uids:
-            neuron = self.subtensor.neuron_for_uid(uid, self.config.netuid)
-            hotkey = neuron.hotkey
-            valid_hotkeys.append(hotkey)
-        return valid_hotkeys
+        return [hotkey for _, hotkey, _ in get_valid_validators(self.metagraph, validator_permit_stake)]
 
     def next_info(self, cond, next_block):
         if cond:
@@ -7,7 +7,7 @@ import base64
 import RSAEncryption as rsa
 import bittensor as bt
 import paramiko  # For SSH functionality
-from compute.protocol import Allocate  # Allocate is still needed for the actual allocation process
+from compute.utils.dendrite import get_dendrite_pool  # Shared dendrite for the allocate/deallocate queries
 from compute.wandb.wandb import ComputeWandb  # Importing ComputeWandb
 
 VALID_VALIDATOR_HOTKEYS = ["5GmvyePN9aYErXBBhBnxZKGoGk4LKZApE4NkaSzW62CYCYNA"]
@@ -22,6 +22,7 @@ class MinerChecker:
         self.wandb = ComputeWandb(config, bt.wallet(config=config), "validator.py") # Added ComputeWandb integration
         self.penalized_hotkeys_checklist = [] # List of dictionaries for penalized miners
         self.allocated_hotkeys = []  # Allocated miners that shouldn't be checked
+        self.dendrite_pool = get_dendrite_pool(bt.wallet(config=config))  # Shared by all checking threads
 
     def get_metagraph(self): 
         """Retrieves the metagraph from subtensor.""" 
@@ -83,24 +84,23 @@ class MinerChecker:
 
     def miner_checking_thread(self, axon): 
         """Handles allocation, SSH access, and deallocation of a miner.""" 
-        wallet = bt.wallet(config=self.config) 
-        dendrite = bt.dendrite(wallet=wallet) 
+        dendrite_pool = self.dendrite_pool
         bt.logging.info(f"Quering for miner: {axon.hotkey}") 
 
         is_ssh_access = True 
         allocation_status = False 
-        private_key, public_key = rsa.generate_key_pair() 
+        private_key, public_key = rsa.get_key_pair()
 
         device_requirement = {"cpu": {"count": 1}, "gpu": {}, "hard_disk": {"capacity": 1073741824}, "ram": {"capacity": 1073741824}, "testing": True}
 
         try:
-            check_allocation = dendrite.query(axon, Allocate(timeline=30, device_requirement=device_requirement, checking=True,), timeout=30)
+            check_allocation = dendrite_pool.run(dendrite_pool.check_allocation(axon, device_requirement, timeline=30, timeout=30))
 
-            if check_allocation and check_allocation["status"] is True:
+            if check_allocation:
                 bt.logging.info(f"Successfully passed allocaton check: miner {axon.hotkey}")
                 # Simulate an allocation query with Allocate
-                response = dendrite.query(axon, Allocate(timeline=1, device_requirement=device_requirement, checking=False, public_key=public_key), timeout=60)
-                if response and response["status"] is True:
+                response = dendrite_pool.run(dendrite_pool.allocate(axon, device_requirement, public_key, timeline=1, timeout=60))
+                if response:
                     allocation_status = True
                     bt.logging.info(f"Successfully allocated miner {axon.hotkey}")
                     private_key = private_key.encode("utf-8")
@@ -118,31 +118,11 @@ class MinerChecker:
             bt.logging.error(f"Error during allocation for {axon.hotkey}: {e}")
             self.penalize_miner(axon.hotkey, "ALLOCATION_ERROR", f"Error during allocation: {str(e)}")
 
-        # Deallocate resources if allocated, with a max retry count of 3
-        retry_count = 0 
-        max_retries = 3 
-        while allocation_status and retry_count < max_retries: 
-            try:
-                # Deallocation query
-                deregister_response = dendrite.query(axon, Allocate(timeline=0, checking=False, public_key=public_key), timeout=60) 
-                if deregister_response and deregister_response["status"] is True: 
-                    allocation_status = False
-                    bt.logging.info(f"Deallocated miner {axon.hotkey}") 
-                    break 
-                else: 
-                    retry_count += 1
-                    bt.logging.error(f"Failed to deallocate miner {axon.hotkey} (attempt {retry_count}/{max_retries})") 
-                    if retry_count >= max_retries: 
-                        bt.logging.error(f"Max retries reached for deallocating miner {axon.hotkey}.")
-                        self.penalize_miner(axon.hotkey, "DEALLOCATION_FAILED", "Failed to deallocate after max retries") 
-                    time.sleep(5)
-            except Exception as e: 
-                retry_count += 1 
-                bt.logging.error(f"Error while trying to deallocate miner {axon.hotkey} (attempt {retry_count}/{max_retries}): {e}") 
-                if retry_count >= max_retries:
-                    bt.logging.error(f"Max retries reached for deallocating miner {axon.hotkey}.") 
-                    self.penalize_miner(axon.hotkey, "DEALLOCATION_FAILED", "Failed to deallocate after max retries")
-                time.sleep(5)
+        # Deallocate resources if allocated, with a max retry count of 3 and backoff on the pool loop
+        if allocation_status:
+            if not dendrite_pool.run(dendrite_pool.deallocate(axon, public_key, max_retries=3, retry_delay=5, timeout=60)):
+                bt.logging.error(f"Max retries reached for deallocating miner {axon.hotkey}.")
+                self.penalize_miner(axon.hotkey, "DEALLOCATION_FAILED", "Failed to deallocate after max retries")
 
         if not is_ssh_access:
             # Penalize if SSH access fails
@@ -172,6 +152,7 @@ def get_config():
     """Set up configuration using argparse.""" 
     parser = argparse.ArgumentParser() 
     parser.add_argument("--netuid", type=int, default=1, help="The chain subnet uid.") 
+    parser.add_argument("--rsa.key.pool.size", type=int, dest="rsa_key_pool_size", default=32, help="Number of RSA key pairs pre-generated for the allocation handshakes.")
     bt.subtensor.add_args(parser) 
     bt.logging.add_args(parser) 
     bt.wallet.add_args(parser) 
@@ -183,12 +164,16 @@ def get_config():
 def main(): 
     """Main function to run the miner checker loop.""" 
     config = get_config() 
+    rsa.start_key_pair_pool(config.rsa_key_pool_size)
     miner_checker = MinerChecker(config)
 
-    while True: 
-        miner_checker.sync_checklist() 
-        bt.logging.info("Sleeping before next loop...") 
-        time.sleep(900) # Sleep for 10 minutes before re-checking miners
+    try:
+        while True: 
+            miner_checker.sync_checklist() 
+            bt.logging.info("Sleeping before next loop...") 
+            time.sleep(900) # Sleep for 10 minutes before re-checking miners
+    finally:
+        rsa.stop_key_pair_pool()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -50,6 +50,7 @@ import RSAEncryption as rsa
 from compute.axon import ComputeSubnetSubtensor
 from compute.protocol import Allocate
 from compute.utils.db import ComputeDb
+from compute.utils.dendrite import get_dendrite_pool
 from compute.utils.parser import ComputeArgPaser
 from compute.wandb.wandb import ComputeWandb
 from neurons.Validator.database.allocate import (
@@ -264,8 +265,9 @@ class RegisterAPI:
             bt.logging.info(f"Subtensor: {self.subtensor}")
 
             # Dendrite is the RPC client; it lets us send messages to other nodes (axons) in the network.
-            self.dendrite = bt.dendrite(wallet=self.wallet)
-            self.dendrite_check = bt.dendrite(wallet=self.wallet)
+            # Both share the long-lived pooled dendrite of the wallet instead of a new session per query.
+            self.dendrite = get_dendrite_pool(self.wallet)
+            self.dendrite_check = self.dendrite
             bt.logging.info(f"Dendrite: {self.dendrite}")
             bt.logging.info(f"Dendrite_check: {self.dendrite_check}")
 
@@ -361,6 +363,8 @@ class RegisterAPI:
             This function is called when the application starts. <br>
             It initializes the database connection and other necessary components. <br>
             """
+            # Pre-generate the single-use key pairs of the allocation handshakes in a background process
+            rsa.start_key_pair_pool(self.config.get("rsa_key_pool_size", 32))
             # Setup the repeated task
             self.metagraph_task = asyncio.create_task(self._refresh_metagraph())
             self.allocate_check_task = asyncio.create_task(self._check_allocation())
@@ -371,7 +375,7 @@ class RegisterAPI:
             """
             This function is called when the application stops. <br>
             """
-            pass
+            rsa.stop_key_pair_pool()
 
         # Entry point for the API
         @self.app.get("/", tags=["Root"])
@@ -454,7 +458,7 @@ class RegisterAPI:
                 uuid_key = str(uuid.uuid1())
 
                 timeline = int(requirements.timeline)
-                private_key, public_key = rsa.generate_key_pair()
+                private_key, public_key = rsa.get_key_pair()
                 run_start = time.time()
                 result = await run_in_threadpool(self._allocate_container, device_requirement,
                                                  timeline, public_key, docker_requirement.dict())
@@ -600,7 +604,7 @@ class RegisterAPI:
                 # Generate UUID
                 uuid_key = str(uuid.uuid1())
 
-                private_key, public_key = rsa.generate_key_pair()
+                private_key, public_key = rsa.get_key_pair()
 
                 if docker_requirement is None:
                     docker_requirement = DockerRequirement()
@@ -763,7 +767,7 @@ class RegisterAPI:
                                 # deregister_response = await run_in_threadpool(
                                 #     self.dendrite.query, axon, allocate_class, timeout=60
                                 # )
-                                deregister_response = self.dendrite.query(axon, allocate_class, timeout=60)
+                                deregister_response = await self.dendrite.forward(axon, allocate_class, timeout=60)
                                 run_end = time.time()
                                 time_eval = run_end - run_start
                                 # bt.logging.info(f"API: Stop docker container in: {run_end - run_start:.2f} seconds")
@@ -2694,6 +2698,13 @@ class RegisterAPI:
         bt.subtensor.add_args(parser)
         bt.logging.add_args(parser)
         bt.wallet.add_args(parser)
+        parser.add_argument(
+            "--rsa.key.pool.size",
+            type=int,
+            dest="rsa_key_pool_size",
+            default=32,
+            help="Number of RSA key pairs pre-generated for the allocation handshakes.",
+        )
 
         if not user_config.subtensor_chain_endpoint:
             if user_config.subtensor_network == "finney":
@@ -3020,9 +3031,7 @@ class RegisterAPI:
                         axon = self.metagraph.axons[index]
 
                         register_response = await asyncio.wait_for(
-                                asyncio.get_event_loop().run_in_executor(
-                                    self.executor, self.dendrite_check.query, axon, Allocate(timeline=1,checking=True)
-                                    ),
+                                self.dendrite_check.forward(axon, Allocate(timeline=1,checking=True)),
                                 timeout=30
                         )
                         deallocated_at = datetime.now(timezone.utc)
@@ -34,7 +34,6 @@ from typing import Dict, Tuple, List
 import bittensor as bt
 import math
 import time
-import paramiko
 
 import cryptography
 import torch
@@ -53,19 +52,25 @@ from compute import (
     weights_rate_limit
     )
 from compute.axon import ComputeSubnetSubtensor
-from compute.protocol import Allocate, Challenge, Specs
+from compute.protocol import Challenge, Specs
 from compute.utils.db import ComputeDb
-from compute.utils.math import percent, force_to_float_or_default
+from compute.utils.dendrite import get_dendrite_pool
+from compute.utils.math import force_to_float_or_default
 from compute.utils.parser import ComputeArgPaser
-from compute.utils.subtensor import is_registered, get_current_block, calculate_next_block_time
-from compute.utils.version import try_update, get_local_version, version2number, get_remote_version
+from compute.utils.spawn import get_spawn_context
+from compute.utils.subtensor import is_registered, get_current_block, get_valid_validators, calculate_next_block_time
+from compute.utils.version import try_update, get_local_version, version2number, get_cached_remote_version
 from compute.wandb.wandb import ComputeWandb
-from neurons.Validator.calculate_pow_score import calc_score_pog
+from neurons.Validator.calculate_pow_score import PogScoreEngine
 from neurons.Validator.database.allocate import update_miner_details, select_has_docker_miners_hotkey, get_miner_details
 from neurons.Validator.database.challenge import select_challenge_stats, update_challenge_details
 from neurons.Validator.database.miner import select_miners, purge_miner_entries, update_miners
-from neurons.Validator.pog import adjust_matrix_size, compute_script_hash, execute_script_on_miner, get_random_seeds, load_yaml_config, parse_merkle_output, receive_responses, send_challenge_indices, send_script_and_request_hash, parse_benchmark_output, identify_gpu, send_seeds, verify_merkle_proof_row, get_remote_gpu_info, verify_responses
-from neurons.Validator.database.pog import get_pog_specs, retrieve_stats, update_pog_stats, write_stats
+from neurons.Validator.pog import REMOTE_BOOTSTRAP_COMMAND, effective_fp32_flops, get_random_seeds, select_matrix_size, load_miner_script, get_response_paths, proof_response_size, load_yaml_config, parse_fetched_responses, identify_gpu, verify_responses
+from neurons.Validator.pog_metrics import PogMetrics
+from neurons.Validator.pog_scheduler import PogCheckpoint, PogTestPlanner, RetryScheduler, axon_fingerprint
+from neurons.Validator.pog_transport import create_transport, is_transient_error
+from neurons.Validator.queryable import QueryableMask, QueryableMaskEngine
+from neurons.Validator.database.pog import get_all_pog_specs, get_pog_history, retrieve_stats, update_pog_stats, write_stats
 
 class Validator:
     blocks_done: set = set()
@@ -87,6 +92,7 @@ class Validator:
     validator_subnet_uid: int
 
     _queryable_uids: Dict[int, bt.AxonInfo]
+    queryable_mask: QueryableMask
 
     loop: AbstractEventLoop
 
@@ -147,6 +153,16 @@ class Validator:
         self.validator_challenge_batch_size = self.config.validator_challenge_batch_size
         self.validator_perform_hardware_query = self.config.validator_perform_hardware_query
         self.validator_whitelist_updated_threshold = self.config.validator_whitelist_updated_threshold
+        self.validator_metagraph_sync_interval = max(1, self.config.validator_metagraph_sync_interval)
+
+        # Queryable miners of the metagraph, rebuilt once per synced block and shared by every consumer
+        self.queryable_mask_engine = QueryableMaskEngine(
+            blacklist_hotkeys=self.blacklist_hotkeys,
+            blacklist_coldkeys=self.blacklist_coldkeys,
+            exploiters_hotkeys=self.exploiters_hotkeys,
+            exploiters_coldkeys=self.exploiters_coldkeys,
+            whitelist_updated_threshold=self.validator_whitelist_updated_threshold,
+        )
 
         # Set up logging with the provided configuration and directory.
         bt.logging(config=self.config, logging_dir=self.config.full_path)
@@ -169,6 +185,8 @@ class Validator:
         # Dendrite is the RPC client; it lets us send messages to other nodes (axons) in the network.
         self._dendrite = bt.dendrite(wallet=self.wallet)
         bt.logging.info(f"Dendrite: {self.dendrite}")
+        # Long-lived dendrite shared by the allocate/deallocate calls of the PoG workers
+        self.dendrite_pool = get_dendrite_pool(self.wallet)
 
         # The metagraph holds the state of the network, letting us know about other miners.
         self._metagraph = self.subtensor.metagraph(self.config.netuid)
@@ -185,12 +203,45 @@ class Validator:
         # Load configuration from YAML
         config_file = "config.yaml"
         self.config_data = load_yaml_config(config_file)
+        # Per-GPU score table of the PoG scoring, built once per config load
+        self.score_engine = PogScoreEngine(self.config_data)
         cpu_cores = os.cpu_count() or 1
         configured_max_workers = self.config_data["merkle_proof"].get("max_workers", 32)
         safe_max_workers = min((cpu_cores + 4)*4, configured_max_workers)
         self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=safe_max_workers)
+        # Optional process pool running the CPU bound PoG verification outside of the GIL
+        verification_workers = min(cpu_cores, self.config_data["merkle_proof"].get("verification_workers", 0))
+        self.verification_executor = None
+        if verification_workers > 0:
+            self.verification_executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=verification_workers, mp_context=get_spawn_context()
+            )
         self.results = {}
         self.gpu_task = None  # Track the GPU task
+        # The PoG sessions run on their own event loop and thread, so the blocking work of the main loop
+        # (metagraph sync, scoring, wandb, weights) does not delay them or inflate their measured timings.
+        # The round itself stays on the main loop, which alone writes the database and the validator state
+        self.pog_loop = asyncio.new_event_loop()
+        threading.Thread(target=self.pog_loop.run_forever, name="th_pog_loop", daemon=True).start()
+        # SSH backend of the PoG pipeline: paramiko, or asyncssh
+        self.ssh_backend = self.config_data["merkle_proof"].get("ssh_backend", "paramiko")
+        # Threads of the blocking paramiko calls, one per concurrent PoG session
+        self.ssh_executor = concurrent.futures.ThreadPoolExecutor(max_workers=safe_max_workers, thread_name_prefix="th_pog_ssh")
+        # Single-use RSA key pairs of the allocation handshakes, generated ahead of time in a background process
+        rsa.start_key_pair_pool(self.config_data["merkle_proof"].get("rsa_key_pool_size", 32))
+        # Per-phase PoG latency metrics, served in the Prometheus text format when metrics_port is set
+        metrics_port = self.config_data["merkle_proof"].get("metrics_port", 0)
+        self.pog_metrics = PogMetrics(enabled=metrics_port > 0)
+        if metrics_port > 0:
+            self.pog_metrics.start_server(metrics_port)
+        # Decides which miners are due for a PoG test each round
+        self.pog_planner = PogTestPlanner(
+            refresh_interval=self.config_data["merkle_proof"].get("pog_refresh_interval", 4320),
+            max_refresh_interval=self.config_data["merkle_proof"].get("pog_max_refresh_interval", 34560),
+            round_budget=self.config_data["merkle_proof"].get("pog_round_budget", 0),
+        )
+        # Checkpointed PoG sessions per hotkey, resumed by the next attempt after an SSH failure
+        self.pog_checkpoints = {}
 
         # Step 3: Set up initial scoring weights for validation
         bt.logging.info("Building validation weights.")
@@ -276,7 +327,7 @@ class Validator:
         # Set the weights of validators to zero.
         self.scores = self.scores * (self.metagraph.total_stake < 1.024e3)
         # Set the weight to zero for all nodes without assigned IP addresses.
-        self.scores = self.scores * torch.Tensor(self.get_valid_tensors(metagraph=self.metagraph))
+        self.scores = self.scores * torch.as_tensor(self.get_queryable_mask()[0].valid)
         bt.logging.info(f"🔢 Initialized scores : {self.scores.tolist()}")
         self.sync_scores()
 
@@ -331,54 +382,59 @@ class Validator:
         self.stats_allocated = self.wandb.get_stats_allocated(valid_validator_hotkeys, True)
 
         self._queryable_uids = self.get_queryable()
-
-        # Calculate score
-        for uid in self.uids:
-            try:
-                axon = self._queryable_uids[uid]
-                hotkey = axon.hotkey
-
-                if uid not in self.stats:
-                    self.stats[uid] = {}
-
-                self.stats[uid]["hotkey"] = hotkey
-
-                # Mark whether this hotkey is in the allocated list
-                self.stats[uid]["allocated"] = hotkey in self.allocated_hotkeys
-
-                # Check GPU specs in our PoG DB
-                gpu_specs = get_pog_specs(self.db, hotkey)
-
-                # If found in our local database
-                if gpu_specs is not None:
-                    score = calc_score_pog(gpu_specs, hotkey, self.allocated_hotkeys, self.config_data)
-                    self.stats[uid]["own_score"] = True  # or "yes" if you prefer a string
-                else:
-                    # If not found locally, try fallback from stats_allocated
-                    if uid in self.stats_allocated:
-                        score = self.stats_allocated[uid].get("score", 0)/100
-                        gpu_specs = self.stats_allocated[uid].get("gpu_specs", None)
-                        self.stats[uid]["own_score"] = False  # or "no"
-                    else:
-                        score = 0
-                        self.stats[uid]["own_score"] = True  # or "no"
-
-                self.stats[uid]["score"] = score*100
-                self.stats[uid]["gpu_specs"] = gpu_specs
-
-                # Keep or override reliability_score if you want
-                if "reliability_score" not in self.stats[uid]:
-                    self.stats[uid]["reliability_score"] = 0
-
-            except KeyError as e:
-                bt.logging.trace(f"KeyError occurred for UID {uid}: {str(e)}")
-                score = 0
-            except Exception as e:
-                bt.logging.trace(f"An unexpected exception occurred for UID {uid}: {str(e)}")
+        mask = self.queryable_mask
+        queryable_positions = np.flatnonzero(mask.queryable)
+
+        # Latest PoG result of every hotkey, in one query
+        pog_specs = get_all_pog_specs(self.db)
+
+        # Gather the scoring inputs of every uid as arrays
+        num_uids = len(self.uids)
+        gpu_index = np.full(num_uids, -1, dtype=np.int64)
+        num_gpus = np.zeros(num_uids, dtype=np.int64)
+        allocated = np.zeros(num_uids, dtype=bool)
+        for position in queryable_positions:
+            axon = mask.axons[position]
+            gpu_specs = pog_specs.get(axon.hotkey)
+            allocated[position] = axon.hotkey in self.allocated_hotkeys
+            if gpu_specs is not None:
+                gpu_index[position] = self.score_engine.index_of(gpu_specs["gpu_name"])
+                num_gpus[position] = gpu_specs["num_gpus"]
+
+        # Calculate the scores of every miner at once
+        local_scores = self.score_engine.score(gpu_index, num_gpus, allocated)
+
+        scores = np.zeros(num_uids, dtype=np.float64)
+        for position in queryable_positions:
+            uid = int(mask.uids[position])
+            hotkey = mask.axons[position].hotkey
+            stats = self.stats.setdefault(uid, {})
+            stats["hotkey"] = hotkey
+            # Mark whether this hotkey is in the allocated list
+            stats["allocated"] = bool(allocated[position])
+
+            # If found in our local database
+            gpu_specs = pog_specs.get(hotkey)
+            if gpu_specs is not None:
+                score = float(local_scores[position])
+                stats["own_score"] = True
+            # If not found locally, try fallback from stats_allocated
+            elif uid in self.stats_allocated:
+                score = self.stats_allocated[uid].get("score", 0)/100
+                gpu_specs = self.stats_allocated[uid].get("gpu_specs", None)
+                stats["own_score"] = False
+            else:
                 score = 0
+                stats["own_score"] = True
 
-            # Keep a simple reference of scores
-            self.scores[uid] = score
+            stats["score"] = score*100
+            stats["gpu_specs"] = gpu_specs
+            # Keep or override reliability_score if you want
+            stats.setdefault("reliability_score", 0)
+            scores[position] = score
+
+        # Keep a simple reference of scores
+        self.scores[torch.as_tensor(self.uids, dtype=torch.long)] = torch.as_tensor(scores, dtype=self.scores.dtype)
 
         write_stats(self.db, self.stats)
 
@@ -427,8 +483,9 @@ class Validator:
         Resync our local state with the latest state from the blockchain.
         Sync scores with metagraph.
         Get the current uids of all miners in the network.
+        Lite sync: the weights and bonds matrices are not used by the validator.
         """
-        self.metagraph.sync(subtensor=self.subtensor)
+        self.metagraph.sync(lite=True, subtensor=self.subtensor)
         self.uids = self.metagraph.uids.tolist()
 
     def sync_status(self):
@@ -465,114 +522,31 @@ class Validator:
         else:
             bt.logging.warning(f"❌ No queryable miners.")
 
-    @staticmethod
-    def filter_axons(queryable_tuple_uids_axons: List[Tuple[int, bt.AxonInfo]]):
-        """Filter the axons with uids_list, remove those with the same IP address."""
-        # Set to keep track of unique identifiers
-        valid_ip_addresses = set()
-
-        # List to store filtered axons
-        dict_filtered_axons = {}
-        for uid, axon in queryable_tuple_uids_axons:
-            ip_address = axon.ip
-
-            if ip_address not in valid_ip_addresses:
-                valid_ip_addresses.add(ip_address)
-                dict_filtered_axons[uid] = axon
-
-        return dict_filtered_axons
-
-    def filter_axon_version(self, dict_filtered_axons: dict):
-        # Get the minimal miner version
-        latest_version = version2number(get_remote_version(pattern="__minimal_miner_version__"))
-        if percent(len(dict_filtered_axons), self.total_current_miners) <= self.validator_whitelist_updated_threshold:
-            bt.logging.info(f"Less than {self.validator_whitelist_updated_threshold}% miners are currently using the last version. Allowing all.")
-            return dict_filtered_axons
-
-        dict_filtered_axons_version = {}
-        for uid, axon in dict_filtered_axons.items():
-            if latest_version and latest_version <= axon.version:
-                dict_filtered_axons_version[uid] = axon
-        return dict_filtered_axons_version
-
-    def is_blacklisted(self, neuron: bt.NeuronInfoLite):
-        coldkey = neuron.coldkey
-        hotkey = neuron.hotkey
-
-        # Blacklist coldkeys that are blacklisted by user
-        if coldkey in self.blacklist_coldkeys:
-            bt.logging.trace(f"Blacklisted recognized coldkey {coldkey} - with hotkey: {hotkey}")
-            return True
-
-        # Blacklist coldkeys that are blacklisted by user or by set of hotkeys
-        if hotkey in self.blacklist_hotkeys:
-            bt.logging.trace(f"Blacklisted recognized hotkey {hotkey}")
-            # Add the coldkey attached to this hotkey in the blacklisted coldkeys
-            self.blacklist_hotkeys.add(coldkey)
-            return True
-
-        # Blacklist coldkeys that are exploiters
-        if coldkey in self.exploiters_coldkeys:
-            bt.logging.trace(f"Blacklisted exploiter coldkey {coldkey} - with hotkey: {hotkey}")
-            return True
-
-        # Blacklist hotkeys that are exploiters
-        if hotkey in self.exploiters_hotkeys:
-            bt.logging.trace(f"Blacklisted exploiter hotkey {hotkey}")
-            # Add the coldkey attached to this hotkey in the blacklisted coldkeys
-            self.exploiters_hotkeys.add(coldkey)
-            return True
-        return False
-
-    def get_valid_tensors(self, metagraph):
-        tensors = []
-        self.total_current_miners = 0
-        for uid in metagraph.uids:
-            neuron = metagraph.neurons[uid]
-
-            if neuron.axon_info.ip != "0.0.0.0" and not self.is_blacklisted(neuron=neuron):
-                self.total_current_miners += 1
-                tensors.append(True)
-            else:
-                tensors.append(False)
-
-        return tensors
-
-    def get_valid_queryable(self):
-        valid_queryable = []
-        for uid in self.uids:
-            neuron: bt.NeuronInfoLite = self.metagraph.neurons[uid]
-            axon = self.metagraph.axons[uid]
-
-            if neuron.axon_info.ip != "0.0.0.0" and not self.is_blacklisted(neuron=neuron):
-                valid_queryable.append((uid, axon))
+    def get_queryable_mask(self):
+        """
+        Return the QueryableMask of the current metagraph and whether it was rebuilt by this call.
 
-        return valid_queryable
+        The mask is cached per metagraph block, so the PoG queue, the scoring and the weights reuse it.
+        """
+        latest_version = version2number(get_cached_remote_version(pattern="__minimal_miner_version__"))
+        mask, rebuilt = self.queryable_mask_engine.get(self.metagraph, latest_version)
+        self.queryable_mask = mask
+        self.total_current_miners = mask.total_current_miners
+        return mask, rebuilt
 
     def get_queryable(self):
-        queryable = self.get_valid_queryable()
+        mask, rebuilt = self.get_queryable_mask()
 
         # Execute a cleanup of the stats and miner information if the miner has been dereg
-        self.sync_miners_info(queryable)
+        if rebuilt:
+            self.sync_miners_info(mask.valid_axons())
 
-        dict_filtered_axons = self.filter_axons(queryable_tuple_uids_axons=queryable)
-        dict_filtered_axons = self.filter_axon_version(dict_filtered_axons=dict_filtered_axons)
-        return dict_filtered_axons
+        return mask.queryable_axons()
 
     def get_valid_validator_hotkeys(self):
-        valid_uids = []
-        uids = self.metagraph.uids.tolist()
-        for index, uid in enumerate(uids):
-            if self.metagraph.total_stake[index] > validator_permit_stake:
-                valid_uids.append(uid)
-        valid_hotkeys = []
-        for uid in valid_uids:
-            neuron = self.subtensor.neuron_for_uid(uid, self.config.netuid)
-            hotkey = neuron.hotkey
-            valid_hotkeys.append(hotkey)
-        return valid_hotkeys
-
-    def get_specs_wandb(self):
+        return [hotkey for _, hotkey, _ in get_valid_validators(self.metagraph, validator_permit_stake)]
+
+    async def get_specs_wandb(self):
         """
         Retrieves hardware specifications from Wandb, updates the miner_details table,
         and checks for differences in GPU specs, logging changes only for allocated hotkeys.
@@ -622,7 +596,7 @@ class Validator:
                         bt.logging.info(f"GPU specs changed for allocated hotkey {hotkey}:")
                         bt.logging.info(f"Old count: {current_count}, Old name: {current_name}")
                         bt.logging.info(f"New count: {new_count}, New name: {new_name}")
-                        self.deallocate_miner(axon, None)
+                        await self.deallocate_miner_async(axon, None)
 
         # Update the local db with the new data from Wandb
         update_miner_details(self.db, list(specs_dict.keys()), list(specs_dict.values()))
@@ -644,7 +618,8 @@ class Validator:
     async def proof_of_gpu(self):
         """
         Perform Proof-of-GPU benchmarking on allocated miners without overlapping tests.
-        Uses asyncio with ThreadPoolExecutor to test miners in parallel.
+        The miner sessions run concurrently on the PoG loop; their results are recorded here, on the calling loop.
+        Failed miners are re-scheduled with exponential backoff instead of holding a worker while they wait.
         """
         try:
             # Init miners to be tested
@@ -656,6 +631,7 @@ class Validator:
             merkle_proof = self.config_data["merkle_proof"]
             retry_limit = merkle_proof.get("pog_retry_limit",30)
             retry_interval = merkle_proof.get("pog_retry_interval",75)
+            retry_backoff_base = merkle_proof.get("pog_retry_backoff_base",5)
             num_workers = merkle_proof.get("max_workers",32)
             max_delay = merkle_proof.get("max_random_delay",1200)
 
@@ -669,10 +645,11 @@ class Validator:
             self.results = {}
             # Dictionary to track retry counts
             retry_counts = defaultdict(int)
-            # Queue of miners to process
-            queue = asyncio.Queue()
+            # Delay queue of miners to process, retries become ready after their backoff
+            queue = RetryScheduler(base_delay=retry_backoff_base, max_delay=retry_interval)
 
-            # Initialize the queue with initial miners
+            # Collect the candidate miners
+            candidates = []
             for i in range(0, len(self.uids), self.validator_challenge_batch_size):
                 for _uid in self.uids[i : i + self.validator_challenge_batch_size]:
                     try:
@@ -680,10 +657,16 @@ class Validator:
                         if axon.hotkey in self.allocated_hotkeys:
                             bt.logging.info(f"Skipping allocated miner: {axon.hotkey}")
                             continue  # skip this miner since it's allocated
-                        await queue.put(axon)
+                        candidates.append(axon)
                     except KeyError:
                         continue
 
+            # Initialize the queue with the miners due for a test in this round
+            due_axons, deferred = self.pog_planner.plan(candidates, get_pog_history(self.db))
+            bt.logging.info(f"💻 {len(due_axons)} miners due for Proof-of-GPU, {deferred} deferred to a later round.")
+            for axon in due_axons:
+                await queue.put(axon)
+
             # Initialize a single Lock for thread-safe updates to results
             results_lock = asyncio.Lock()
 
@@ -697,11 +680,8 @@ class Validator:
                     try:
                         # Set a timeout for the GPU test
                         timeout = 300  # e.g., 5 minutes
-                        result = await asyncio.wait_for(
-                            asyncio.get_event_loop().run_in_executor(
-                                self.executor, self.test_miner_gpu, axon, self.config_data
-                            ),
-                            timeout=timeout
+                        result = await self.run_on_pog_loop(
+                            asyncio.wait_for(self.test_miner_gpu(axon, self.config_data), timeout=timeout)
                         )
                         if result[1] is not None and result[2] > 0:
                             async with results_lock:
@@ -710,28 +690,29 @@ class Validator:
                                     "num_gpus": result[2]
                                 }
                             update_pog_stats(self.db, hotkey, result[1], result[2])
+                            self.pog_planner.mark_tested(axon)
                         else:
                             raise RuntimeError("GPU test failed")
                     except asyncio.TimeoutError:
                         bt.logging.warning(f"⏳ Timeout while testing {hotkey}. Retrying...")
                         retry_counts[hotkey] += 1
                         if retry_counts[hotkey] < retry_limit:
-                            bt.logging.info(f"🔄 {hotkey}: Retrying miner -> (Attempt {retry_counts[hotkey]})")
-                            await asyncio.sleep(retry_interval)
-                            await queue.put(axon)
+                            delay = await queue.retry(axon, retry_counts[hotkey])
+                            bt.logging.info(f"🔄 {hotkey}: Retrying miner in {delay:.1f}s -> (Attempt {retry_counts[hotkey]})")
                         else:
                             bt.logging.info(f"❌ {hotkey}: Miner failed after {retry_limit} attempts (Timeout).")
                             update_pog_stats(self.db, hotkey, None, None)
+                            self.pog_planner.mark_tested(axon)
                     except Exception as e:
                         bt.logging.trace(f"Exception in worker for {hotkey}: {e}")
                         retry_counts[hotkey] += 1
                         if retry_counts[hotkey] < retry_limit:
-                            bt.logging.info(f"🔄 {hotkey}: Retrying miner -> (Attempt {retry_counts[hotkey]})")
-                            await asyncio.sleep(retry_interval)
-                            await queue.put(axon)
+                            delay = await queue.retry(axon, retry_counts[hotkey])
+                            bt.logging.info(f"🔄 {hotkey}: Retrying miner in {delay:.1f}s -> (Attempt {retry_counts[hotkey]})")
                         else:
                             bt.logging.info(f"❌ {hotkey}: Miner failed after {retry_limit} attempts.")
                             update_pog_stats(self.db, hotkey, None, None)
+                            self.pog_planner.mark_tested(axon)
                     finally:
                         queue.task_done()
 
@@ -752,6 +733,12 @@ class Validator:
             # Wait until all worker tasks are cancelled
             await asyncio.gather(*workers, return_exceptions=True)
 
+            # Release the miners kept allocated for sessions that were never resumed
+            for hotkey, checkpoint in list(self.pog_checkpoints.items()):
+                bt.logging.trace(f"{hotkey}: Releasing unresumed PoG checkpoint.")
+                await self.deallocate_miner_async(checkpoint.axon, checkpoint.public_key)
+            self.pog_checkpoints.clear()
+
             bt.logging.success(f"✅ Proof-of-GPU benchmarking completed.")
             return self.results
         except Exception as e:
@@ -768,18 +755,46 @@ class Validator:
             bt.logging.error(f"Proof-of-GPU task failed: {e}")
             self.gpu_task = None
 
-    def test_miner_gpu(self, axon, config_data):
+    def run_on_pog_loop(self, coro):
+        """Schedule a coroutine on the PoG loop and return a future of its result awaitable from the calling loop."""
+        return asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self.pog_loop))
+
+    async def test_miner_gpu(self, axon, config_data):
         """
         Allocate, test, and deallocate a single miner.
 
+        SSH steps are awaited on the configured transport and allocation goes through the shared
+        dendrite pool; the blocking verification runs in the executors so the event loop stays free.
+        When the SSH session drops, the allocation and the progress of the test are checkpointed and
+        the next attempt resumes at the failed phase until the resume deadline passes.
+
+        Runs on the PoG loop: besides the PoG checkpoints and metrics it leaves the validator state and the
+        database alone, the caller records the result on the main loop.
+
         :return: Tuple of (miner_hotkey, gpu_name, num_gpus)
         """
+        loop = asyncio.get_running_loop()
         allocation_status = False
         miner_info = None
+        public_key = None
         host = None  # Initialize host variable
+        transport = None
+        agent = None
         hotkey = axon.hotkey
+        metrics = self.pog_metrics
+        # Outcome of the whole test: ok, fail, busy, or error when an exception escapes a phase
+        outcome = "error"
+        test_start = time.perf_counter()
+        # Set when the session is checkpointed, the miner then stays allocated for the next attempt
+        keep_allocation = False
         bt.logging.trace(f"{hotkey}: Starting miner test.")
 
+        checkpoint = self.pog_checkpoints.pop(hotkey, None)
+        if checkpoint is not None and (checkpoint.expired() or axon_fingerprint(checkpoint.axon) != axon_fingerprint(axon)):
+            bt.logging.trace(f"{hotkey}: PoG checkpoint expired, deallocating.")
+            await self.deallocate_miner_async(checkpoint.axon, checkpoint.public_key)
+            checkpoint = None
+
         try:
             # Step 0: Init
             gpu_data = config_data["gpu_performance"]
@@ -787,138 +802,202 @@ class Validator:
             # Extract Merkle Proof Settings
             merkle_proof = config_data["merkle_proof"]
             time_tol = merkle_proof.get("time_tolerance",5)
+            num_indices = merkle_proof.get("num_indices",1)
+            resume_deadline = merkle_proof.get("pog_resume_deadline",600)
+            compute_time_budget = merkle_proof.get("compute_time_budget",0)
+            merkle_hash_rate = merkle_proof.get("merkle_hash_rate",1e9)
+            max_matrix_size = merkle_proof.get("max_matrix_size",0)
+            agent_timeouts = merkle_proof.get("agent_timeouts",{})
             # Extract miner_script path
             miner_script_path = merkle_proof["miner_script_path"]
 
             # Step 1: Allocate Miner
-            # Generate RSA key pair
-            private_key, public_key = rsa.generate_key_pair()
-            allocation_response = self.allocate_miner(axon, private_key, public_key)
-            if not allocation_response:
-                bt.logging.info(f"🌀 {hotkey}: Busy or not allocatable.")
-                return (hotkey, None, 0)
+            if checkpoint is not None:
+                bt.logging.info(f"🔁 {hotkey}: Resuming Proof-of-GPU session after phase '{checkpoint.phase}'.")
+                miner_info = checkpoint.miner_info
+                public_key = checkpoint.public_key
+            else:
+                # Generate RSA key pair
+                private_key, public_key = rsa.get_key_pair()
+                with metrics.phase("allocation", hotkey) as phase:
+                    allocation_response = await self.allocate_miner(axon, private_key, public_key)
+                    if not allocation_response:
+                        phase.outcome = "fail"
+                if not allocation_response:
+                    bt.logging.info(f"🌀 {hotkey}: Busy or not allocatable.")
+                    outcome = "busy"
+                    return (hotkey, None, 0)
+                miner_info = allocation_response
+                checkpoint = PogCheckpoint(axon, miner_info, public_key, time.time() + resume_deadline)
+                bt.logging.trace(f"{hotkey}: Allocated Miner for testing.")
             allocation_status = True
-            miner_info = allocation_response
             host = miner_info['host']
-            bt.logging.trace(f"{hotkey}: Allocated Miner for testing.")
 
             # Step 2: Connect via SSH
-            ssh_client = paramiko.SSHClient()
-            ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            bt.logging.trace(f"{hotkey}: Connect to Miner via SSH.")
-            ssh_client.connect(host, port=miner_info.get('port', 22), username=miner_info['username'], password=miner_info['password'], timeout=10)
-            if not (ssh_client):
-                ssh_client.close()
-                bt.logging.info(f"{hotkey}: SSH connection failed.")
-                return (hotkey, None, -1)
+            transport = create_transport(self.ssh_backend, self.ssh_executor)
+            bt.logging.trace(f"{hotkey}: Connect to Miner via SSH ({transport.name}).")
+            with metrics.phase("ssh_connect", hotkey):
+                await transport.connect(host, miner_info.get('port', 22), miner_info['username'], miner_info['password'], timeout=10)
             bt.logging.trace(f"{hotkey}: Connected to Miner via SSH.")
 
-            # Step 3: Hash Check
-            local_hash = compute_script_hash(miner_script_path)
-            bt.logging.trace(f"{hotkey}: [Step 1] Local script hash computed successfully.")
+            # Step 3: Upload the script and collect its hash, the GPU info and the benchmark in one round trip
+            script, local_hash = load_miner_script(miner_script_path)
             bt.logging.trace(f"{hotkey}: Local Hash: {local_hash}")
-            remote_hash = send_script_and_request_hash(ssh_client, miner_script_path)
+            run_benchmark = not checkpoint.reached(PogCheckpoint.BENCHMARKED)
+            if run_benchmark:
+                bt.logging.info(f"💻 {hotkey}: Executing benchmarking mode.")
+            # The bootstrapped agent then serves every following step over this session
+            with metrics.phase("bootstrap", hotkey):
+                agent = await transport.start_agent(REMOTE_BOOTSTRAP_COMMAND, agent_timeouts)
+                remote_hash, gpu_info, benchmark_result = await agent.bootstrap(script, benchmark=run_benchmark)
             if local_hash != remote_hash:
                 bt.logging.info(f"{hotkey}: [Integrity Check] FAILURE: Hash mismatch detected.")
                 raise ValueError(f"{hotkey}: Script integrity verification failed.")
 
-            # Step 4: Get GPU info NVIDIA from the remote miner
-            bt.logging.trace(f"{hotkey}: [Step 4] Retrieving GPU information (NVIDIA driver) from miner...")
-            gpu_info = get_remote_gpu_info(ssh_client)
-            num_gpus_reported = gpu_info["num_gpus"]
-            gpu_name_reported = gpu_info["gpu_names"][0] if num_gpus_reported > 0 else None
-            bt.logging.trace(f"{hotkey}: [Step 4] Reported GPU Information:")
-            if num_gpus_reported > 0:
-                bt.logging.trace(f"{hotkey}: Number of GPUs: {num_gpus_reported}")
-                bt.logging.trace(f"{hotkey}: GPU Type: {gpu_name_reported}")
-            if num_gpus_reported <= 0:
-                bt.logging.info(f"{hotkey}: No GPUs detected.")
-                raise ValueError("No GPUs detected.")
-
-            # Step 5: Run the benchmarking mode
-            bt.logging.info(f"💻 {hotkey}: Executing benchmarking mode.")
-            bt.logging.trace(f"{hotkey}: [Step 5] Executing benchmarking mode on the miner...")
-            execution_output = execute_script_on_miner(ssh_client, mode='benchmark')
-            bt.logging.trace(f"{hotkey}: [Step 5] Benchmarking completed.")
-            # Parse the execution output
-            num_gpus, vram, size_fp16, time_fp16, size_fp32, time_fp32 = parse_benchmark_output(execution_output)
-            bt.logging.trace(f"{hotkey}: [Benchmark Results] Detected {num_gpus} GPU(s) with {vram} GB unfractured VRAM.")
-            bt.logging.trace(f"{hotkey}: FP16 - Matrix Size: {size_fp16}, Execution Time: {time_fp16} s")
-            bt.logging.trace(f"{hotkey}: FP32 - Matrix Size: {size_fp32}, Execution Time: {time_fp32} s")
-            # Calculate performance metrics
-            fp16_tflops = (2 * size_fp16 ** 3) / time_fp16 / 1e12
-            fp32_tflops = (2 * size_fp32 ** 3) / time_fp32 / 1e12
-            bt.logging.trace(f"{hotkey}: [Performance Metrics] Calculated TFLOPS:")
-            bt.logging.trace(f"{hotkey}: FP16: {fp16_tflops:.2f} TFLOPS")
-            bt.logging.trace(f"{hotkey}: FP32: {fp32_tflops:.2f} TFLOPS")
-            gpu_name = identify_gpu(fp16_tflops, fp32_tflops, vram, gpu_data, gpu_name_reported, gpu_tolerance_pairs)
-            bt.logging.trace(f"{hotkey}: [GPU Identification] Based on performance: {gpu_name}")
-
-            # Step 6: Run the Merkle proof mode
-            bt.logging.trace(f"{hotkey}: [Step 6] Initiating Merkle Proof Mode.")
-            # Step 1: Send seeds and execute compute mode
-            n = adjust_matrix_size(vram, element_size=4, buffer_factor=0.10)
-            seeds = get_random_seeds(num_gpus)
-            send_seeds(ssh_client, seeds, n)
-            bt.logging.trace(f"{hotkey}: [Step 6] Compute mode executed on miner - Matrix Size: {n}")
-            start_time = time.time()
-            execution_output = execute_script_on_miner(ssh_client, mode='compute')
-            end_time = time.time()
-            elapsed_time = end_time - start_time
-            bt.logging.trace(f"{hotkey}: Compute mode execution time: {elapsed_time:.2f} seconds.")
-            # Parse the execution output
-            root_hashes_list, gpu_timings_list = parse_merkle_output(execution_output)
-            bt.logging.trace(f"{hotkey}: [Merkle Proof] Root hashes received from GPUs:")
-            for gpu_id, root_hash in root_hashes_list:
-                bt.logging.trace(f"{hotkey}: GPU {{gpu_id}}: {{root_hash}}")
-
-            # Calculate total times
-            total_multiplication_time = 0.0
-            total_merkle_tree_time = 0.0
-            num_gpus = len(gpu_timings_list)
-            for _, timing in gpu_timings_list:
-                total_multiplication_time += timing.get('multiplication_time', 0.0)
-                total_merkle_tree_time += timing.get('merkle_tree_time', 0.0)
-            average_multiplication_time = total_multiplication_time / num_gpus if num_gpus > 0 else 0.0
-            average_merkle_tree_time = total_merkle_tree_time / num_gpus if num_gpus > 0 else 0.0
-            bt.logging.trace(f"{hotkey}: Average Matrix Multiplication Time: {average_multiplication_time:.4f} seconds")
-            bt.logging.trace(f"{hotkey}: Average Merkle Tree Time: {average_merkle_tree_time:.4f} seconds")
-
-            timing_passed = False
-            if elapsed_time < time_tol + num_gpus * time_fp32 and average_multiplication_time < time_fp32:
-                timing_passed = True
+            if not run_benchmark:
+                benchmark = checkpoint.benchmark
+                num_gpus, vram, time_fp32, gpu_name, fp32_flops = (
+                    benchmark["num_gpus"], benchmark["vram"], benchmark["time_fp32"], benchmark["gpu_name"], benchmark["fp32_flops"]
+                )
+                bt.logging.trace(f"{hotkey}: [Step 4-5] Reusing checkpointed benchmark: {num_gpus} x {gpu_name}.")
+            else:
+                # Step 4: GPU info NVIDIA reported by the remote miner
+                num_gpus_reported = gpu_info["num_gpus"]
+                gpu_name_reported = gpu_info["gpu_names"][0] if num_gpus_reported > 0 else None
+                bt.logging.trace(f"{hotkey}: [Step 4] Reported GPU Information:")
+                if num_gpus_reported > 0:
+                    bt.logging.trace(f"{hotkey}: Number of GPUs: {num_gpus_reported}")
+                    bt.logging.trace(f"{hotkey}: GPU Type: {gpu_name_reported}")
+                if num_gpus_reported <= 0 or benchmark_result is None:
+                    bt.logging.info(f"{hotkey}: No GPUs detected.")
+                    raise ValueError("No GPUs detected.")
+
+                # Step 5: Benchmark results
+                num_gpus, vram, size_fp16, time_fp16, size_fp32, time_fp32 = benchmark_result
+                bt.logging.trace(f"{hotkey}: [Step 5] Benchmarking completed.")
+                bt.logging.trace(f"{hotkey}: [Benchmark Results] Detected {num_gpus} GPU(s) with {vram} GB unfractured VRAM.")
+                bt.logging.trace(f"{hotkey}: FP16 - Matrix Size: {size_fp16}, Execution Time: {time_fp16} s")
+                bt.logging.trace(f"{hotkey}: FP32 - Matrix Size: {size_fp32}, Execution Time: {time_fp32} s")
+                # Calculate performance metrics
+                fp16_tflops = (2 * size_fp16 ** 3) / time_fp16 / 1e12
+                fp32_tflops = (2 * size_fp32 ** 3) / time_fp32 / 1e12
+                bt.logging.trace(f"{hotkey}: [Performance Metrics] Calculated TFLOPS:")
+                bt.logging.trace(f"{hotkey}: FP16: {fp16_tflops:.2f} TFLOPS")
+                bt.logging.trace(f"{hotkey}: FP32: {fp32_tflops:.2f} TFLOPS")
+                gpu_name = identify_gpu(fp16_tflops, fp32_tflops, vram, gpu_data, gpu_name_reported, gpu_tolerance_pairs)
+                bt.logging.trace(f"{hotkey}: [GPU Identification] Based on performance: {gpu_name}")
+                fp32_flops = effective_fp32_flops(size_fp32, time_fp32, gpu_name, gpu_data)
+                checkpoint.record_benchmark(num_gpus=num_gpus, vram=vram, time_fp32=time_fp32, gpu_name=gpu_name, fp32_flops=fp32_flops)
+
+            if checkpoint.reached(PogCheckpoint.COMPUTED):
+                seeds, n = checkpoint.seeds, checkpoint.n
+                root_hashes, gpu_timings = checkpoint.root_hashes, checkpoint.gpu_timings
+                timing_passed = checkpoint.timing_passed
+                num_gpus = len(gpu_timings)
+                bt.logging.trace(f"{hotkey}: [Step 6] Reusing checkpointed root hashes of {num_gpus} GPU(s), matrix size {n}.")
+            else:
+                # Step 6: Run the Merkle proof mode
+                bt.logging.trace(f"{hotkey}: [Step 6] Initiating Merkle Proof Mode.")
+                # Step 1: Send seeds and execute compute mode
+                # Size the matrices so the compute step fits the time budget on this GPU class
+                n, predicted_time = select_matrix_size(
+                    vram, fp32_flops, compute_time_budget, num_gpus, merkle_hash_rate, max_matrix_size
+                )
+                seeds = get_random_seeds(num_gpus)
+                bt.logging.trace(f"{hotkey}: [Step 6] Compute mode executed on miner - Matrix Size: {n}, predicted time: {predicted_time:.2f} s")
+                start_time = time.time()
+                with metrics.phase("compute", hotkey):
+                    root_hashes_list, gpu_timings_list = await agent.run_compute(seeds, n)
+                end_time = time.time()
+                elapsed_time = end_time - start_time
+                bt.logging.trace(f"{hotkey}: Compute mode execution time: {elapsed_time:.2f} seconds (predicted {predicted_time:.2f} s).")
+                metrics.record_sizing(hotkey, n, predicted_time, elapsed_time)
+                bt.logging.trace(f"{hotkey}: [Merkle Proof] Root hashes received from GPUs:")
+                for gpu_id, root_hash in root_hashes_list:
+                    bt.logging.trace(f"{hotkey}: GPU {{gpu_id}}: {{root_hash}}")
+
+                # Calculate total times
+                total_multiplication_time = 0.0
+                total_merkle_tree_time = 0.0
+                num_gpus = len(gpu_timings_list)
+                for _, timing in gpu_timings_list:
+                    total_multiplication_time += timing.get('multiplication_time', 0.0)
+                    total_merkle_tree_time += timing.get('merkle_tree_time', 0.0)
+                average_multiplication_time = total_multiplication_time / num_gpus if num_gpus > 0 else 0.0
+                average_merkle_tree_time = total_merkle_tree_time / num_gpus if num_gpus > 0 else 0.0
+                bt.logging.trace(f"{hotkey}: Average Matrix Multiplication Time: {average_multiplication_time:.4f} seconds")
+                bt.logging.trace(f"{hotkey}: Average Merkle Tree Time: {average_merkle_tree_time:.4f} seconds")
+
+                timing_passed = False
+                if elapsed_time < time_tol + num_gpus * time_fp32 and average_multiplication_time < time_fp32:
+                    timing_passed = True
+
+                root_hashes = {gpu_id: root_hash for gpu_id, root_hash in root_hashes_list}
+                gpu_timings = {gpu_id: timing for gpu_id, timing in gpu_timings_list}
+                n = gpu_timings[0]['n']  # Assuming same n for all GPUs
+                checkpoint.record_compute(seeds, n, root_hashes, gpu_timings, timing_passed)
 
             # Step 7: Verify merkle proof
-            root_hashes = {gpu_id: root_hash for gpu_id, root_hash in root_hashes_list}
-            gpu_timings = {gpu_id: timing for gpu_id, timing in gpu_timings_list}
-            n = gpu_timings[0]['n']  # Assuming same n for all GPUs
-            indices = {}
-            num_indices = 1
-            for gpu_id in range(num_gpus):
-                indices[gpu_id] = [(np.random.randint(0, n), np.random.randint(0, n)) for _ in range(num_indices)]
-            send_challenge_indices(ssh_client, indices)
-            execution_output = execute_script_on_miner(ssh_client, mode='proof')
+            # The challenge indices are drawn once, after the root hashes are committed, and checkpointed before
+            # they reach the miner so a resumed session cannot re-roll them
+            if checkpoint.reached(PogCheckpoint.CHALLENGED):
+                indices = checkpoint.indices
+                bt.logging.trace(f"{hotkey}: [Step 7] Reusing checkpointed challenge indices.")
+            else:
+                indices = {}
+                for gpu_id in range(num_gpus):
+                    indices[gpu_id] = [(np.random.randint(0, n), np.random.randint(0, n)) for _ in range(num_indices)]
+                checkpoint.record_indices(indices)
+            with metrics.phase("proof", hotkey):
+                await agent.run_proof(indices)
             bt.logging.trace(f"{hotkey}: [Merkle Proof] Proof mode executed on miner.")
-            responses = receive_responses(ssh_client, num_gpus)
+            with metrics.phase("fetch", hotkey):
+                # The responses are miner controlled, nothing larger than the expected proof is read
+                buffers, transfer_stats = await transport.fetch(get_response_paths(num_gpus), proof_response_size(num_indices, n))
+                missing = [gpu_id for gpu_id in range(num_gpus) if buffers.get(gpu_id) is None]
+                if missing:
+                    raise ConnectionError(f"Responses of GPU(s) {missing} could not be fetched.")
+                responses = parse_fetched_responses(buffers, transfer_stats, num_gpus)
             bt.logging.trace(f"{hotkey}: [Merkle Proof] Responses received from miner.")
 
-            verification_passed = verify_responses(seeds, root_hashes, responses, indices, n)
+            with metrics.phase("verify", hotkey) as phase:
+                verification_passed = await loop.run_in_executor(
+                    self.executor, verify_responses, seeds, root_hashes, responses, indices, n, self.verification_executor
+                )
+                if not verification_passed:
+                    phase.outcome = "fail"
             if verification_passed and timing_passed:
                 bt.logging.info(f"✅ {hotkey}: GPU Identification: Detected {num_gpus} x {gpu_name} GPU(s)")
+                outcome = "ok"
                 return (hotkey, gpu_name, num_gpus)
             else:
                 bt.logging.info(f"⚠️  {hotkey}: GPU Identification: Aborted due to verification failure")
+                outcome = "fail"
                 return (hotkey, None, 0)
 
         except Exception as e:
             bt.logging.info(f"❌ {hotkey}: Error testing Miner: {e}")
+            if checkpoint is not None and is_transient_error(e) and not checkpoint.expired():
+                # Keep the allocation so the next attempt resumes after the last completed phase
+                bt.logging.trace(f"{hotkey}: Checkpointed PoG session after phase '{checkpoint.phase}'.")
+                self.pog_checkpoints[hotkey] = checkpoint
+                keep_allocation = True
             return (hotkey, None, 0)
 
         finally:
-            if allocation_status and miner_info:
-                self.deallocate_miner(axon, public_key)
-
-    def allocate_miner(self, axon, private_key, public_key):
+            # agent.close is bounded and closes the channel even when cancelled, the cleanup below still runs
+            try:
+                if agent:
+                    await agent.close()
+            finally:
+                if transport:
+                    await transport.close()
+                if allocation_status and miner_info and not keep_allocation:
+                    with metrics.phase("deallocation", hotkey):
+                        await self.deallocate_miner_async(axon, public_key)
+                metrics.observe("total", outcome, time.perf_counter() - test_start, hotkey)
+
+    async def allocate_miner(self, axon, private_key, public_key):
         """
         Allocate a miner by querying the allocator.
 
@@ -927,8 +1006,6 @@ class Validator:
         :return: Dictionary with miner details if successful, None otherwise.
         """
         try:
-            dendrite = bt.dendrite(wallet=self.wallet)
-
             # Define device requirements (customize as needed)
             device_requirement = {"cpu": {"count": 1}, "gpu": {}, "hard_disk": {"capacity": 1073741824}, "ram": {"capacity": 1073741824}, "testing": True}
             device_requirement["gpu"] = {"count": 1, "capacity": 0, "type": ""}
@@ -938,24 +1015,11 @@ class Validator:
             }
 
             # Simulate an allocation query with Allocate
-            check_allocation = dendrite.query(
-                axon,
-                Allocate(timeline=1, device_requirement=device_requirement, checking=True),
-                timeout=30,
-                )
-            if check_allocation  and check_allocation ["status"] is True:
-                response = dendrite.query(
-                    axon,
-                    Allocate(
-                        timeline=1,
-                        device_requirement=device_requirement,
-                        checking=False,
-                        public_key=public_key,
-                        docker_requirement=docker_requirement,
-                    ),
-                    timeout=30,
+            if await self.dendrite_pool.check_allocation(axon, device_requirement, timeline=1, timeout=30):
+                response = await self.dendrite_pool.allocate(
+                    axon, device_requirement, public_key, docker_requirement=docker_requirement, timeline=1, timeout=30
                 )
-                if response and response.get("status") is True:
+                if response:
                     bt.logging.trace(f"Successfully allocated miner {axon.hotkey}")
                     decrypted_info_str = rsa.decrypt_data(
                         private_key.encode("utf-8"),
@@ -981,71 +1045,42 @@ class Validator:
             bt.logging.trace(f"{axon.hotkey}: Exception during miner allocation for: {e}")
             return None
 
-    def deallocate_miner(self, axon, public_key):
+    def get_allocation_public_key(self, hotkey):
         """
-        Deallocate a miner by sending a deregistration query.
+        Retrieve the public key of an allocation from the database.
 
-        :param axon: Axon object containing miner details.
-        :param public_key: Public key of the miner; if None, it will be retrieved from the database.
+        :param hotkey: Hotkey of the allocated miner.
+        :return: The public key, or None if it is not found.
         """
-        if not public_key:
-            try:
-                # Instantiate the connection to the database and retrieve miner details
-                db = ComputeDb()
-                cursor = db.get_cursor()
-
-                cursor.execute(
-                    "SELECT details, hotkey FROM allocation WHERE hotkey = ?",
-                    (axon.hotkey,)
-                )
-                row = cursor.fetchone()
+        try:
+            # Instantiate the connection to the database and retrieve miner details
+            db = ComputeDb()
+            cursor = db.get_cursor()
 
-                if row:
-                    info = json.loads(row[0])  # Parse JSON string from the 'details' column
-                    public_key = info.get("regkey")
-            except Exception as e:
-                bt.logging.trace(f"{axon.hotkey}: Missing public key: {e}")
+            cursor.execute(
+                "SELECT details, hotkey FROM allocation WHERE hotkey = ?",
+                (hotkey,)
+            )
+            row = cursor.fetchone()
 
-        try:
-            dendrite = bt.dendrite(wallet=self.wallet)
-            retry_count = 0
-            max_retries = 3
-            allocation_status = True
+            if row:
+                info = json.loads(row[0])  # Parse JSON string from the 'details' column
+                return info.get("regkey")
+        except Exception as e:
+            bt.logging.trace(f"{hotkey}: Missing public key: {e}")
+        return None
 
-            while allocation_status and retry_count < max_retries:
-                try:
-                    # Send deallocation query
-                    deregister_response = dendrite.query(
-                        axon,
-                        Allocate(
-                            timeline=0,
-                            checking=False,
-                            public_key=public_key,
-                        ),
-                        timeout=60,
-                    )
+    async def deallocate_miner_async(self, axon, public_key):
+        """
+        Deallocate a miner by sending a deregistration query, retrying without blocking a thread.
 
-                    if deregister_response and deregister_response.get("status") is True:
-                        allocation_status = False
-                        bt.logging.trace(f"Deallocated miner {axon.hotkey}")
-                    else:
-                        retry_count += 1
-                        bt.logging.trace(
-                            f"{axon.hotkey}: Failed to deallocate miner. "
-                            f"(attempt {retry_count}/{max_retries})"
-                        )
-                        if retry_count >= max_retries:
-                            bt.logging.trace(f"{axon.hotkey}: Max retries reached for deallocating miner.")
-                        time.sleep(5)
-                except Exception as e:
-                    retry_count += 1
-                    bt.logging.trace(
-                        f"{axon.hotkey}: Error while trying to deallocate miner. "
-                        f"(attempt {retry_count}/{max_retries}): {e}"
-                    )
-                    if retry_count >= max_retries:
-                        bt.logging.trace(f"{axon.hotkey}: Max retries reached for deallocating miner.")
-                    time.sleep(5)
+        :param axon: Axon object containing miner details.
+        :param public_key: Public key of the miner; if None, it will be retrieved from the database.
+        """
+        if not public_key:
+            public_key = self.get_allocation_public_key(axon.hotkey)
+        try:
+            await self.dendrite_pool.deallocate(axon, public_key, max_retries=3, retry_delay=5, timeout=60)
         except Exception as e:
             bt.logging.trace(f"{axon.hotkey}: Unexpected error during deallocation: {e}")
 
@@ -1079,7 +1114,12 @@ class Validator:
             return None
 
     async def start(self):
-        """The Main Validation Loop"""
+        """
+        The Main Validation Loop.
+
+        Driven by block arrival: the cheap (cached) block number is polled and an iteration only runs
+        once a new block has landed, with a metagraph sync every validator_metagraph_sync_interval blocks.
+        """
         self.loop = asyncio.get_running_loop()
 
         # Step 5: Perform queries to miners, scoring, and weight
@@ -1094,10 +1134,22 @@ class Validator:
         time_next_set_weights = None
         time_next_hardware_info = None        
 
+        last_block = None
+        block_last_metagraph_sync = None
+
         bt.logging.info("Starting validator loop.")
         while True:
             try:
-                self.sync_local()
+                # Wait for a new block, the block number is cached for a block time
+                current_block = self.current_block
+                if current_block == last_block:
+                    await asyncio.sleep(1)
+                    continue
+                last_block = current_block
+
+                if block_last_metagraph_sync is None or current_block - block_last_metagraph_sync >= self.validator_metagraph_sync_interval:
+                    self.sync_local()
+                    block_last_metagraph_sync = current_block
 
                 if self.current_block not in self.blocks_done:
                     self.blocks_done.add(self.current_block)
@@ -1114,7 +1166,7 @@ class Validator:
                         block_next_pog = self.current_block + 360
 
                         if self.gpu_task is None or self.gpu_task.done():
-                            # Schedule proof_of_gpu as a background task
+                            # The round runs on this loop, only its miner sessions are handed to the PoG loop
                             self.gpu_task = asyncio.create_task(self.proof_of_gpu())
                             self.gpu_task.add_done_callback(self.on_gpu_task_done)
                         else:
@@ -1130,7 +1182,7 @@ class Validator:
                             self._queryable_uids = self.get_queryable()
 
                         # self.loop.run_in_executor(None, self.execute_specs_request) replaced by wandb query.
-                        self.get_specs_wandb()
+                        await self.get_specs_wandb()
 
                     # Perform miner checking
                     if self.current_block % block_next_miner_checking == 0 or block_next_miner_checking < self.current_block:
@@ -1188,6 +1240,13 @@ class Validator:
             # If the user interrupts the program, gracefully exit.
             except KeyboardInterrupt:
                 self.db.close()
+                self.pog_loop.call_soon_threadsafe(self.pog_loop.stop)
+                self.ssh_executor.shutdown(wait=False, cancel_futures=True)
+                if self.verification_executor is not None:
+                    self.verification_executor.shutdown(cancel_futures=True)
+                self.dendrite_pool.close()
+                rsa.stop_key_pair_pool()
+                self.pog_metrics.close()
                 bt.logging.success("Keyboard interrupt detected. Exiting validator.")
                 exit()
 
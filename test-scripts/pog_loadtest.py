@@ -0,0 +1,588 @@
+"""
+Local load test of the Proof-of-GPU pipeline against simulated miners.
+
+Each simulated miner answers Allocate through an in-process stand-in of the validator dendrite pool and
+exposes an SSH/SFTP endpoint served by an asyncssh server running on its own thread. The uploaded miner
+script runs in agent mode on CPU torch with small matrices, with the GPU info and benchmark replaced by
+the figures of the simulated GPU model, so full Validator.proof_of_gpu rounds can be timed without GPUs.
+
+Usage, from the repository root with the validator requirements installed:
+
+    python test-scripts/pog_loadtest.py --miners 200 --rounds 2 --n 256 --fail-rate 0.05 --cheat-rate 0.1
+    python test-scripts/pog_loadtest.py --miners 50 --drop-rate 0.3  # checkpoint and resume of dropped sessions
+"""
+import argparse
+import asyncio
+import base64
+import copy
+import importlib.util
+import json
+import os
+import random
+import secrets
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NEURONS_DIR = os.path.join(ROOT_DIR, "neurons")
+HARNESS_PATH = os.path.abspath(__file__)
+
+HONEST = "honest"
+# Persistent failures: the miner never completes a test
+BUSY = "busy"
+SSH_FAIL = "ssh_fail"
+CRASH = "crash"
+# Stops answering once asked for the proof, the exit request included
+STALL = "stall"
+# Cheats: the miner completes the protocol but must not be credited
+CHEAT_ROWS = "cheat_rows"
+CHEAT_ROOT = "cheat_root"
+CHEAT_GPU = "cheat_gpu"
+# Pads its proof response far beyond the expected size
+CHEAT_SIZE = "cheat_size"
+SLOW = "slow"
+
+FAILURES = (BUSY, SSH_FAIL, CRASH, STALL)
+CHEATS = (CHEAT_ROWS, CHEAT_ROOT, CHEAT_GPU, CHEAT_SIZE, SLOW)
+
+
+# ---------------------------------------------------------------------------
+# Simulated miner agent (runs in the subprocess started over SSH)
+# ---------------------------------------------------------------------------
+
+class CpuTorch:
+    """Stand-in for the torch module of the miner script: CUDA calls are no-ops and tensors stay on CPU."""
+
+    def __init__(self, torch_module, gpu_names):
+        self._torch = torch_module
+        self.cuda = argparse.Namespace(
+            is_available=lambda: True,
+            device_count=lambda: len(gpu_names),
+            get_device_name=lambda i: gpu_names[i],
+            set_device=lambda *args: None,
+            synchronize=lambda *args: None,
+            empty_cache=lambda: None,
+        )
+
+    def device(self, *args, **kwargs):
+        return self._torch.device("cpu")
+
+    def __getattr__(self, name):
+        return getattr(self._torch, name)
+
+
+def run_sim_agent(args):
+    import numpy as np
+    import torch
+
+    gpu_info = json.loads(args.gpu_info)
+    benchmark = json.loads(args.benchmark)
+
+    spec = importlib.util.spec_from_file_location("miner_script", args.script)
+    script = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(script)
+
+    def remap(path):
+        return os.path.join(args.root, path.lstrip("/"))
+
+    get_proof_store_paths = script.get_proof_store_paths
+    save_proof_responses = script.save_proof_responses
+    compute_gpus = script.compute_gpus
+
+    def sim_save_proof_responses(path, indices, rows, proofs, *a, **kw):
+        if args.behavior == CHEAT_ROWS:
+            rows = np.asarray(rows, dtype=np.float32) + 1.0
+        save_proof_responses(remap(path), indices, rows, proofs, *a, **kw)
+        if args.behavior == CHEAT_SIZE:
+            with open(remap(path), "ab") as f:
+                f.write(bytes(16 * 1024 * 1024))
+
+    def sim_compute_gpus(n, seeds):
+        if args.behavior == CRASH:
+            os._exit(1)
+        time.sleep(args.compute_delay)
+        root_hashes, gpu_timings = compute_gpus(n, seeds)
+        if args.behavior == CHEAT_ROOT:
+            root_hashes = [(gpu_id, secrets.token_hex(32)) for gpu_id, _ in root_hashes]
+        return root_hashes, gpu_timings
+
+    script.torch = CpuTorch(torch, gpu_info["gpu_names"])
+    script.collect_gpu_info = lambda: gpu_info
+    script.benchmark_gpus = lambda: benchmark
+    script.get_proof_store_paths = lambda gpu_id: tuple(remap(path) for path in get_proof_store_paths(gpu_id))
+    script.save_proof_responses = sim_save_proof_responses
+    script.compute_gpus = sim_compute_gpus
+    script.run_agent()
+
+
+# ---------------------------------------------------------------------------
+# Simulated miners: allocation and SSH endpoint
+# ---------------------------------------------------------------------------
+
+class SimAxon:
+    def __init__(self, uid, hotkey):
+        self.uid = uid
+        self.hotkey = hotkey
+        self.ip = "127.0.0.1"
+        self.port = 8091 + uid
+        self.version = 1
+
+
+class SimMiner:
+    def __init__(self, uid, behavior, gpu_name, num_gpus, root):
+        self.uid = uid
+        self.hotkey = f"sim-miner-{uid:04d}"
+        self.username = f"miner{uid}"
+        self.axon = SimAxon(uid, self.hotkey)
+        self.behavior = behavior
+        self.gpu_name = gpu_name
+        self.num_gpus = num_gpus
+        self.root = root
+        self.password = None
+        self.allocated = False
+        os.makedirs(os.path.join(root, "tmp"), exist_ok=True)
+        os.makedirs(os.path.join(root, "dev", "shm"), exist_ok=True)
+
+    def gpu_info(self):
+        claimed = "NVIDIA H100 80GB HBM3" if self.behavior == CHEAT_GPU else self.gpu_name
+        return {"num_gpus": self.num_gpus, "gpu_names": [claimed] * self.num_gpus}
+
+    def benchmark(self, gpu_data, bench_time):
+        """Benchmark figures matching the theoretical TFLOPS and VRAM of the simulated GPU."""
+        result = {"num_gpus": self.num_gpus, "vram": gpu_data["GPU_AVRAM"][self.gpu_name]}
+        for precision, key in (("fp16", "GPU_TFLOPS_FP16"), ("fp32", "GPU_TFLOPS_FP32")):
+            flops = gpu_data[key][self.gpu_name] * 1e12
+            size = int(round((flops * bench_time / 2) ** (1 / 3)))
+            result[f"size_{precision}"] = size
+            result[f"time_{precision}"] = 2 * size ** 3 / flops
+        return result
+
+
+class SimDendritePool:
+    """In-process stand-in of compute.utils.dendrite.DendritePool answering Allocate for the simulated miners."""
+
+    def __init__(self, miners, ssh_port, latency=0.0, fail_rate=0.0):
+        self.miners = {miner.hotkey: miner for miner in miners}
+        self.ssh_port = ssh_port
+        self.latency = latency
+        self.fail_rate = fail_rate
+
+    async def _round_trip(self):
+        if self.latency > 0:
+            await asyncio.sleep(self.latency * random.uniform(0.5, 1.5))
+
+    async def check_allocation(self, axon, device_requirement, timeline=1, timeout=30):
+        await self._round_trip()
+        miner = self.miners[axon.hotkey]
+        if miner.allocated or miner.behavior == BUSY or random.random() < self.fail_rate:
+            return False
+        return True
+
+    async def allocate(self, axon, device_requirement, public_key, docker_requirement=None, timeline=1, timeout=30):
+        import RSAEncryption as rsa
+
+        await self._round_trip()
+        miner = self.miners[axon.hotkey]
+        miner.allocated = True
+        miner.password = secrets.token_hex(8)
+        info = json.dumps({"username": miner.username, "password": miner.password, "port": self.ssh_port})
+        return {"status": True, "info": base64.b64encode(rsa.encrypt_data(public_key.encode("utf-8"), info)).decode()}
+
+    async def deallocate(self, axon, public_key, max_retries=3, retry_delay=5, timeout=60):
+        await self._round_trip()
+        miner = self.miners[axon.hotkey]
+        miner.allocated = False
+        miner.password = None
+        return True
+
+    def close(self):
+        pass
+
+
+class SimSSHServer:
+    """asyncssh server on its own event loop thread, one chrooted home per simulated miner."""
+
+    def __init__(self, miners, gpu_data, bench_time, time_tolerance, ssh_latency=0.0, compute_delay=0.0, drop_rate=0.0):
+        self.miners = {miner.username: miner for miner in miners}
+        self.gpu_data = gpu_data
+        self.bench_time = bench_time
+        self.time_tolerance = time_tolerance
+        self.ssh_latency = ssh_latency
+        self.compute_delay = compute_delay
+        self.drop_rate = drop_rate
+        self.dropped = 0
+        self.loop = asyncio.new_event_loop()
+        self.port = None
+        self._server = None
+        self._thread = threading.Thread(target=self.loop.run_forever, name="th_sim_ssh", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        self.port = asyncio.run_coroutine_threadsafe(self._start(), self.loop).result()
+        return self.port
+
+    async def _start(self):
+        import asyncssh
+
+        harness = self
+
+        class Server(asyncssh.SSHServer):
+            def begin_auth(self, username):
+                return True
+
+            def password_auth_supported(self):
+                return True
+
+            def validate_password(self, username, password):
+                miner = harness.miners.get(username)
+                return bool(miner and miner.password and miner.behavior != SSH_FAIL and password == miner.password)
+
+        def sftp_factory(chan):
+            return asyncssh.SFTPServer(chan, chroot=self.miners[chan.get_extra_info("username")].root)
+
+        self._server = await asyncssh.create_server(
+            Server, "127.0.0.1", 0,
+            server_host_keys=[asyncssh.generate_private_key("ssh-ed25519")],
+            process_factory=self.handle_process,
+            sftp_factory=sftp_factory,
+        )
+        return self._server.sockets[0].getsockname()[1]
+
+    def agent_command(self, miner):
+        benchmark = miner.benchmark(self.gpu_data, self.bench_time)
+        compute_delay = self.compute_delay
+        if miner.behavior == SLOW:
+            # Slower than the benchmark allows for the compute step
+            compute_delay += self.time_tolerance + miner.num_gpus * benchmark["time_fp32"] + 1
+        return [
+            sys.executable, HARNESS_PATH, "agent",
+            "--script", os.path.join(miner.root, "tmp", "miner_script.py"),
+            "--root", miner.root,
+            "--behavior", miner.behavior,
+            "--gpu-info", json.dumps(miner.gpu_info()),
+            "--benchmark", json.dumps(benchmark),
+            "--compute-delay", str(compute_delay),
+        ]
+
+    async def handle_process(self, process):
+        miner = self.miners[process.get_extra_info("username")]
+        if self.ssh_latency > 0:
+            await asyncio.sleep(self.ssh_latency * random.uniform(0.5, 1.5))
+        command = process.command or ""
+        if "runpy" in command:
+            # Bootstrap: the script arrives base64 encoded on the first stdin line, then the agent serves the session
+            script = base64.b64decode(await process.stdin.readline())
+            with open(os.path.join(miner.root, "tmp", "miner_script.py"), "wb") as f:
+                f.write(script)
+            process.exit(await self.run_agent(process, miner))
+        elif "--mode agent" in command:
+            process.exit(await self.run_agent(process, miner))
+        else:
+            process.stderr.write(f"Unsupported command: {command}\n")
+            process.exit(1)
+
+    async def run_agent(self, process, miner):
+        proc = await asyncio.create_subprocess_exec(
+            *self.agent_command(miner),
+            stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+        )
+
+        async def pump_stdin():
+            stalled = False
+            try:
+                async for line in process.stdin:
+                    if miner.behavior == STALL and '"proof"' in line:
+                        stalled = True
+                    if stalled:
+                        continue
+                    if self.drop_rate and '"proof"' in line and random.random() < self.drop_rate:
+                        # Drop the SSH connection between compute and proof, the proof stores stay in /dev/shm
+                        self.dropped += 1
+                        proc.kill()
+                        process.channel.get_extra_info("connection").abort()
+                        break
+                    proc.stdin.write(line.encode())
+                    await proc.stdin.drain()
+            finally:
+                proc.stdin.close()
+
+        async def pump_output(source, sink):
+            while True:
+                data = await source.read(65536)
+                if not data:
+                    break
+                try:
+                    sink.write(data.decode(errors="replace"))
+                except OSError:
+                    # Connection dropped
+                    break
+
+        stdin_task = asyncio.create_task(pump_stdin())
+        try:
+            await asyncio.gather(pump_output(proc.stdout, process.stdout), pump_output(proc.stderr, process.stderr))
+            return await proc.wait()
+        finally:
+            stdin_task.cancel()
+            if proc.returncode is None:
+                proc.kill()
+
+    def close(self):
+        async def stop():
+            self._server.close()
+            await self._server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(stop(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=5)
+
+
+# ---------------------------------------------------------------------------
+# Validator side
+# ---------------------------------------------------------------------------
+
+def build_harness_validator(config_data, miners, dendrite_pool, incremental):
+    import RSAEncryption as rsa
+    from compute.utils.db import ComputeDb
+    from compute.utils.spawn import get_spawn_context
+    from neurons.Validator.pog_metrics import PogMetrics
+    from neurons.Validator.pog_scheduler import PogTestPlanner
+    from neurons.validator import Validator
+
+    class RecordingMetrics(PogMetrics):
+        """PogMetrics also keeping every sample, for exact percentiles."""
+
+        def __init__(self):
+            super().__init__(enabled=True)
+            self.samples = defaultdict(list)
+            self.outcomes = defaultdict(Counter)
+
+        def observe(self, phase, outcome, seconds, hotkey=None):
+            super().observe(phase, outcome, seconds, hotkey)
+            self.samples[phase].append(seconds)
+            self.outcomes[phase][outcome] += 1
+
+    class SimWandb:
+        def get_allocated_hotkeys(self, *args, **kwargs):
+            return []
+
+    class HarnessValidator(Validator):
+        """Validator carrying only the state used by proof_of_gpu, pointed at the simulated miners."""
+
+        def __init__(self):
+            merkle_proof = config_data["merkle_proof"]
+            self.config_data = config_data
+            self.executor = ThreadPoolExecutor(max_workers=merkle_proof["max_workers"])
+            self.verification_executor = None
+            if merkle_proof.get("verification_workers", 0) > 0:
+                self.verification_executor = ProcessPoolExecutor(
+                    max_workers=merkle_proof["verification_workers"], mp_context=get_spawn_context()
+                )
+            self.ssh_backend = merkle_proof.get("ssh_backend", "paramiko")
+            self.ssh_executor = ThreadPoolExecutor(max_workers=merkle_proof["max_workers"], thread_name_prefix="th_pog_ssh")
+            self.pog_loop = asyncio.new_event_loop()
+            threading.Thread(target=self.pog_loop.run_forever, name="th_pog_loop", daemon=True).start()
+            if incremental:
+                self.pog_planner = PogTestPlanner(
+                    refresh_interval=merkle_proof.get("pog_refresh_interval", 4320),
+                    max_refresh_interval=merkle_proof.get("pog_max_refresh_interval", 34560),
+                    round_budget=merkle_proof.get("pog_round_budget", 0),
+                )
+            else:
+                # Every miner is due every round
+                self.pog_planner = PogTestPlanner(refresh_interval=0, max_refresh_interval=0, round_budget=0)
+            self.pog_metrics = RecordingMetrics()
+            rsa.start_key_pair_pool(merkle_proof.get("rsa_key_pool_size", 32))
+            self.dendrite_pool = dendrite_pool
+            self.db = ComputeDb()
+            self.uids = [miner.uid for miner in miners]
+            self.sim_axons = {miner.uid: miner.axon for miner in miners}
+            self.validator_challenge_batch_size = 50
+            self.wandb = SimWandb()
+            self.results = {}
+            self.allocated_hotkeys = []
+            self.pog_checkpoints = {}
+            self.attempts = 0
+            self.resumed = 0
+
+        def get_queryable(self):
+            return dict(self.sim_axons)
+
+        def get_valid_validator_hotkeys(self):
+            return []
+
+        async def test_miner_gpu(self, axon, config_data):
+            self.attempts += 1
+            if axon.hotkey in self.pog_checkpoints:
+                self.resumed += 1
+            return await super().test_miner_gpu(axon, config_data)
+
+        def close(self):
+            self.pog_loop.call_soon_threadsafe(self.pog_loop.stop)
+            self.executor.shutdown(wait=False)
+            self.ssh_executor.shutdown(wait=False)
+            if self.verification_executor is not None:
+                self.verification_executor.shutdown(cancel_futures=True)
+            rsa.stop_key_pair_pool()
+            self.db.close()
+
+    return HarnessValidator()
+
+
+def percentiles(samples):
+    import numpy as np
+
+    if not samples:
+        return "-"
+    p50, p90, p99 = np.percentile(samples, [50, 90, 99])
+    return f"{p50:8.3f} {p90:8.3f} {p99:8.3f} {max(samples):8.3f}"
+
+
+def report_round(round_index, validator, miners, wall_time, attempts, dropped, resumed):
+    results = validator.results
+    print(f"\nRound {round_index}: {len(miners)} miners, {attempts} tests in {wall_time:.2f}s "
+          f"({attempts / wall_time:.2f} tests/s, {len(miners) / wall_time:.2f} miners/s)")
+    if dropped:
+        print(f"  {dropped} SSH sessions dropped before the proof, {resumed} tests resumed from a checkpoint")
+
+    # Expected outcome per behavior: only honest miners (and GPU liars, at their real GPU) are credited
+    verdicts = Counter()
+    for miner in miners:
+        result = results.get(miner.hotkey)
+        if miner.behavior == HONEST:
+            correct = result is not None and result["gpu_name"] == miner.gpu_name and result["num_gpus"] == miner.num_gpus
+        elif miner.behavior == CHEAT_GPU:
+            correct = result is None or result["gpu_name"] != "NVIDIA H100 80GB HBM3"
+        else:
+            correct = result is None
+        verdicts[(miner.behavior, correct)] += 1
+    for behavior in (HONEST,) + FAILURES + CHEATS:
+        total = verdicts[(behavior, True)] + verdicts[(behavior, False)]
+        if total:
+            print(f"  {behavior:<11} {verdicts[(behavior, True)]:>4}/{total:<4} handled as expected")
+
+
+def report_phases(metrics):
+    print(f"\n{'phase':<14} {'count':>6} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}  outcomes")
+    for phase, samples in sorted(metrics.samples.items()):
+        outcomes = ", ".join(f"{outcome}={count}" for outcome, count in sorted(metrics.outcomes[phase].items()))
+        print(f"{phase:<14} {len(samples):>6} {percentiles(samples)}  {outcomes}")
+
+
+def assign_behaviors(num_miners, fail_rate, cheat_rate, rng):
+    behaviors = []
+    for _ in range(num_miners):
+        draw = rng.random()
+        if draw < cheat_rate:
+            behaviors.append(rng.choice(CHEATS))
+        elif draw < cheat_rate + fail_rate:
+            behaviors.append(rng.choice(FAILURES))
+        else:
+            behaviors.append(HONEST)
+    return behaviors
+
+
+def run_loadtest(args):
+    sys.path[:0] = [ROOT_DIR, NEURONS_DIR]
+    from neurons.Validator.pog import load_yaml_config
+
+    rng = random.Random(args.seed)
+    config_data = copy.deepcopy(load_yaml_config(os.path.join(ROOT_DIR, "config.yaml")))
+    merkle_proof = config_data["merkle_proof"]
+    merkle_proof.update({
+        "miner_script_path": os.path.join(ROOT_DIR, merkle_proof["miner_script_path"]),
+        "max_random_delay": 0,
+        "max_workers": args.workers,
+        "pog_retry_limit": args.retry_limit,
+        "pog_retry_backoff_base": args.retry_base,
+        "pog_retry_interval": args.retry_max,
+        "ssh_backend": args.backend,
+        "verification_workers": args.verification_workers,
+        "agent_timeouts": {"proof": args.proof_timeout},
+        # Small matrices so the simulated miners can compute on CPU
+        "max_matrix_size": args.n,
+    })
+
+    gpu_data = config_data["gpu_performance"]
+    gpu_models = sorted(gpu_data["GPU_TFLOPS_FP16"])
+    work_dir = tempfile.mkdtemp(prefix="pog_loadtest_")
+    behaviors = assign_behaviors(args.miners, args.broken_rate, args.cheat_rate, rng)
+    miners = [
+        SimMiner(uid, behaviors[uid], rng.choice(gpu_models), rng.randint(1, args.max_gpus), os.path.join(work_dir, f"miner{uid}"))
+        for uid in range(args.miners)
+    ]
+    print(f"Simulating {args.miners} miners in {work_dir}: {dict(Counter(behaviors))}")
+
+    ssh_server = SimSSHServer(
+        miners, gpu_data, args.bench_time, merkle_proof.get("time_tolerance", 5),
+        ssh_latency=args.ssh_latency, compute_delay=args.compute_delay, drop_rate=args.drop_rate,
+    )
+    ssh_port = ssh_server.start()
+    dendrite_pool = SimDendritePool(miners, ssh_port, latency=args.latency, fail_rate=args.fail_rate)
+
+    # ComputeDb writes database.db to the working directory
+    os.chdir(work_dir)
+    validator = build_harness_validator(config_data, miners, dendrite_pool, args.incremental)
+
+    async def run_rounds():
+        for round_index in range(1, args.rounds + 1):
+            attempts_before = validator.attempts
+            dropped_before, resumed_before = ssh_server.dropped, validator.resumed
+            start_time = time.perf_counter()
+            await validator.proof_of_gpu()
+            wall_time = time.perf_counter() - start_time
+            report_round(
+                round_index, validator, miners, wall_time, validator.attempts - attempts_before,
+                ssh_server.dropped - dropped_before, validator.resumed - resumed_before,
+            )
+        report_phases(validator.pog_metrics)
+
+    try:
+        asyncio.run(run_rounds())
+    finally:
+        validator.close()
+        ssh_server.close()
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "agent":
+        parser = argparse.ArgumentParser(description="Simulated miner agent (started by the SSH endpoint).")
+        parser.add_argument("--script", required=True)
+        parser.add_argument("--root", required=True)
+        parser.add_argument("--behavior", default=HONEST)
+        parser.add_argument("--gpu-info", required=True)
+        parser.add_argument("--benchmark", required=True)
+        parser.add_argument("--compute-delay", type=float, default=0.0)
+        run_sim_agent(parser.parse_args(sys.argv[2:]))
+        return
+
+    parser = argparse.ArgumentParser(description="Load test Validator.proof_of_gpu against simulated miners.")
+    parser.add_argument("--miners", type=int, default=100, help="Number of simulated miners (e.g. 50-500).")
+    parser.add_argument("--rounds", type=int, default=1, help="Number of PoG rounds to run.")
+    parser.add_argument("--n", type=int, default=256, help="Matrix size computed by the simulated miners.")
+    parser.add_argument("--max-gpus", type=int, default=2, help="Maximum number of GPUs per simulated miner.")
+    parser.add_argument("--workers", type=int, default=32, help="merkle_proof.max_workers of the validator.")
+    parser.add_argument("--verification-workers", type=int, default=2, help="merkle_proof.verification_workers.")
+    parser.add_argument("--backend", default="asyncssh", choices=["asyncssh", "paramiko"], help="SSH transport.")
+    parser.add_argument("--incremental", action="store_true", help="Use the configured freshness scheduling instead of testing every miner each round.")
+    parser.add_argument("--latency", type=float, default=0.05, help="Mean latency of each Allocate round trip, seconds.")
+    parser.add_argument("--ssh-latency", type=float, default=0.0, help="Mean delay before each SSH command starts, seconds.")
+    parser.add_argument("--compute-delay", type=float, default=0.0, help="Extra compute time of every miner, seconds.")
+    parser.add_argument("--bench-time", type=float, default=2.0, help="Reported FP32 benchmark time, seconds.")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Probability of a transient allocation failure per attempt.")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Probability that an SSH session drops between compute and proof.")
+    parser.add_argument("--proof-timeout", type=float, default=5.0, help="Agent timeout of the proof command, seconds.")
+    parser.add_argument("--broken-rate", type=float, default=0.0, help="Share of miners failing every attempt (busy, SSH, crash, stall).")
+    parser.add_argument("--cheat-rate", type=float, default=0.0, help="Share of cheating miners (rows, root hash, GPU name, response size, slow).")
+    parser.add_argument("--retry-limit", type=int, default=3, help="merkle_proof.pog_retry_limit.")
+    parser.add_argument("--retry-base", type=float, default=1.0, help="merkle_proof.pog_retry_backoff_base, seconds.")
+    parser.add_argument("--retry-max", type=float, default=5.0, help="merkle_proof.pog_retry_interval, seconds.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the miner population.")
+    run_loadtest(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
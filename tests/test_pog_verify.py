@@ -0,0 +1,138 @@
+import importlib.util
+import os
+
+import numpy as np
+import pytest
+
+from neurons.Validator.pog_verify import (
+    check_gpu_response,
+    generate_prng_array,
+    generate_prng_col,
+    generate_prng_row,
+    verify_merkle_proofs_rows,
+)
+
+MINER_SCRIPT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "neurons", "Validator", "miner_script_m_merkletree.py")
+
+# Seeds where the signed int64 conversion or the 32-bit mask of the miner could diverge
+BOUNDARY_SEEDS = (0, 1, 0xFFFFFFFF, 2**32, 2**63 - 1, 2**63, 2**64 - 1, 123456789012345678)
+SIZES = (1, 2, 7, 32, 33, 127)
+
+# (s, i, j) -> float32 bit pattern of generate_matrix_torch(s, n)[i, j]
+KNOWN_VALUES = {
+    (0, 0, 0): 0x00000000,
+    (1, 2, 3): 0x3F395F02,
+    (0xFFFFFFFF, 0, 1): 0x00000000,
+    (2**32, 5, 7): 0x3F1B6D5D,
+    (2**63, 17, 4): 0x3F40205C,
+    (2**64 - 1, 1000, 33): 0x3F6F4C0F,
+    (123456789012345678, 4095, 4096): 0x3EC6C6AD,
+}
+
+
+def float32_bits(values):
+    return np.asarray(values, dtype=np.float32).view(np.uint32)
+
+
+@pytest.fixture(scope="module")
+def miner_script():
+    pytest.importorskip("torch")
+    spec = importlib.util.spec_from_file_location("miner_script", MINER_SCRIPT_PATH)
+    script = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(script)
+    return script
+
+
+@pytest.mark.parametrize("s, i, j", sorted(KNOWN_VALUES))
+def test_generate_prng_array_known_values(s, i, j):
+    assert int(float32_bits(generate_prng_array(s, i, j))) == KNOWN_VALUES[(s, i, j)]
+
+
+def test_generate_prng_array_known_matrix():
+    matrix = generate_prng_array(42, np.arange(4)[:, None], np.arange(4)[None, :])
+    assert matrix.dtype == np.float32
+    # The state only depends on s + i + j, so the matrix is constant along its anti-diagonals
+    assert float32_bits(matrix).tolist() == [
+        [1048474841, 1058163989, 1057407540, 1043089501],
+        [1058163989, 1057407540, 1043089501, 1062487947],
+        [1057407540, 1043089501, 1062487947, 1056124752],
+        [1043089501, 1062487947, 1056124752, 1058768299],
+    ]
+
+
+@pytest.mark.parametrize("n", SIZES)
+@pytest.mark.parametrize("s", BOUNDARY_SEEDS)
+def test_generate_prng_array_matches_miner(miner_script, s, n):
+    matrix = miner_script.generate_matrix_torch(s, n).cpu().numpy()
+    indices = np.arange(n, dtype=np.uint64)
+
+    np.testing.assert_array_equal(float32_bits(generate_prng_array(s, indices[:, None], indices[None, :])), float32_bits(matrix))
+    for k in {0, n // 2, n - 1}:
+        np.testing.assert_array_equal(float32_bits(generate_prng_row(s, k, n)), float32_bits(matrix[k, :]))
+        np.testing.assert_array_equal(float32_bits(generate_prng_col(s, k, n)), float32_bits(matrix[:, k]))
+
+
+@pytest.mark.parametrize("n", (7, 33))
+def test_generate_prng_array_matches_miner_tiled(miner_script, n):
+    for s in BOUNDARY_SEEDS:
+        # A scratch of three rows forces several tiles
+        tiled = miner_script.generate_matrix_torch_tiled(s, n, scratch_bytes=16 * n * 3).cpu().numpy()
+        indices = np.arange(n, dtype=np.uint64)
+        np.testing.assert_array_equal(float32_bits(generate_prng_array(s, indices[:, None], indices[None, :])), float32_bits(tiled))
+
+
+def build_proofs(miner_script, C, row_indices):
+    root_hash, tree = miner_script.build_merkle_tree_rows(C, min_chunk=2)
+    n = C.shape[0]
+    proofs = [miner_script.get_merkle_proof_row(tree, int(i), n) for i in row_indices]
+    return root_hash, proofs
+
+
+@pytest.mark.parametrize("n", (1, 2, 7, 16, 33))
+def test_verify_merkle_proofs_rows_accepts_miner_tree(miner_script, n):
+    C = np.random.default_rng(n).random((n, n), dtype=np.float32)
+    row_indices = np.array(sorted({0, n // 2, n - 1}))
+    root_hash, proofs = build_proofs(miner_script, C, row_indices)
+
+    assert verify_merkle_proofs_rows(C[row_indices], proofs, root_hash, row_indices, n).all()
+
+
+@pytest.mark.parametrize("n", (7, 33))
+def test_verify_merkle_proofs_rows_rejects_tampering(miner_script, n):
+    C = np.random.default_rng(n).random((n, n), dtype=np.float32)
+    row_indices = np.array([0, n // 2, n - 1])
+    root_hash, proofs = build_proofs(miner_script, C, row_indices)
+    rows = C[row_indices]
+
+    tampered_rows = rows.copy()
+    tampered_rows[1, 0] += 1.0
+    assert verify_merkle_proofs_rows(tampered_rows, proofs, root_hash, row_indices, n).tolist() == [True, False, True]
+
+    tampered_proofs = [list(proof) for proof in proofs]
+    tampered_proofs[2][-1] = bytes(32)
+    assert verify_merkle_proofs_rows(rows, tampered_proofs, root_hash, row_indices, n).tolist() == [True, True, False]
+
+    # The row and its proof are genuine but claimed for the neighbouring position
+    wrong_indices = row_indices.copy()
+    wrong_indices[0] = 1
+    assert verify_merkle_proofs_rows(rows, proofs, root_hash, wrong_indices, n).tolist() == [False, True, True]
+
+
+def test_check_gpu_response_end_to_end(miner_script):
+    n, s_A, s_B = 33, 2**63 + 5, 12345
+    C = (miner_script.generate_matrix_torch(s_A, n) @ miner_script.generate_matrix_torch(s_B, n)).cpu().numpy()
+    challenge = [(0, 3), (16, 32), (32, 0)]
+    row_indices = np.array([i for i, _ in challenge])
+    root_hash, proofs = build_proofs(miner_script, C, row_indices)
+    response = {"rows": C[row_indices], "proofs": proofs}
+
+    assert check_gpu_response(s_A, s_B, root_hash.hex(), response, challenge, n) is None
+
+    forged = dict(response, rows=response["rows"].copy())
+    forged["rows"][1, 32] += 1.0
+    assert check_gpu_response(s_A, s_B, root_hash.hex(), forged, challenge, n) == "Value mismatch at index (16, 32)."
+
+    # A row that is not the challenged one fails its Merkle proof even with the right C_ij
+    swapped = dict(response, rows=response["rows"].copy())
+    swapped["rows"][2, 1:] = C[31, 1:]
+    assert check_gpu_response(s_A, s_B, root_hash.hex(), swapped, challenge, n) == "Invalid Merkle proof at index (32)."